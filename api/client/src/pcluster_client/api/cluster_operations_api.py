@@ -691,7 +691,7 @@ class ClusterOperationsApi(object):
 
 
         Keyword Args:
-            region (str): List clusters deployed to a given AWS Region.. [optional]
+            region (str): List clusters deployed to a given AWS Region, or to a comma separated list of AWS Regions.. [optional]
             next_token (str): Token to use for paginated requests.. [optional]
             cluster_status ([ClusterStatusFilteringOption]): Filter by cluster status. (Defaults to all clusters.). [optional]
             _return_http_data_only (bool): response data without head status
@@ -659,7 +659,7 @@ class ImageOperationsApi(object):
             image_status (ImageStatusFilteringOption): Filter images by the status provided.
 
         Keyword Args:
-            region (str): List images built in a given AWS Region.. [optional]
+            region (str): List images built in a given AWS Region, or in a comma separated list of AWS Regions.. [optional]
             next_token (str): Token to use for paginated requests.. [optional]
             _return_http_data_only (bool): response data without head status
                 code and headers. Default is True.
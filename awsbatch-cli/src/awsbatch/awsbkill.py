@@ -11,12 +11,20 @@
 # See the License for the specific language governing permissions and limitations under the License.
 
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 import argparse
 
-from awsbatch.common import AWSBatchCliConfig, Boto3ClientFactory, config_logger
+from awsbatch.common import AWSBatchCliConfig, Boto3ClientFactory, chunked_describe_jobs, config_logger
 from awsbatch.utils import fail
 
+KILLABLE_JOB_STATUS = ["SUBMITTED", "PENDING", "RUNNABLE", "STARTING", "RUNNING"]
+# Maximum number of terminate_job calls executed concurrently
+TERMINATE_JOBS_MAX_WORKERS = 10
+# Throttling-aware retries, with client side rate limiting shared by all the workers
+TERMINATE_JOBS_RETRIES = {"mode": "adaptive", "max_attempts": 10}
+
 
 def _get_parser():
     """
@@ -41,8 +49,14 @@ def _get_parser():
         help="A message to attach to the job that explains the reason for canceling it",
         default="Terminated by the user",
     )
+    parser.add_argument(
+        "-s",
+        "--status",
+        help="Comma separated list of job status. All the jobs in the cluster's Job Queue with the given status "
+        "are canceled/terminated. Accepted values are: SUBMITTED, PENDING, RUNNABLE, STARTING, RUNNING, ALL",
+    )
     parser.add_argument("-ll", "--log-level", help=argparse.SUPPRESS, default="ERROR")
-    parser.add_argument("job_ids", help="A space separated list of job IDs to cancel/terminate", nargs="+")
+    parser.add_argument("job_ids", help="A space separated list of job IDs to cancel/terminate", nargs="*")
     return parser
 
 
@@ -58,64 +72,151 @@ class AWSBkillCommand:
         """
         self.log = log
         self.boto3_factory = boto3_factory
-        self.batch_client = boto3_factory.get_client("batch")
+        self.batch_client = boto3_factory.get_client("batch", retries=TERMINATE_JOBS_RETRIES)
 
-    def run(self, job_ids, reason):
+    def run(self, reason, job_ids=None, job_queue=None, job_status=None):
         """
-        Kill/cancel the jobs.
+        Kill/cancel the jobs, given by ids or by queue and status.
 
-        :param job_ids: list of job ids
         :param reason: optional reason
+        :param job_ids: list of job ids
+        :param job_queue: job queue name or ARN, to kill the jobs with the given status
+        :param job_status: list of job status to kill
         """
-        jobs = self.batch_client.describe_jobs(jobs=job_ids)["jobs"]
-        self.log.debug(jobs)
+        if job_ids:
+            jobs = self.__describe_jobs(job_ids)
+        elif job_queue and job_status:
+            jobs = self.__list_jobs(job_queue, job_status)
+        else:
+            fail("Error killing jobs. job_ids or job_status must be defined")
+
+        killed_jobs, skipped_jobs, failed_jobs = self.__kill_jobs(jobs, reason)  # pylint: disable=E0606
+        print(
+            "Submitted the cancellation/termination of %d jobs, %d jobs already completed, %d jobs failed."
+            % (killed_jobs, skipped_jobs, failed_jobs)
+        )
+        if failed_jobs:
+            sys.exit(1)
+
+    def __describe_jobs(self, job_ids):
+        """
+        Describe the given jobs, reporting the ones not found.
+
+        :param job_ids: list of job ids
+        :return: list of described jobs
+        """
+        job_ids = list(OrderedDict.fromkeys(job_ids))
+        jobs = []
+        for jobs_chunk in chunked_describe_jobs(self.batch_client, job_ids):
+            self.log.debug(jobs_chunk)
+            jobs.extend(jobs_chunk)
 
         if len(jobs) != len(job_ids):
-            available_job_ids = []
-            for job in jobs:
-                available_job_ids.append(job["jobId"])
+            available_job_ids = {job["jobId"] for job in jobs}
             for job_id in job_ids:
                 if job_id not in available_job_ids:
                     print("Job (%s) not found." % job_id)
-        self.__kill_jobs(jobs, reason)
+        return jobs
+
+    def __list_jobs(self, job_queue, job_status):
+        """
+        List the jobs of the given queue with the given status.
+
+        :param job_queue: job queue name or ARN
+        :param job_status: list of job status
+        :return: list of job summaries, containing jobId and status
+        """
+        jobs = []
+        for status in job_status:
+            next_page = ""
+            while next_page is not None:
+                response = self.batch_client.list_jobs(jobStatus=status, jobQueue=job_queue, nextToken=next_page)
+                jobs.extend(response["jobSummaryList"])
+                next_page = response.get("nextToken")
+        self.log.debug(jobs)
+        return jobs
 
     def __kill_jobs(self, jobs, reason):
         """
-        Kill given jobs.
+        Kill given jobs, with concurrent terminate_job calls.
 
-        :param jobs: a list of jobs ids
+        :param jobs: a list of jobs, containing jobId and status
         :param reason: reason for canceling the job
+        :return: a triplet with the number of killed, skipped and failed jobs
         """
+        jobs_to_kill = []
         for job in jobs:
-            status = job["status"]
-            job_id = job["jobId"]
-            if status in ["FAILED", "SUCCEEDED"]:
-                print("Job (%s) is already in (%s) status." % (job_id, status))
+            if job["status"] in ["FAILED", "SUCCEEDED"]:
+                print("Job (%s) is already in (%s) status." % (job["jobId"], job["status"]))
             else:
-                try:
-                    self.batch_client.terminate_job(jobId=job_id, reason=reason)
-                    if status in ["SUBMITTED", "PENDING", "RUNNABLE"]:
-                        action = "cancellation"
+                jobs_to_kill.append(job)
+
+        failed_jobs = 0
+        if jobs_to_kill:
+            with ThreadPoolExecutor(max_workers=TERMINATE_JOBS_MAX_WORKERS) as executor:
+                # results are printed by the main thread, in the order of the given jobs
+                for job, error in zip(
+                    jobs_to_kill, executor.map(lambda job: self.__kill_job(job["jobId"], reason), jobs_to_kill)
+                ):
+                    job_id = job["jobId"]
+                    status = job["status"]
+                    if error:
+                        failed_jobs += 1
+                        print("Error killing job (%s). Failed with exception: %s" % (job_id, error))
                     else:
-                        # status == 'STARTING' or status == 'RUNNING'
-                        action = "termination"
-                    print(
-                        "Your job %s request for job (%s) in status (%s) has been submitted." % (action, job_id, status)
-                    )
-                except Exception as e:
-                    print("Error killing job (%s). Failed with exception: %s" % e)
+                        if status in ["SUBMITTED", "PENDING", "RUNNABLE"]:
+                            action = "cancellation"
+                        else:
+                            # status == 'STARTING' or status == 'RUNNING'
+                            action = "termination"
+                        print(
+                            "Your job %s request for job (%s) in status (%s) has been submitted."
+                            % (action, job_id, status)
+                        )
+
+        return len(jobs_to_kill) - failed_jobs, len(jobs) - len(jobs_to_kill), failed_jobs
+
+    def __kill_job(self, job_id, reason):
+        """
+        Kill the given job.
 
+        :param job_id: job id
+        :param reason: reason for canceling the job
+        :return: the exception raised by terminate_job, None if the request succeeded
+        """
+        try:
+            self.batch_client.terminate_job(jobId=job_id, reason=reason)
+            return None
+        except Exception as e:
+            self.log.error("Error killing job (%s). Failed with exception: %s" % (job_id, e))
+            return e
 
-def main():
+
+def main(argv=None):
     """Command entrypoint."""
     try:
         # parse input parameters and config file
-        args = _get_parser().parse_args()
+        args = _get_parser().parse_args(argv)
         log = config_logger(args.log_level)
         log.info("Input parameters: %s", args)
+        if bool(args.job_ids) == bool(args.status):
+            fail("Error: either job_ids or --status parameter is required")
         config = AWSBatchCliConfig(log=log, cluster=args.cluster)
         boto3_factory = Boto3ClientFactory(region=config.region, proxy=config.proxy)
-        AWSBkillCommand(log, boto3_factory).run(job_ids=args.job_ids, reason=args.reason)
+
+        job_status = None
+        if args.status:
+            job_status_set = OrderedDict((status.strip().upper(), "") for status in args.status.split(","))
+            if "ALL" in job_status_set:
+                job_status_set = OrderedDict((status, "") for status in KILLABLE_JOB_STATUS)
+            job_status = list(job_status_set)
+            for status in job_status:
+                if status not in KILLABLE_JOB_STATUS:
+                    fail("Error: invalid job status (%s)" % status)
+
+        AWSBkillCommand(log, boto3_factory).run(
+            reason=args.reason, job_ids=args.job_ids, job_queue=config.job_queue, job_status=job_status
+        )
 
     except KeyboardInterrupt:
         print("Exiting...")
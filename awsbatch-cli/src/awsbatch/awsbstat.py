@@ -17,7 +17,7 @@ from collections import OrderedDict
 
 import argparse
 
-from awsbatch.common import AWSBatchCliConfig, Boto3ClientFactory, Output, config_logger
+from awsbatch.common import AWSBatchCliConfig, Boto3ClientFactory, Output, chunked_describe_jobs, config_logger
 from awsbatch.utils import (
     convert_to_date,
     fail,
@@ -29,6 +29,7 @@ from awsbatch.utils import (
 )
 
 AWS_BATCH_JOB_STATUS = ["SUBMITTED", "PENDING", "RUNNABLE", "STARTING", "RUNNING", "SUCCEEDED", "FAILED"]
+TABLE_KEYS = ["jobId", "jobName", "status", "startedAt", "stoppedAt", "exitCode"]
 
 
 def _get_parser():
@@ -59,7 +60,14 @@ def _get_parser():
     parser.add_argument(
         "-e", "--expand-children", help="Expand jobs with children (array and MNP)", action="store_true"
     )
-    parser.add_argument("-d", "--details", help="Show jobs details", action="store_true")
+    output_group = parser.add_mutually_exclusive_group()
+    output_group.add_argument("-d", "--details", help="Show jobs details", action="store_true")
+    output_group.add_argument(
+        "--stream",
+        help="Print the jobs as tab separated rows as soon as they are retrieved, instead of a sorted table. "
+        "Useful to show array jobs with many children",
+        action="store_true",
+    )
     parser.add_argument("-ll", "--log-level", help=argparse.SUPPRESS, default="ERROR")
     parser.add_argument(
         "job_ids",
@@ -281,11 +289,18 @@ class AWSBstatCommand:
         self.output = Output(mapping=mapping)
         self.boto3_factory = boto3_factory
         self.batch_client = boto3_factory.get_client("batch")
+        self.stream = False
 
     def run(
-        self, job_status, expand_children, job_queue=None, job_ids=None, show_details=False
+        self, job_status, expand_children, job_queue=None, job_ids=None, show_details=False, stream=False
     ):  # pylint: disable=too-many-positional-arguments
         """Print list of jobs, by filtering by queue or by ids."""
+        if stream:
+            # jobs are printed by __add_jobs as soon as they are retrieved
+            self.stream = True
+            self.output.show_table_header(keys=TABLE_KEYS)
+            show_details = False
+
         if job_ids:
             self.__populate_output_by_job_ids(job_ids, show_details or len(job_ids) == 1, include_parents=True)
             # explicitly asking for job details,
@@ -297,14 +312,14 @@ class AWSBstatCommand:
         else:
             fail("Error listing jobs from AWS Batch. job_ids or job_queue must be defined")
 
+        if self.stream:
+            return
+
         sort_keys_function = self.__sort_by_status_startedat_jobid() if not job_ids else self.__sort_by_key(job_ids)
         if details_required:  # pylint: disable=E0606
             self.output.show(sort_keys_function=sort_keys_function)
         else:
-            self.output.show_table(
-                keys=["jobId", "jobName", "status", "startedAt", "stoppedAt", "exitCode"],
-                sort_keys_function=sort_keys_function,
-            )
+            self.output.show_table(keys=TABLE_KEYS, sort_keys_function=sort_keys_function)
 
     @staticmethod
     def __sort_by_key(ordered_keys):  # noqa: D202
@@ -361,20 +376,20 @@ class AWSBstatCommand:
         try:
             if job_ids:
                 self.log.info("Describing jobs (%s), details (%s)" % (job_ids, details))
-                parent_jobs = []
                 jobs_with_children = []
-                jobs = self.__chunked_describe_jobs(job_ids)
-                for job in jobs:
-                    # always add parent job
-                    if include_parents or get_job_type(job) == "SIMPLE":
-                        parent_jobs.append(job)
-                    if is_job_array(job):
-                        jobs_with_children.append((job["jobId"], ":", job["arrayProperties"]["size"]))
-                    elif is_mnp_job(job):
-                        jobs_with_children.append((job["jobId"], "#", job["nodeProperties"]["numNodes"]))
-
-                # add parent jobs to the output
-                self.__add_jobs(parent_jobs)
+                for jobs in chunked_describe_jobs(self.batch_client, job_ids):
+                    parent_jobs = []
+                    for job in jobs:
+                        # always add parent job
+                        if include_parents or get_job_type(job) == "SIMPLE":
+                            parent_jobs.append(job)
+                        if is_job_array(job):
+                            jobs_with_children.append((job["jobId"], ":", job["arrayProperties"]["size"]))
+                        elif is_mnp_job(job):
+                            jobs_with_children.append((job["jobId"], "#", job["nodeProperties"]["numNodes"]))
+
+                    # add parent jobs to the output
+                    self.__add_jobs(parent_jobs)
 
                 # create output items for jobs' children
                 self.__populate_output_by_parent_ids(jobs_with_children)
@@ -397,31 +412,12 @@ class AWSBstatCommand:
                     ]
                 )
 
-            if expanded_job_ids:
-                jobs = self.__chunked_describe_jobs(expanded_job_ids)
-
-                # forcing details to be False since already retrieved.
+            # children are added chunk by chunk, forcing details to be False since already retrieved.
+            for jobs in chunked_describe_jobs(self.batch_client, expanded_job_ids):
                 self.__add_jobs(jobs)
         except Exception as e:
             fail("Error listing job children. Failed with exception: %s" % e)
 
-    def __chunked_describe_jobs(self, job_ids):
-        """
-        Submit calls to describe_jobs in batches of 100 elements each.
-
-        describe_jobs API call has a hard limit on the number of job that can be
-        retrieved with a single call. In case job_ids has more than 100 items, this function
-        distributes the describe_jobs call across multiple requests.
-
-        :param job_ids: list of ids for the jobs to describe.
-        :return: list of described jobs.
-        """
-        jobs = []
-        for index in range(0, len(job_ids), 100):
-            jobs_chunk = job_ids[index : index + 100]  # noqa: E203
-            jobs.extend(self.batch_client.describe_jobs(jobs=jobs_chunk)["jobs"])
-        return jobs
-
     def __add_jobs(self, jobs, details=False):
         """
         Get job info from AWS Batch and add to the output.
@@ -434,16 +430,26 @@ class AWSBstatCommand:
                 self.log.debug("Adding jobs to the output (%s)" % jobs)
                 if details:
                     self.log.info("Asking for jobs details")
-                    jobs_to_show = self.__chunked_describe_jobs([job["jobId"] for job in jobs])
+                    jobs_to_show = [
+                        job
+                        for jobs_chunk in chunked_describe_jobs(self.batch_client, [job["jobId"] for job in jobs])
+                        for job in jobs_chunk
+                    ]
                 else:
                     jobs_to_show = jobs
 
+                items = []
                 for job in jobs_to_show:
                     self.log.debug("Adding job to the output (%s)", job)
 
                     job_converter = self.__JOB_CONVERTERS[get_job_type(job)]
 
-                    self.output.add(job_converter.convert(job))
+                    items.append(job_converter.convert(job))
+
+                if self.stream:
+                    self.output.show_table_rows(items, keys=TABLE_KEYS)
+                else:
+                    self.output.add(items)
         except KeyError as e:
             fail("Error building Job item. Key (%s) not found." % e)
         except Exception as e:
@@ -505,6 +511,7 @@ def main(argv=None):
             job_ids=args.job_ids,
             job_queue=config.job_queue,
             show_details=args.details,
+            stream=args.stream,
         )
 
     except KeyboardInterrupt:
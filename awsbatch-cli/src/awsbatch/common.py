@@ -15,7 +15,9 @@ import logging
 import operator
 import os
 import re
+import sys
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from logging.handlers import RotatingFileHandler
 
 import boto3
@@ -27,6 +29,11 @@ from tabulate import tabulate
 
 from awsbatch.utils import fail, get_installed_version, get_region_by_stack_id
 
+# Maximum number of jobs accepted by a single describe_jobs call
+DESCRIBE_JOBS_CHUNK_SIZE = 100
+# Maximum number of describe_jobs calls executed concurrently
+DESCRIBE_JOBS_MAX_WORKERS = 8
+
 
 class Output:
     """Generic Output object."""
@@ -68,6 +75,26 @@ class Output:
             rows.append(row)
         print(tabulate(rows, output_keys))
 
+    def show_table_header(self, keys=None):
+        """
+        Print the header of a tab separated table, to be followed by show_table_rows calls.
+
+        :param keys: show a specific list of keys (optional)
+        """
+        print("\t".join(keys or self.keys), flush=True)
+
+    def show_table_rows(self, items, keys=None):
+        """
+        Print the given items as tab separated rows, without storing them.
+
+        :param items: list of items
+        :param keys: show a specific list of keys (optional)
+        """
+        output_keys = keys or self.keys
+        for item in items:
+            print("\t".join(str(getattr(item, self.mapping[output_key])) for output_key in output_keys))
+        sys.stdout.flush()
+
     def show(self, keys=None, sort_keys_function=None):
         """
         Print the items in a key value format.
@@ -104,19 +131,56 @@ class Boto3ClientFactory:
         if proxy != "NONE":
             self.proxy_config = Config(proxies={"https": proxy})
 
-    def get_client(self, service):
+    def get_client(self, service, retries=None):
         """
         Initialize the boto3 client for a given service.
 
         :param service: boto3 service.
+        :param retries: botocore retry configuration, e.g. {"mode": "adaptive", "max_attempts": 10} (optional)
         :return: the boto3 client
         """
+        config = self.proxy_config
+        if retries:
+            config = config.merge(Config(retries=retries))
         try:
-            return boto3.client(service, region_name=self.region, config=self.proxy_config)
+            return boto3.client(service, region_name=self.region, config=config)
         except ClientError as e:
             fail("AWS %s service failed with exception: %s" % (service, e))
 
 
+def chunked_describe_jobs(batch_client, job_ids, max_workers=DESCRIBE_JOBS_MAX_WORKERS):
+    """
+    Describe the given jobs with concurrent describe_jobs calls of DESCRIBE_JOBS_CHUNK_SIZE elements each.
+
+    describe_jobs API call has a hard limit on the number of jobs that can be retrieved with a single call,
+    so the job ids are split in chunks that are described by a pool of max_workers threads.
+
+    :param batch_client: the boto3 client for AWS Batch
+    :param job_ids: list of ids for the jobs to describe
+    :param max_workers: maximum number of concurrent describe_jobs calls
+    :return: a generator yielding the list of described jobs of every chunk, in the order of the job ids,
+    as soon as the chunk and all the previous ones have been described.
+    """
+    chunks = [
+        job_ids[index : index + DESCRIBE_JOBS_CHUNK_SIZE]  # noqa: E203
+        for index in range(0, len(job_ids), DESCRIBE_JOBS_CHUNK_SIZE)
+    ]
+    if len(chunks) <= 1 or max_workers <= 1:
+        for chunk in chunks:
+            yield batch_client.describe_jobs(jobs=chunk)["jobs"]
+        return
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        futures = [executor.submit(batch_client.describe_jobs, jobs=chunk) for chunk in chunks]
+        try:
+            for future in futures:
+                yield future.result()["jobs"]
+        finally:
+            # Do not wait for the pending chunks if the consumer stopped early or a call failed
+            for future in futures:
+                future.cancel()
+
+
 CliRequirement = namedtuple("Requirement", "package operator version")
 
 
@@ -0,0 +1,84 @@
+import pytest
+from botocore.exceptions import ClientError
+
+from awsbatch import awsbkill
+from tests.conftest import DEFAULT_AWSBATCHCLICONFIG_MOCK_CONFIG
+
+
+class TestArgs:
+    @pytest.mark.parametrize("argv", [[], ["-s", "RUNNING", "job-id"]])
+    def test_job_ids_or_status_required(self, failed_with_message, argv):
+        failed_with_message(awsbkill.main, "Error: either job_ids or --status parameter is required\n", argv=argv)
+
+
+@pytest.fixture()
+def batch_client(mocker):
+    return mocker.patch("awsbatch.common.boto3", autospec=True).client.return_value
+
+
+@pytest.mark.usefixtures("awsbatchcliconfig_mock")
+class TestKill:
+    def test_kill_by_ids(self, batch_client, capsys):
+        job_ids = ["job-{0}".format(index) for index in range(250)]
+        completed_job_id = "job-3"
+        failing_job_id = "job-7"
+
+        def _describe_jobs(jobs):
+            return {
+                "jobs": [
+                    {"jobId": job_id, "status": "SUCCEEDED" if job_id == completed_job_id else "RUNNING"}
+                    for job_id in jobs
+                    if job_id != "missing-job"
+                ]
+            }
+
+        def _terminate_job(jobId, reason):  # noqa: N803
+            if jobId == failing_job_id:
+                raise ClientError({"Error": {"Code": "ClientException", "Message": "error"}}, "TerminateJob")
+
+        batch_client.describe_jobs.side_effect = _describe_jobs
+        batch_client.terminate_job.side_effect = _terminate_job
+
+        with pytest.raises(SystemExit) as error:
+            awsbkill.main(["-c", "cluster"] + job_ids + ["missing-job", "job-0"])
+        assert error.value.code == 1
+
+        # job ids are deduplicated and described in chunks of 100 elements
+        requested_chunks = [call.kwargs["jobs"] for call in batch_client.describe_jobs.call_args_list]
+        assert sorted(len(chunk) for chunk in requested_chunks) == [51, 100, 100]
+        assert batch_client.terminate_job.call_count == 249
+
+        output = capsys.readouterr().out.splitlines()
+        assert "Job (missing-job) not found." in output
+        assert "Job (job-3) is already in (SUCCEEDED) status." in output
+        assert any(line.startswith("Error killing job (job-7). Failed with exception: ") for line in output)
+        assert output[-1] == (
+            "Submitted the cancellation/termination of 248 jobs, 1 jobs already completed, 1 jobs failed."
+        )
+
+    def test_kill_by_status(self, batch_client, capsys):
+        list_jobs_responses = {
+            ("RUNNABLE", ""): {"jobSummaryList": [{"jobId": "job-1", "status": "RUNNABLE"}], "nextToken": "token"},
+            ("RUNNABLE", "token"): {"jobSummaryList": [{"jobId": "job-2", "status": "RUNNABLE"}]},
+            ("RUNNING", ""): {"jobSummaryList": [{"jobId": "job-3", "status": "RUNNING"}]},
+        }
+        batch_client.list_jobs.side_effect = lambda jobStatus, jobQueue, nextToken: list_jobs_responses[
+            (jobStatus, nextToken)
+        ]
+
+        awsbkill.main(["-c", "cluster", "-s", "runnable,RUNNING", "-r", "runaway"])
+
+        for call in batch_client.list_jobs.call_args_list:
+            assert call.kwargs["jobQueue"] == DEFAULT_AWSBATCHCLICONFIG_MOCK_CONFIG["job_queue"]
+        batch_client.describe_jobs.assert_not_called()
+        assert sorted(call.kwargs["jobId"] for call in batch_client.terminate_job.call_args_list) == [
+            "job-1",
+            "job-2",
+            "job-3",
+        ]
+        assert capsys.readouterr().out.splitlines() == [
+            "Your job cancellation request for job (job-1) in status (RUNNABLE) has been submitted.",
+            "Your job cancellation request for job (job-2) in status (RUNNABLE) has been submitted.",
+            "Your job termination request for job (job-3) in status (RUNNING) has been submitted.",
+            "Submitted the cancellation/termination of 3 jobs, 0 jobs already completed, 0 jobs failed.",
+        ]
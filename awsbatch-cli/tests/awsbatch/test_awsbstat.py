@@ -446,3 +446,37 @@ class TestOutput:
         awsbstat.main(["-c", "cluster"] + args)
 
         assert capsys.readouterr().out == read_text(test_datadir / expected)
+
+
+@pytest.mark.usefixtures("awsbatchcliconfig_mock")
+@pytest.mark.usefixtures("convert_to_date_mock")
+def test_stream_expanded_array_job(mocker, capsys):
+    array_job_id = "3286a19c-68a9-47c9-8000-427d23ffc7ca"
+    array_size = 250
+
+    def _describe_jobs(jobs):
+        described_jobs = []
+        for job_id in jobs:
+            job = {"jobId": job_id, "jobName": "job", "createdAt": 0, "status": "RUNNING"}
+            if job_id == array_job_id:
+                job["arrayProperties"] = {"size": array_size}
+            described_jobs.append(job)
+        return {"jobs": described_jobs}
+
+    batch_client = mocker.patch("awsbatch.common.boto3", autospec=True).client.return_value
+    batch_client.describe_jobs.side_effect = _describe_jobs
+
+    awsbstat.main(["-c", "cluster", "--stream", array_job_id])
+
+    # the parent job is described first, then the children in chunks of 100 jobs each
+    requested_chunks = [call.kwargs["jobs"] for call in batch_client.describe_jobs.call_args_list]
+    assert requested_chunks[0] == [array_job_id]
+    assert sorted(len(chunk) for chunk in requested_chunks[1:]) == [50, 100, 100]
+
+    rows = capsys.readouterr().out.splitlines()
+    assert rows[0] == "jobId\tjobName\tstatus\tstartedAt\tstoppedAt\texitCode"
+    assert rows[1] == "{0} [{1}]\tjob\tRUNNING\t-\t-\t-".format(array_job_id, array_size)
+    # children are printed in the order of their index
+    assert [row.split("\t")[0] for row in rows[2:]] == [
+        "{0}:{1}".format(array_job_id, index) for index in range(array_size)
+    ]
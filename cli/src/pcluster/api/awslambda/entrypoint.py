@@ -18,6 +18,7 @@ from aws_xray_sdk.ext.flask.middleware import XRayMiddleware
 
 from pcluster.api.awslambda.serverless_wsgi import handle_request
 from pcluster.api.flask_app import ParallelClusterFlaskApp
+from pcluster.aws.common import Cache
 
 logger = Logger(service="pcluster", location="%(filename)s:%(lineno)s:%(funcName)s()")
 tracer = Tracer(service="pcluster")
@@ -53,7 +54,10 @@ def lambda_handler(event: Dict[str, Any], context: LambdaContext) -> Dict[str, A
                 XRayMiddleware(pcluster_api.flask_app, xray_recorder)
         # Setting default region to region where lambda function is executed
         environ["AWS_DEFAULT_REGION"] = environ["AWS_REGION"]
-        return handle_request(pcluster_api.app, event, context)
+        response = handle_request(pcluster_api.app, event, context)
+        # Counters are cumulative for the lifetime of the warm Lambda execution environment
+        logger.info("Cache stats", extra={"cache_stats": Cache.get_stats()})
+        return response
     except Exception as e:
         logger.critical("Unexpected exception: %s", e, exc_info=True)
         raise Exception("Unexpected fatal exception. Please look at API logs for details on the encountered failure.")
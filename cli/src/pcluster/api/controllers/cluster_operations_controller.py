@@ -7,6 +7,7 @@
 # limitations under the License.
 
 # pylint: disable=W0613
+import functools
 import logging
 import os
 from typing import Dict, List
@@ -16,8 +17,10 @@ from pcluster.api.controllers.common import (
     configure_aws_region,
     configure_aws_region_from_config,
     convert_errors,
+    get_regions,
     get_validator_suppressors,
     http_success_status_code,
+    list_in_regions,
     validate_cluster,
 )
 from pcluster.api.converters import (
@@ -58,9 +61,10 @@ from pcluster.api.models import (
 )
 from pcluster.api.util import assert_valid_node_js
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import StackNotFoundError
+from pcluster.aws.common import StackNotFoundError, get_region
 from pcluster.config.config_patch import ConfigPatch
 from pcluster.config.update_policy import UpdatePolicy
+from pcluster.constants import DESCRIBE_CLUSTER_TIMEOUT_DEFAULT
 from pcluster.models.cluster import (
     Cluster,
     ClusterActionError,
@@ -69,8 +73,9 @@ from pcluster.models.cluster import (
     NotFoundClusterActionError,
 )
 from pcluster.models.cluster_resources import ClusterStack
+from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus
 from pcluster.models.login_nodes_status import LoginNodesPoolState
-from pcluster.utils import get_installed_version, to_utc_datetime
+from pcluster.utils import execute_concurrently, get_installed_version, to_utc_datetime
 from pcluster.validators.common import FailureLevel
 
 LOGGER = logging.getLogger(__name__)
@@ -215,17 +220,27 @@ def describe_cluster(cluster_name, region=None):
     cluster = Cluster(cluster_name)
     validate_cluster(cluster)
     cfn_stack = cluster.stack
+    cluster_status = cloud_formation_status_to_cluster_status(cfn_stack.status)
 
-    fleet_status = cluster.compute_fleet_status
+    # The following lookups only depend on the stack, hence they are executed concurrently.
+    # The ones exceeding the timeout are omitted from the response.
+    futures = execute_concurrently(
+        {
+            "compute fleet status": lambda: cluster.compute_fleet_status,
+            "configuration url": lambda: cluster.config_presigned_url,
+            "creation failures": lambda: _get_creation_failures(cluster_status, cfn_stack),
+            "head node": lambda: cluster.head_node_instance,
+            "login nodes": lambda: _get_login_nodes(cluster),
+        },
+        timeout=_get_describe_cluster_timeout(),
+    )
 
-    config_url = "NOT_AVAILABLE"
-    try:
-        config_url = cluster.config_presigned_url
-    except ClusterActionError as e:
-        # Do not fail request when S3 bucket is not available
-        LOGGER.error(e)
+    fleet_status = _get_lookup_result(futures, "compute fleet status", default=ComputeFleetStatus.UNKNOWN)
+    # Do not fail request when S3 bucket is not available
+    config_url = _get_lookup_result(
+        futures, "configuration url", default="NOT_AVAILABLE", ignored_errors=(ClusterActionError,)
+    )
 
-    cluster_status = cloud_formation_status_to_cluster_status(cfn_stack.status)
     response = DescribeClusterResponseContent(
         creation_time=to_utc_datetime(cfn_stack.creation_time),
         version=cfn_stack.version,
@@ -239,11 +254,15 @@ def describe_cluster(cluster_name, region=None):
         region=os.environ.get("AWS_DEFAULT_REGION"),
         cluster_status=cluster_status,
         scheduler=Scheduler(type=cluster.stack.scheduler),
-        failures=_get_creation_failures(cluster_status, cfn_stack),
+        failures=_get_lookup_result(futures, "creation failures"),
     )
 
-    try:
-        head_node = cluster.head_node_instance
+    # This should not be treated as a failure cause head node and login node might not be running in some cases.
+    # e.g. when the cluster is in DELETE_IN_PROGRESS
+    head_node = _get_lookup_result(
+        futures, "head node", ignored_errors=(ClusterActionError,), error_log_level=logging.INFO
+    )
+    if head_node:
         response.head_node = EC2Instance(
             instance_id=head_node.id,
             launch_time=to_utc_datetime(head_node.launch_time),
@@ -252,17 +271,37 @@ def describe_cluster(cluster_name, region=None):
             state=InstanceState.from_dict(head_node.state),
             private_ip_address=head_node.private_ip,
         )
-        login_nodes = _get_login_nodes(cluster)
-        if login_nodes:
-            response.login_nodes = login_nodes
-    except ClusterActionError as e:
-        # This should not be treated as a failure cause head node and login node might not be running in some cases.
-        # e.g. when the cluster is in DELETE_IN_PROGRESS
-        LOGGER.info(e)
+    login_nodes = _get_lookup_result(
+        futures, "login nodes", ignored_errors=(ClusterActionError,), error_log_level=logging.INFO
+    )
+    if login_nodes:
+        response.login_nodes = login_nodes
 
     return response
 
 
+def _get_describe_cluster_timeout():
+    return float(os.environ.get("PCLUSTER_DESCRIBE_CLUSTER_TIMEOUT", DESCRIBE_CLUSTER_TIMEOUT_DEFAULT))
+
+
+def _get_lookup_result(futures, lookup, default=None, ignored_errors=(), error_log_level=logging.ERROR):
+    """
+    Return the result of a lookup executed concurrently by describe_cluster.
+
+    The default value is returned if the lookup exceeded the timeout or failed with one of the ignored errors,
+    any other error is raised.
+    """
+    future = futures[lookup]
+    if not future.done():
+        LOGGER.warning("Timed out while retrieving the %s, omitting it from the response", lookup)
+        return default
+    try:
+        return future.result()
+    except ignored_errors as e:
+        LOGGER.log(error_log_level, e)
+        return default
+
+
 def _get_login_nodes(cluster):
     login_nodes_status = cluster.login_nodes_status
 
@@ -286,13 +325,13 @@ def _get_login_nodes(cluster):
     return None
 
 
-@configure_aws_region()
+@configure_aws_region(multi_region=True)
 @convert_errors()
 def list_clusters(region=None, next_token=None, cluster_status=None):
     """
     Retrieve the list of existing clusters managed by the API. Deleted clusters are not listed by default.
 
-    :param region: List clusters deployed to a given AWS Region.
+    :param region: List clusters deployed to a given AWS Region, or to a comma separated list of AWS Regions.
     :type region: str
     :param next_token: Token to use for paginated requests.
     :type next_token: str
@@ -301,6 +340,17 @@ def list_clusters(region=None, next_token=None, cluster_status=None):
 
     :rtype: ListClustersResponseContent
     """
+    regions = get_regions(region)
+    list_function = functools.partial(_list_clusters, cluster_status=cluster_status)
+    if len(regions) > 1:
+        clusters, next_token = list_in_regions(regions, next_token, list_function)
+    else:
+        clusters, next_token = list_function(next_token)
+
+    return ListClustersResponseContent(clusters=clusters, next_token=next_token)
+
+
+def _list_clusters(next_token, cluster_status):
     stacks, next_token = AWSApi.instance().cfn.list_pcluster_stacks(next_token=next_token)
     stacks = [ClusterStack(stack) for stack in stacks]
 
@@ -312,14 +362,13 @@ def list_clusters(region=None, next_token=None, cluster_status=None):
                 cluster_name=stack.cluster_name,
                 cloudformation_stack_status=stack.status,
                 cloudformation_stack_arn=stack.id,
-                region=os.environ.get("AWS_DEFAULT_REGION"),
+                region=get_region(),
                 version=stack.version,
                 cluster_status=current_cluster_status,
                 scheduler=Scheduler(type=stack.scheduler),
             )
             clusters.append(cluster_info)
-
-    return ListClustersResponseContent(clusters=clusters, next_token=next_token)
+    return clusters, next_token
 
 
 @convert_errors()
@@ -11,10 +11,14 @@
 #  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
+import base64
+import binascii
 import functools
+import json
 import logging
 import os
-from typing import List, Optional, Set, Union
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, List, Optional, Set, Tuple, Union
 
 import boto3
 from pkg_resources import packaging
@@ -27,9 +31,10 @@ from pcluster.api.errors import (
     NotFoundException,
     ParallelClusterApiException,
 )
+from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import BadRequestError, LimitExceededError, StackNotFoundError, get_region
 from pcluster.config.common import AllValidatorsSuppressor, TypeMatchValidatorsSuppressor, ValidatorSuppressor
-from pcluster.constants import UNSUPPORTED_OPERATIONS_MAP, Operation
+from pcluster.constants import MULTI_REGION_LIST_MAX_WORKERS, UNSUPPORTED_OPERATIONS_MAP, Operation
 from pcluster.models.cluster import Cluster
 from pcluster.models.common import BadRequest, Conflict, LimitExceeded, NotFound, parse_config
 from pcluster.utils import get_installed_version, retrieve_supported_regions, to_utc_datetime
@@ -65,19 +70,34 @@ def configure_aws_region_from_config(region: Union[None, str], config_str: str):
     _set_region(region or config_region or boto3.Session().region_name)
 
 
-def configure_aws_region():
+def get_regions(region: Optional[str]) -> List[str]:
+    """Return the regions in the given comma separated list of regions."""
+    return [region.strip() for region in region.split(",") if region.strip()] if region else []
+
+
+def configure_aws_region(multi_region: bool = False):
     """
     Handle region validation and configuration for API controllers.
 
     When a controller is decorated with @configure_aws_region, the region value passed either as a query string
     argument or as a body parameter is validated and then set in the environment so that all AWS clients make use
     of it.
+    With multi_region, the region can be a comma separated list of regions: in that case the regions are only
+    validated, and the controller is expected to scope the AWS calls to each of them with AWSApi.region_scope.
     """
 
     def _decorator_validate_region(func):
         @functools.wraps(func)
         def _wrapper_validate_region(*args, **kwargs):
-            _set_region(kwargs.get("region") or boto3.Session().region_name)
+            regions = get_regions(kwargs.get("region"))
+            if multi_region and len(regions) > 1:
+                for region in regions:
+                    if region not in retrieve_supported_regions():
+                        raise BadRequestException(f"invalid or unsupported region '{region}'")
+            elif multi_region:
+                _set_region(regions[0] if regions else boto3.Session().region_name)
+            else:
+                _set_region(kwargs.get("region") or boto3.Session().region_name)
             return func(*args, **kwargs)
 
         return _wrapper_validate_region
@@ -191,3 +211,58 @@ def assert_supported_operation(operation: Operation, region: str):
         message = f"The operation '{operation.value}' is not supported in region '{region}'."
         LOGGER.critical(message)
         raise BadRequestException(message)
+
+
+def _encode_multi_region_token(region_tokens: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(region_tokens).encode("utf-8")).decode("utf-8")
+
+
+def _decode_multi_region_token(next_token: str, regions: List[str]) -> dict:
+    try:
+        region_tokens = json.loads(base64.urlsafe_b64decode(next_token.encode("utf-8")))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        region_tokens = None
+    if not isinstance(region_tokens, dict) or not set(region_tokens).issubset(regions):
+        raise BadRequestException("invalid nextToken for the given regions")
+    return region_tokens
+
+
+def _list_in_region(region: str, list_function: Callable, next_token: Optional[str]):
+    with AWSApi.region_scope(region):
+        return list_function(next_token)
+
+
+def list_in_regions(
+    regions: List[str], next_token: Optional[str], list_function: Callable[[Optional[str]], Tuple[List, Optional[str]]]
+) -> Tuple[List, Optional[str]]:
+    """
+    Call list_function(next_token) concurrently in each of the regions and merge the returned items.
+
+    The items are returned in the order of the given regions. The returned next token encodes the next token of
+    each region having more items, so that the subsequent requests only query those regions.
+    Regions failing are logged and kept in the next token, to be retried by the subsequent request,
+    unless all the regions fail, in which case the error of the first region is raised.
+    """
+    region_tokens = _decode_multi_region_token(next_token, regions) if next_token else dict.fromkeys(regions)
+    results, errors, next_tokens = {}, {}, {}
+    with ThreadPoolExecutor(max_workers=min(len(region_tokens), MULTI_REGION_LIST_MAX_WORKERS) or 1) as executor:
+        futures = {
+            executor.submit(_list_in_region, region, list_function, token): region
+            for region, token in region_tokens.items()
+        }
+        for future in as_completed(futures):
+            region = futures[future]
+            try:
+                results[region], region_next_token = future.result()
+                if region_next_token:
+                    next_tokens[region] = region_next_token
+            except Exception as e:
+                LOGGER.warning("Unable to list the resources in region %s, it will be retried: %s", region, e)
+                errors[region] = e
+                next_tokens[region] = region_tokens[region] or ""
+            LOGGER.info("Resources listed in %s of %s regions", len(results) + len(errors), len(region_tokens))
+
+    if errors and not results:
+        raise errors[next(region for region in region_tokens if region in errors)]
+    items = [item for region in region_tokens for item in results.get(region, [])]
+    return items, _encode_multi_region_token(next_tokens) if next_tokens else None
@@ -7,6 +7,7 @@
 # limitations under the License.
 
 # pylint: disable=W0613
+import functools
 import logging
 import os as os_lib
 
@@ -15,8 +16,10 @@ from pcluster.api.controllers.common import (
     configure_aws_region,
     configure_aws_region_from_config,
     convert_errors,
+    get_regions,
     get_validator_suppressors,
     http_success_status_code,
+    list_in_regions,
 )
 from pcluster.api.converters import (
     cloud_formation_status_to_image_status,
@@ -49,7 +52,7 @@ from pcluster.api.models.delete_image_response_content import DeleteImageRespons
 from pcluster.api.models.image_build_status import ImageBuildStatus
 from pcluster.api.util import assert_valid_node_js
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSClientError, get_region
 from pcluster.aws.ec2 import Ec2Client
 from pcluster.constants import SUPPORTED_ARCHITECTURES, SUPPORTED_OSES, Operation
 from pcluster.models.imagebuilder import (
@@ -315,7 +318,7 @@ def _image_info_to_ami_info(image):
     )
 
 
-@configure_aws_region()
+@configure_aws_region(multi_region=True)
 @convert_errors()
 def list_images(image_status, region=None, next_token=None):
     """
@@ -323,19 +326,30 @@ def list_images(image_status, region=None, next_token=None):
 
     :param image_status: Filter by image status.
     :type image_status: dict | bytes
-    :param region: List images built in a given AWS Region.
+    :param region: List images built in a given AWS Region, or in a comma separated list of AWS Regions.
     :type region: str
     :param next_token: Token to use for paginated requests.
     :type next_token: str
 
     :rtype: ListImagesResponseContent
     """
-    assert_supported_operation(operation=Operation.LIST_IMAGES, region=region)
+    regions = get_regions(region)
+    for _region in regions or [None]:
+        assert_supported_operation(operation=Operation.LIST_IMAGES, region=_region)
+
+    list_function = functools.partial(_list_images, image_status)
+    if len(regions) > 1:
+        images, next_token = list_in_regions(regions, next_token, list_function)
+    else:
+        images, next_token = list_function(next_token)
+    return ListImagesResponseContent(images=images, next_token=next_token)
+
+
+def _list_images(image_status, next_token):
     if image_status == ImageStatusFilteringOption.AVAILABLE:
-        return ListImagesResponseContent(images=_get_available_images())
+        return _get_available_images(), None
     else:
-        images, next_token = _get_images_in_progress(image_status, next_token)
-        return ListImagesResponseContent(images=images, next_token=next_token)
+        return _get_images_in_progress(image_status, next_token)
 
 
 def _handle_config_validation_error(e: ConfigValidationError) -> BuildImageBadRequestException:
@@ -384,7 +398,7 @@ def _imagebuilder_stack_to_image_info_summary(stack):
         image_build_status=cloud_formation_status_to_image_status(stack.status),
         cloudformation_stack_status=stack.status,
         cloudformation_stack_arn=stack.id,
-        region=os_lib.environ.get("AWS_DEFAULT_REGION"),
+        region=get_region(),
         version=stack.version,
     )
 
@@ -394,6 +408,6 @@ def _image_info_to_image_info_summary(image):
         image_id=image.pcluster_image_id,
         image_build_status=ImageBuildStatus.BUILD_COMPLETE,
         ec2_ami_info=Ec2AmiInfoSummary(ami_id=image.id),
-        region=os_lib.environ.get("AWS_DEFAULT_REGION"),
+        region=get_region(),
         version=image.version,
     )
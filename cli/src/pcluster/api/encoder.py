@@ -10,8 +10,13 @@
 
 import datetime
 
-import six
 from connexion.apps.flask_app import FlaskJSONEncoder
+from connexion.jsonifier import Jsonifier
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from pcluster.api.models.base_model_ import Model
 from pcluster.utils import to_iso_timestr
@@ -25,14 +30,58 @@ class JSONEncoder(FlaskJSONEncoder):
     def default(self, obj):  # pylint: disable=arguments-renamed
         """Override the base method to add support for model objects serialization."""
         if isinstance(obj, Model):
-            dikt = {}
-            for attr, _ in six.iteritems(obj.openapi_types):
-                value = getattr(obj, attr)
-                if value is None and not self.include_nulls:
-                    continue
-                attr = obj.attribute_map[attr]
-                dikt[attr] = value
-            return dikt
+            values = obj.__dict__
+            return {
+                json_key: values[private_attr]
+                for _, private_attr, json_key in obj.serialized_fields()
+                if self.include_nulls or values[private_attr] is not None
+            }
         elif isinstance(obj, datetime.date):
             return to_iso_timestr(obj)
         return FlaskJSONEncoder.default(self, obj)
+
+
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def to_serializable(obj, include_nulls=False):
+    """Convert the model objects and dates in the given response data, recursively, to plain JSON types."""
+    if type(obj) in _SCALAR_TYPES:
+        return obj
+    if isinstance(obj, Model):
+        values = obj.__dict__
+        result = {}
+        for _, private_attr, json_key in obj.serialized_fields():
+            value = values[private_attr]
+            if value is not None or include_nulls:
+                result[json_key] = to_serializable(value, include_nulls)
+        return result
+    if isinstance(obj, (list, tuple)):
+        return [to_serializable(item, include_nulls) for item in obj]
+    if isinstance(obj, dict):
+        return {key: to_serializable(value, include_nulls) for key, value in obj.items()}
+    if isinstance(obj, datetime.date):
+        return to_iso_timestr(obj)
+    return obj
+
+
+class FastJsonifier(Jsonifier):
+    """
+    Jsonifier converting the response data to plain JSON types before dumping them.
+
+    The data are dumped with orjson when it is installed, with the same indentation and key order of the Flask
+    encoder, otherwise with the configured json library.
+    """
+
+    def dumps(self, data, **kwargs):
+        """Serialize the given data to a JSON string."""
+        data = to_serializable(data, JSONEncoder.include_nulls)
+        if orjson and not kwargs:
+            try:
+                return orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+                ).decode()
+            except TypeError:
+                # Data not supported by orjson, e.g. integers over 64 bits or non-string keys
+                pass
+        return super().dumps(data, **kwargs)
@@ -7,11 +7,16 @@
 # limitations under the License.
 import functools
 import logging
+import os
+import random
+import time
 
 import connexion
+import flask
 from connexion import ProblemException
+from connexion.apis.flask_api import FlaskApi
 from connexion.decorators.validation import ParameterValidator
-from flask import Response, jsonify, request
+from flask import Response, g, jsonify, request
 from werkzeug.exceptions import HTTPException
 
 from pcluster.api import encoder
@@ -24,11 +29,40 @@ from pcluster.api.errors import (
 )
 from pcluster.api.util import assert_valid_node_js
 from pcluster.aws.aws_api import AWSApi
-from pcluster.aws.common import AWSClientError, Cache
+from pcluster.aws.common import AWSClientError, Cache, CacheScope
+from pcluster.constants import API_LOG_BODIES_MAX_SIZE_DEFAULT, API_LOG_BODIES_SAMPLE_RATE_DEFAULT
 
 LOGGER = logging.getLogger(__name__)
 
 
+def _get_env_number(variable: str, default, number_type):
+    """Return the non-negative number set in the given environment variable, or the default if unset or not valid."""
+    value = os.environ.get(variable)
+    if not value:
+        return default
+    try:
+        number = number_type(value)
+        if number < 0:
+            raise ValueError(f"{variable} must not be negative")
+        return number
+    except ValueError:
+        LOGGER.warning("Invalid value %s for %s, using the default value %s", value, variable, default)
+        return default
+
+
+def _should_log_bodies(sample_rate: float) -> bool:
+    """Tell if the bodies of the current request and response must be logged, sampling the requests."""
+    return sample_rate > 0 and random.random() < sample_rate  # nosec B311
+
+
+def _format_body(data: bytes, max_size: int) -> str:
+    """Decode the given body, truncated to max_size bytes, without parsing it."""
+    if not data:
+        return "EMPTY"
+    body = data[:max_size].decode("utf-8", errors="replace")
+    return body if len(data) <= max_size else f"{body}... (truncated)"
+
+
 class CustomParameterValidator(ParameterValidator):
     """Override the Connexion ParameterValidator to remove JSON schema details on errors."""
 
@@ -51,6 +85,14 @@ class CustomParameterValidator(ParameterValidator):
         return error
 
 
+class CustomFlaskApi(FlaskApi):
+    """Override the Connexion FlaskApi to serialize the responses with the fast path jsonifier."""
+
+    @classmethod
+    def _set_jsonifier(cls):
+        cls.jsonifier = encoder.FastJsonifier(flask.json, indent=2)
+
+
 def log_response_error(func):
     @functools.wraps(func)
     def _log_response_error(*args, **kwargs):
@@ -77,6 +119,7 @@ class ParallelClusterFlaskApp:
         self.app = connexion.FlaskApp(__name__, specification_dir="openapi/", skip_error_handlers=True)
         self.flask_app = self.app.app
         self.flask_app.json_encoder = encoder.JSONEncoder
+        self.app.api_cls = CustomFlaskApi
         self.app.add_api(
             "openapi.yaml",
             arguments={"title": "ParallelCluster"},
@@ -91,39 +134,59 @@ class ParallelClusterFlaskApp:
         self.app.add_error_handler(AWSClientError, self._handle_aws_client_error)
         self.app.add_error_handler(Exception, self._handle_unexpected_exception)
 
+        # The logging settings are read once, rather than at every request
+        log_bodies_sample_rate = (
+            _get_env_number("PCLUSTER_API_LOG_BODIES_SAMPLE_RATE", API_LOG_BODIES_SAMPLE_RATE_DEFAULT, float)
+            if os.environ.get("PCLUSTER_API_LOG_BODIES", "").lower() in ["true", "1", "yes"]
+            else 0.0
+        )
+        log_bodies_max_size = _get_env_number("PCLUSTER_API_LOG_BODIES_MAX_SIZE", API_LOG_BODIES_MAX_SIZE_DEFAULT, int)
+
         @self.flask_app.before_request
         def _clear_cache():
-            # Cache is meant to be reused only within a single request
-            Cache.clear_all()
-            AWSApi.reset()
+            # Request scoped data is meant to be reused only within a single request, while region-static data and
+            # the boto3 clients are kept across the requests served by a warm process
+            Cache.clear_all(scope=CacheScope.REQUEST)
+            AWSApi.reset(keep_sessions=True)
 
         @self.flask_app.before_request
         def _log_request():  # pylint: disable=unused-variable
-            data = "INVALID"
-            try:
-                data = request.get_json() if request.data else "EMPTY"
-            except Exception:
-                LOGGER.error("Exception while reading json of request.")
+            # Bodies are logged only when enabled, since formatting large bodies is a significant share of the latency
+            g.request_start_time = time.monotonic()
+            g.log_bodies = _should_log_bodies(log_bodies_sample_rate)
+            body_size = request.content_length or 0
             LOGGER.info(
-                "Handling request: %s %s - Body: %s",
+                "Handling request: %s %s - Body size: %s%s",
                 request.method,
                 request.full_path,
-                data,
+                body_size,
+                f" - Body: {_format_body(request.get_data(), log_bodies_max_size)}" if g.log_bodies else "",
+                extra={"request": {"method": request.method, "path": request.path, "body_size": body_size}},
             )
 
         @self.flask_app.after_request
         def _log_response(response: Response):  # pylint: disable=unused-variable
-            data = "INVALID"
-            try:
-                data = response.get_json() if response.data else "EMPTY"
-            except Exception:
-                LOGGER.error("Exception while reading json of response.")
+            latency = round((time.monotonic() - g.get("request_start_time", time.monotonic())) * 1000)
+            # The size of streamed responses is unknown
+            body_size = response.calculate_content_length()
+            log_body = g.get("log_bodies") and not response.is_streamed
             LOGGER.info(
-                "Responding to request %s %s: %s - Body: %s",
+                "Responding to request %s %s: %s in %s ms - Body size: %s%s",
                 request.method,
                 request.full_path,
                 response.status_code,
-                data,
+                latency,
+                body_size,
+                f" - Body: {_format_body(response.get_data(), log_bodies_max_size)}" if log_body else "",
+                extra={
+                    "response": {
+                        "method": request.method,
+                        "path": request.path,
+                        "status": response.status_code,
+                        "latency_ms": latency,
+                        "body_size": body_size,
+                    }
+                },
             )
             return response
 
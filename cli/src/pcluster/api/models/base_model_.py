@@ -11,8 +11,6 @@
 import pprint
 import typing
 
-import six
-
 from pcluster.api import util
 
 T = typing.TypeVar("T")  # pylint: disable=C0103
@@ -27,35 +25,36 @@ class Model:
     # value is json key in definition.
     attribute_map = {}
 
+    # Serialized fields of each model class, see serialized_fields.
+    _serialized_fields_by_class = {}
+
     @classmethod
     def from_dict(cls: typing.Type[T], dikt) -> T:
         """Returns the dict as a model"""
         return util.deserialize_model(dikt, cls)
 
+    def serialized_fields(self):
+        """Returns the (attribute name, private attribute name, json key) triplets of the model properties
+
+        The triplets are computed once per model class. The private attribute is the one backing the property, so
+        serializers can read the values from the instance dict without going through the property getters.
+
+        :rtype: tuple
+        """
+        cls = type(self)
+        fields = Model._serialized_fields_by_class.get(cls)
+        if fields is None:
+            fields = tuple((attr, "_" + attr, self.attribute_map[attr]) for attr in self.openapi_types)
+            Model._serialized_fields_by_class[cls] = fields
+        return fields
+
     def to_dict(self):
         """Returns the model properties as a dict
 
         :rtype: dict
         """
-        result = {}
-
-        for attr, _ in six.iteritems(self.openapi_types):
-            value = getattr(self, attr)
-            if isinstance(value, list):
-                result[attr] = list(map(lambda x: x.to_dict() if hasattr(x, "to_dict") else x, value))
-            elif hasattr(value, "to_dict"):
-                result[attr] = value.to_dict()
-            elif isinstance(value, dict):
-                result[attr] = dict(
-                    map(
-                        lambda item: (item[0], item[1].to_dict()) if hasattr(item[1], "to_dict") else item,
-                        value.items(),
-                    )
-                )
-            else:
-                result[attr] = value
-
-        return result
+        values = self.__dict__
+        return {attr: _to_dict_value(values[private_attr]) for attr, private_attr, _ in self.serialized_fields()}
 
     def to_str(self):
         """Returns the string representation of the model
@@ -75,3 +74,14 @@ class Model:
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
         return not self == other
+
+
+def _to_dict_value(value):
+    """Convert the value of a model property, and the models it directly contains, to plain dicts."""
+    if isinstance(value, list):
+        return [item.to_dict() if hasattr(item, "to_dict") else item for item in value]
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, dict):
+        return {key: item.to_dict() if hasattr(item, "to_dict") else item for key, item in value.items()}
+    return value
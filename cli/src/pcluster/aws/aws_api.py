@@ -8,10 +8,14 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import contextvars
 import os
+import threading
+from contextlib import contextmanager
 
 from pcluster.aws.batch import BatchClient
 from pcluster.aws.cfn import CfnClient
+from pcluster.aws.common import Boto3Session
 from pcluster.aws.dynamo import DynamoResource
 from pcluster.aws.ec2 import Ec2Client
 from pcluster.aws.efs import EfsClient
@@ -22,6 +26,7 @@ from pcluster.aws.imagebuilder import ImageBuilderClient
 from pcluster.aws.kms import KmsClient
 from pcluster.aws.logs import LogsClient
 from pcluster.aws.resource_groups import ResourceGroupsClient
+from pcluster.aws.resource_groups_tagging import ResourceGroupsTaggingClient
 from pcluster.aws.route53 import Route53Client
 from pcluster.aws.s3 import S3Client
 from pcluster.aws.s3_resource import S3Resource
@@ -29,6 +34,9 @@ from pcluster.aws.secretsmanager import SecretsManagerClient
 from pcluster.aws.ssm import SsmClient
 from pcluster.aws.sts import StsClient
 
+# Region of the AWSApi instance returned in the current context, when different from the one in the environment
+_SCOPED_REGION = contextvars.ContextVar("pcluster_scoped_region", default=None)
+
 
 class AWSApi:
     """
@@ -40,10 +48,16 @@ class AWSApi:
     """
 
     _instance = None
+    _regional_instances = {}
+    _regional_instances_lock = threading.Lock()
+    # Boto3 sessions, and so clients, by region; they can be kept by AWSApi.reset() to be reused by the new instances
+    _sessions = {}
+    _sessions_lock = threading.Lock()
 
-    def __init__(self):
-        self.aws_region = os.environ.get("AWS_DEFAULT_REGION")
+    def __init__(self, region: str = None):
+        self.aws_region = region or os.environ.get("AWS_DEFAULT_REGION")
 
+        self._session = None
         self._batch = None
         self._cfn = None
         self._ec2 = None
@@ -63,6 +77,17 @@ class AWSApi:
         self._secretsmanager = None
         self._ssm = None
         self._resource_groups = None
+        self._resource_groups_tagging = None
+
+    @property
+    def session(self):
+        """Boto3 session shared by all the clients, to reuse resolved credentials and open connections."""
+        if not self._session:
+            with AWSApi._sessions_lock:
+                if self.aws_region not in AWSApi._sessions:
+                    AWSApi._sessions[self.aws_region] = Boto3Session(region_name=self.aws_region)
+                self._session = AWSApi._sessions[self.aws_region]
+        return self._session
 
     @property
     def cfn(self):
@@ -190,17 +215,61 @@ class AWSApi:
             self._resource_groups = ResourceGroupsClient()
         return self._resource_groups
 
+    @property
+    def resource_groups_tagging(self):
+        """Resource Groups Tagging client."""
+        if not self._resource_groups_tagging:
+            self._resource_groups_tagging = ResourceGroupsTaggingClient()
+        return self._resource_groups_tagging
+
     @staticmethod
     def instance():
-        """Return the singleton AWSApi instance."""
+        """Return the singleton AWSApi instance, or the one of the region scoped with AWSApi.region_scope."""
+        scoped_region = _SCOPED_REGION.get()
+        if scoped_region:
+            with AWSApi._regional_instances_lock:
+                if scoped_region not in AWSApi._regional_instances:
+                    AWSApi._regional_instances[scoped_region] = AWSApi(scoped_region)
+                return AWSApi._regional_instances[scoped_region]
         if not AWSApi._instance or AWSApi._instance.aws_region != os.environ.get("AWS_DEFAULT_REGION"):
             AWSApi._instance = AWSApi()
         return AWSApi._instance
 
     @staticmethod
-    def reset():
-        """Reset the instance to clear all caches."""
+    def reset(keep_sessions: bool = False):
+        """
+        Reset the instances to clear all caches.
+
+        When keep_sessions is set, the boto3 sessions and clients are kept and reused by the new instances,
+        so that the state held by the client wrappers is discarded without paying the construction of the clients.
+        """
         AWSApi._instance = None
+        with AWSApi._regional_instances_lock:
+            AWSApi._regional_instances = {}
+        if not keep_sessions:
+            with AWSApi._sessions_lock:
+                AWSApi._sessions = {}
+
+    @staticmethod
+    def scoped_region():
+        """Return the region scoped with AWSApi.region_scope in the current context, if any."""
+        return _SCOPED_REGION.get()
+
+    @staticmethod
+    @contextmanager
+    def region_scope(region: str):
+        """
+        Make AWSApi.instance() return the instance of the given region in the current context.
+
+        The instances of the regions, and so their clients, are kept and reused by the subsequent scopes, so that
+        operations spanning multiple regions can run concurrently without changing AWS_DEFAULT_REGION.
+        Note: the scope is not inherited by the threads started in it.
+        """
+        token = _SCOPED_REGION.set(region)
+        try:
+            yield AWSApi.instance()
+        finally:
+            _SCOPED_REGION.reset(token)
 
 
 class KeyPairInfo:
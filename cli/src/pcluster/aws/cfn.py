@@ -10,12 +10,18 @@
 # limitations under the License.
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 
 from botocore.exceptions import ClientError
 
 from pcluster.aws.aws_resources import StackInfo
 from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client, StackNotFoundError
-from pcluster.constants import PCLUSTER_IMAGE_ID_TAG, PCLUSTER_VERSION_TAG
+from pcluster.constants import (
+    LIST_STACKS_DESCRIBE_MAX_WORKERS,
+    LIST_STACKS_IN_CREATION_STATUSES,
+    PCLUSTER_IMAGE_ID_TAG,
+    PCLUSTER_VERSION_TAG,
+)
 from pcluster.utils import remove_none_values
 
 LOGGER = logging.getLogger(__name__)
@@ -168,12 +174,71 @@ class CfnClient(Boto3Client):
         response = self._client.describe_stack_resources(StackName=stack_name).get("StackResources")
         return {resource["LogicalResourceId"]: resource for resource in response}  # Build dictionary for better query.
 
+    @AWSExceptionHandler.handle_client_exception
+    def list_stack_resources(self, stack_name: str):
+        """Get the summaries of all the resources of the stack, unlike describe_stack_resources limited to 100."""
+        return list(self._paginate_results(self._client.list_stack_resources, StackName=stack_name))
+
     @AWSExceptionHandler.handle_client_exception
     def get_imagebuilder_stacks(self, next_token=None):
         """List existing imagebuilder stacks."""
         return self._list_parentless_stacks_with_tag(PCLUSTER_IMAGE_ID_TAG, next_token)
 
     def _list_parentless_stacks_with_tag(self, tag, next_token=None):
+        """
+        Return a page of the root stacks having the given tag and the token of the next page.
+
+        The candidate stacks are retrieved through the Resource Groups Tagging API, so that only the stacks having
+        the tag are described rather than all the stacks of the account. If the Tagging API cannot be used,
+        e.g. because tag:GetResources is not allowed, all the stacks are scanned with DescribeStacks.
+
+        The Tagging API is eventually consistent, so a stack created a few moments before may be missing from it.
+        The first page is then completed with the root stacks being created, as returned by ListStacks.
+        """
+        from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
+
+        try:
+            stack_arns, result_token = AWSApi.instance().resource_groups_tagging.get_stack_arns_with_tag(
+                tag, next_token
+            )
+        except AWSClientError as e:
+            LOGGER.info("Unable to retrieve stacks with tag %s, scanning all the stacks: %s", tag, e)
+            return self._scan_parentless_stacks_with_tag(tag, next_token)
+
+        if not next_token:
+            stack_arns = stack_arns + [
+                stack_id for stack_id in self._list_parentless_stacks_in_creation() if stack_id not in stack_arns
+            ]
+        with ThreadPoolExecutor(max_workers=LIST_STACKS_DESCRIBE_MAX_WORKERS) as executor:
+            stacks = executor.map(self._describe_stack_if_exists, stack_arns)
+        # The Tagging API returns nested stacks too, since they inherit the tags, and recently deleted stacks
+        stack_list = [
+            stack
+            for stack in stacks
+            if stack
+            and stack.get("ParentId") is None
+            and stack.get("StackStatus") != "DELETE_COMPLETE"
+            and StackInfo(stack).get_tag(tag)
+        ]
+        return stack_list, result_token
+
+    def _list_parentless_stacks_in_creation(self):
+        """Return the ids of the root stacks being created, with no need to scan all the stacks of the account."""
+        return [
+            summary["StackId"]
+            for summary in self._paginate_results(
+                self._client.list_stacks, StackStatusFilter=LIST_STACKS_IN_CREATION_STATUSES
+            )
+            if summary.get("ParentId") is None
+        ]
+
+    def _describe_stack_if_exists(self, stack_name: str):
+        try:
+            return self.describe_stack(stack_name)
+        except StackNotFoundError:
+            return None
+
+    def _scan_parentless_stacks_with_tag(self, tag, next_token=None):
         describe_stacks_kwargs = {}
         if next_token:
             describe_stacks_kwargs["NextToken"] = next_token
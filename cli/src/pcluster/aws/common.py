@@ -9,11 +9,18 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextvars
 import functools
+import hashlib
+import json
 import logging
 import os
+import pickle  # nosec B403
+import sqlite3
 import threading
 import time
+from collections import OrderedDict
+from contextlib import contextmanager
 from enum import Enum
 from typing import Dict
 
@@ -21,6 +28,12 @@ import boto3
 from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError, ParamValidationError
 
+from pcluster.constants import (
+    AWS_API_MAX_ATTEMPTS_DEFAULT,
+    AWS_API_MAX_POOL_CONNECTIONS_DEFAULT,
+    AWS_API_RETRY_MODE_DEFAULT,
+)
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -127,23 +140,133 @@ class AWSExceptionHandler:
         return wrapper
 
 
+class CallStats:
+    """Counters of the AWS calls issued and of the cached results reused within a tracking context."""
+
+    def __init__(self):
+        self.aws_calls = 0
+        self.cache_hits = 0
+
+
+_CALL_STATS = contextvars.ContextVar("pcluster_call_stats", default=None)
+
+
+@contextmanager
+def track_call_stats():
+    """
+    Count the AWS calls and the cache hits of the code executed in the context.
+
+    The counters follow the execution context, so calls made by other threads or asyncio tasks are not counted,
+    unless the context is explicitly propagated to them.
+    """
+    stats = CallStats()
+    token = _CALL_STATS.set(stats)
+    try:
+        yield stats
+    finally:
+        _CALL_STATS.reset(token)
+
+
+def _record_aws_call():
+    stats = _CALL_STATS.get()
+    if stats:
+        stats.aws_calls += 1
+
+
+def _record_cache_hit():
+    stats = _CALL_STATS.get()
+    if stats:
+        stats.cache_hits += 1
+
+
 def _log_boto3_calls(params, **kwargs):
+    _record_aws_call()
     service = kwargs["event_name"].split(".")[-2]
     operation = kwargs["event_name"].split(".")[-1]
-    region = kwargs["context"].get("client_region", boto3.session.Session().region_name)
+    region = kwargs["context"].get("client_region") or get_region()
     LOGGER.info(
         "Executing boto3 call: region=%s, service=%s, operation=%s, params=%s", region, service, operation, params
     )
 
 
+# Boto3 sessions are not thread safe: clients and resources used by the validators executed concurrently
+# must be created one at a time
+_BOTO3_LOCK = threading.Lock()
+
+
+def get_max_pool_connections() -> int:
+    """Return the max number of connections kept open by each boto3 client."""
+    return int(os.environ.get("PCLUSTER_AWS_MAX_POOL_CONNECTIONS", AWS_API_MAX_POOL_CONNECTIONS_DEFAULT))
+
+
+def _get_retries_config():
+    """Return the retry configuration of the clients, leaving to botocore the settings configured in the environment."""
+    retries = {}
+    if "AWS_RETRY_MODE" not in os.environ:
+        retries["mode"] = AWS_API_RETRY_MODE_DEFAULT
+    if "AWS_MAX_ATTEMPTS" not in os.environ:
+        retries["total_max_attempts"] = AWS_API_MAX_ATTEMPTS_DEFAULT
+    return retries
+
+
+class Boto3Session:
+    """
+    Boto3 session shared by all the clients and resources of an AWSApi instance.
+
+    Credentials and region are resolved once for all the clients, which are configured with a connection pool
+    sized for concurrent calls and with the standard retry mode.
+    """
+
+    def __init__(self, region_name: str = None):
+        with _BOTO3_LOCK:
+            self._session = boto3.session.Session(region_name=region_name)
+        self._region_name = None
+        self.config = Config(max_pool_connections=get_max_pool_connections(), retries=_get_retries_config())
+        self._clients = {}
+
+    @property
+    def region_name(self):
+        """Return the region of the session."""
+        if not self._region_name:
+            self._region_name = self._session.region_name
+        return self._region_name
+
+    def client(self, client_name: str, botocore_config_kwargs: Dict = None):
+        """
+        Return a client of the given service, with the given settings overriding the shared configuration.
+
+        Clients are thread safe, so they are created once per service and settings and reused for the lifetime
+        of the session.
+        """
+        client_key = (client_name, json.dumps(botocore_config_kwargs, sort_keys=True, default=str))
+        with _BOTO3_LOCK:
+            client = self._clients.get(client_key)
+            if not client:
+                config = self.config.merge(Config(**botocore_config_kwargs)) if botocore_config_kwargs else self.config
+                client = self._session.client(client_name, config=config)
+                client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+                self._clients[client_key] = client
+        return client
+
+    def resource(self, resource_name: str):
+        """Create a resource of the given service."""
+        with _BOTO3_LOCK:
+            resource = self._session.resource(resource_name, config=self.config)
+        resource.meta.client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        return resource
+
+
+def _get_session() -> Boto3Session:
+    from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
+
+    return AWSApi.instance().session
+
+
 class Boto3Client:
     """Boto3 client Class."""
 
     def __init__(self, client_name: str, botocore_config_kwargs: Dict = None):
-        self._client = boto3.client(
-            client_name, config=Config(**botocore_config_kwargs) if botocore_config_kwargs else None
-        )
-        self._client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        self._client = _get_session().client(client_name, botocore_config_kwargs)
 
     def _paginate_results(self, method, **kwargs):
         """
@@ -163,13 +286,107 @@ class Boto3Resource:
     """Boto3 resource Class."""
 
     def __init__(self, resource_name: str):
-        self._resource = boto3.resource(resource_name)
-        self._resource.meta.client.meta.events.register("provide-client-params.*.*", _log_boto3_calls)
+        self._resource = _get_session().resource(resource_name)
+
+
+class CacheScope(Enum):
+    """Lifetime of the entries of a cache in a long running process serving multiple requests, like the API."""
+
+    # Entries are discarded at every request, for data that can change at any time (stacks, instances, ...)
+    REQUEST = "request"
+    # Entries are kept across requests until their TTL expires, for region-static data (instance types, images, ...)
+    PROCESS = "process"
+
+
+class _FunctionCache:
+    """
+    Bounded, TTL-aware storage for the results of a function decorated with Cache.cached.
+
+    Entries are evicted in least recently used order when max_entries is exceeded and are discarded once older than
+    ttl seconds, if set. Per-key mutexes are reference counted so that they are released as soon as no invocation for
+    the key is in progress.
+    """
+
+    def __init__(self, name: str, max_entries: int = None, ttl: int = None, scope: CacheScope = CacheScope.REQUEST):
+        self.name = name
+        self._max_entries = max_entries
+        self.ttl = ttl
+        self.scope = scope
+        self._entries = OrderedDict()
+        self._mutexes = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def max_entries(self):
+        """Return the max number of entries, defaulting to PCLUSTER_CACHE_MAX_ENTRIES."""
+        return self._max_entries or int(os.environ.get("PCLUSTER_CACHE_MAX_ENTRIES", Cache.DEFAULT_MAX_ENTRIES))
+
+    def __len__(self):
+        return len(self._entries)
+
+    @contextmanager
+    def key_lock(self, key):
+        """Hold the mutex of the given key, creating it if needed and removing it when no longer used."""
+        with self._lock:
+            mutex, users = self._mutexes.get(key, (None, 0))
+            mutex = mutex or threading.Lock()
+            self._mutexes[key] = (mutex, users + 1)
+        try:
+            with mutex:
+                yield
+        finally:
+            with self._lock:
+                mutex, users = self._mutexes[key]
+                if users > 1:
+                    self._mutexes[key] = (mutex, users - 1)
+                else:
+                    del self._mutexes[key]
+
+    def get(self, key):
+        """Return a tuple (found, value) for the given key, discarding the entry if expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and (entry[1] is None or entry[1] > time.time()):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, entry[0]
+            if entry:
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def put(self, key, value):
+        """Store the value for the given key, evicting the least recently used entries if needed."""
+        with self._lock:
+            self._entries[key] = (value, time.time() + self.ttl if self.ttl else None)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all the entries."""
+        with self._lock:
+            self._entries.clear()
+
+    def reset_stats(self):
+        """Reset the counters of the cache."""
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        """Return the counters of the cache."""
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "size": len(self._entries)}
 
 
 class Cache:
     """Simple utility class providing a cache mechanism for expensive functions."""
 
+    DEFAULT_MAX_ENTRIES = 1000
+
     _caches = []
 
     @staticmethod
@@ -178,10 +395,48 @@ class Cache:
         return not os.environ.get("PCLUSTER_CACHE_DISABLED")
 
     @staticmethod
-    def clear_all():
-        """Clear the content of all caches."""
+    def clear_all(scope: CacheScope = None):
+        """Clear the content of all caches, or only of the ones with the given scope."""
+        for cache in Cache._caches:
+            if scope is None or cache.scope == scope:
+                cache.clear()
+
+    @staticmethod
+    def create(name: str, max_entries: int = None, ttl: int = None, scope: CacheScope = CacheScope.REQUEST):
+        """
+        Create a cache managed together with the ones of the decorated functions, to store arbitrary entries.
+
+        Entries are retrieved with get(key), returning a tuple (found, value), and stored with put(key, value).
+        """
+        cache = _FunctionCache(name, max_entries=max_entries, ttl=ttl, scope=scope)
+        Cache._caches.append(cache)
+        return cache
+
+    @staticmethod
+    def get_stats():
+        """Return hit/miss/eviction counters and size of the caches that have been used, by function name."""
+        return {cache.name: cache.stats() for cache in Cache._caches if cache.hits or cache.misses}
+
+    @staticmethod
+    def reset_stats():
+        """Reset the counters of all caches."""
         for cache in Cache._caches:
-            cache.clear()
+            cache.reset_stats()
+
+    @staticmethod
+    def log_stats(level=logging.DEBUG):
+        """Log the counters of the caches that have been used."""
+        stats = Cache.get_stats()
+        if stats:
+            LOGGER.log(
+                level,
+                "Cache stats: %s",
+                ", ".join(
+                    f"{name}(hits={counters['hits']}, misses={counters['misses']}, "
+                    f"evictions={counters['evictions']}, size={counters['size']})"
+                    for name, counters in sorted(stats.items())
+                ),
+            )
 
     @staticmethod
     def _make_key(val):
@@ -196,40 +451,249 @@ class Cache:
         return key
 
     @staticmethod
-    def cached(function):
+    def _make_process_scoped_key(args, kwargs):
+        """
+        Return the key of a process scoped cache entry.
+
+        The bound client instance is replaced by its class and region, since the clients are recreated by
+        AWSApi.reset() at every API request while the entries must be shared across requests.
+        """
+        if args and isinstance(args[0], (Boto3Client, Boto3Resource)):
+            args = (type(args[0]).__qualname__, get_region(), *args[1:])
+        return Cache._make_key(args) + Cache._make_key(kwargs)
+
+    @staticmethod
+    def cached(
+        function=None,
+        max_entries: int = None,
+        ttl: int = None,
+        persistent_ttl: int = None,
+        scope: CacheScope = CacheScope.REQUEST,
+    ):
         """
         Decorate a function to make it use a results cache based on passed arguments.
 
+        Can be used either as @Cache.cached or with arguments, e.g. @Cache.cached(ttl=...).
+        The cache of each decorated function keeps at most max_entries results (PCLUSTER_CACHE_MAX_ENTRIES if not set),
+        evicting the least recently used ones, and results older than ttl seconds, if set, are recomputed.
+        When persistent_ttl is set (in seconds), results are also stored in the on-disk PersistentCache, when enabled,
+        so that they can be reused by subsequent CLI invocations.
+        The scope tells if the results can be reused across the requests served by the API, see CacheScope;
+        process scoped results should have a ttl.
+
         Note: for threaded invocations, only a single instance for a given set of arguments
         will execute at a given time.
         """
-        cache = {}
-        mutexes = {}
-        lock = threading.Lock()
-        Cache._caches.append(cache)
+        if function is None:
+            return functools.partial(
+                Cache.cached, max_entries=max_entries, ttl=ttl, persistent_ttl=persistent_ttl, scope=scope
+            )
+
+        cache = Cache.create(function.__qualname__, max_entries=max_entries, ttl=ttl, scope=scope)
 
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
-            cache_key = Cache._make_key(args) + Cache._make_key(kwargs)
-            with lock:
-                if cache_key not in mutexes:
-                    mutexes[cache_key] = threading.Lock()
-
-            with mutexes[cache_key]:
-                if Cache.is_enabled() and cache_key in cache:
-                    return_value = cache[cache_key]
+            if scope == CacheScope.PROCESS:
+                cache_key = Cache._make_process_scoped_key(args, kwargs)
+            else:
+                cache_key = Cache._make_key(args) + Cache._make_key(kwargs)
+            with cache.key_lock(cache_key):
+                if Cache.is_enabled():
+                    found, return_value = cache.get(cache_key)
+                    if found:
+                        _record_cache_hit()
+                        return return_value
+                if persistent_ttl and PersistentCache.is_enabled():
+                    return_value = PersistentCache.instance().get_or_compute(
+                        function, args, kwargs, persistent_ttl, lambda: function(*args, **kwargs)
+                    )
                 else:
                     return_value = function(*args, **kwargs)
                 if Cache.is_enabled():
-                    cache[cache_key] = return_value
+                    cache.put(cache_key, return_value)
                 return return_value
 
+        wrapper.cache = cache
         return wrapper
 
 
+class PersistentCache:
+    """
+    On-disk cache tier shared across CLI invocations, backed by a SQLite database.
+
+    The cache is opt-in and is enabled by setting PCLUSTER_PERSISTENT_CACHE_ENABLED=true.
+    Entries are keyed by ParallelCluster version, region, account, function and arguments, expire after the TTL
+    of the decorated function and, when PCLUSTER_PERSISTENT_CACHE_MAX_ENTRIES is exceeded, the least recently
+    used entries are evicted. Any error accessing the database is logged and the call falls back to the wrapped
+    function, so the cache can never break a command.
+    """
+
+    SCHEMA_VERSION = 1
+    DEFAULT_MAX_ENTRIES = 10000
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, cache_dir: str, max_entries: int):
+        self.path = os.path.join(cache_dir, f"cache-v{PersistentCache.SCHEMA_VERSION}.sqlite")
+        self.max_entries = max_entries
+        self._cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._connection = None
+
+    @staticmethod
+    def is_enabled():
+        """Tell if the persistent cache is enabled."""
+        return Cache.is_enabled() and os.environ.get("PCLUSTER_PERSISTENT_CACHE_ENABLED", "").lower() in [
+            "true",
+            "1",
+            "yes",
+        ]
+
+    @staticmethod
+    def get_cache_dir():
+        """Return the directory hosting the persistent cache database."""
+        default_cache_dir = os.path.expanduser(os.path.join("~", ".parallelcluster", "cache"))
+        return os.environ.get("PCLUSTER_PERSISTENT_CACHE_DIR", default=default_cache_dir)
+
+    @staticmethod
+    def instance():
+        """Return the PersistentCache instance for the currently configured cache directory."""
+        cache_dir = PersistentCache.get_cache_dir()
+        max_entries = int(os.environ.get("PCLUSTER_PERSISTENT_CACHE_MAX_ENTRIES", PersistentCache.DEFAULT_MAX_ENTRIES))
+        with PersistentCache._instance_lock:
+            instance = PersistentCache._instance
+            if not instance or instance._cache_dir != cache_dir or instance.max_entries != max_entries:
+                if instance:
+                    instance.close()
+                PersistentCache._instance = PersistentCache(cache_dir, max_entries)
+            return PersistentCache._instance
+
+    @staticmethod
+    def reset():
+        """Close the database connection and forget the current instance."""
+        with PersistentCache._instance_lock:
+            if PersistentCache._instance:
+                PersistentCache._instance.close()
+            PersistentCache._instance = None
+
+    def close(self):
+        """Close the database connection."""
+        with self._lock:
+            if self._connection:
+                self._connection.close()
+                self._connection = None
+
+    def clear(self):
+        """Remove all the entries from the persistent cache."""
+        try:
+            with self._lock:
+                self._get_connection().execute("DELETE FROM entries")
+        except sqlite3.Error as e:
+            LOGGER.debug("Unable to clear persistent cache %s: %s", self.path, e)
+
+    def get_or_compute(self, function, args, kwargs, ttl: int, compute):
+        """Return the cached result of function for the given arguments, computing and storing it on a miss."""
+        key = self._make_key(function, args, kwargs)
+        if key is None:
+            return compute()
+
+        found, value = self._get(key)
+        if found:
+            LOGGER.debug("Persistent cache hit for %s", function.__qualname__)
+            _record_cache_hit()
+            return value
+
+        value = compute()
+        self._put(key, function.__qualname__, value, ttl)
+        return value
+
+    @staticmethod
+    def _make_key(function, args, kwargs):
+        """
+        Return a stable key for the given function invocation or None if the invocation cannot be persisted.
+
+        The bound client instance is dropped from the arguments since it is different for every process.
+        Invocations with arguments that are not JSON serializable are not persisted.
+        """
+        if args and isinstance(args[0], (Boto3Client, Boto3Resource)):
+            args = args[1:]
+        try:
+            payload = json.dumps(
+                [*_get_persistent_cache_scope(), f"{function.__module__}.{function.__qualname__}", args, kwargs],
+                sort_keys=True,
+            )
+        except (TypeError, ValueError, AWSClientError) as e:
+            LOGGER.debug("Skipping persistent cache for %s: %s", function.__qualname__, e)
+            return None
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _get_connection(self):
+        if not self._connection:
+            os.makedirs(self._cache_dir, mode=0o700, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5, check_same_thread=False, isolation_level=None)
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, function TEXT, value BLOB, expires_at REAL, last_access REAL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+            os.chmod(self.path, 0o600)
+            self._connection = connection
+        return self._connection
+
+    def _get(self, key):
+        now = time.time()
+        try:
+            with self._lock:
+                connection = self._get_connection()
+                row = connection.execute("SELECT value, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+                if not row:
+                    return False, None
+                if row[1] <= now:
+                    connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    return False, None
+                connection.execute("UPDATE entries SET last_access = ? WHERE key = ?", (now, key))
+            return True, pickle.loads(row[0])  # nosec B301
+        except (sqlite3.Error, pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            LOGGER.debug("Unable to read from persistent cache %s: %s", self.path, e)
+            return False, None
+
+    def _put(self, key, function_name, value, ttl):
+        now = time.time()
+        try:
+            data = pickle.dumps(value)
+            with self._lock:
+                connection = self._get_connection()
+                connection.execute(
+                    "INSERT OR REPLACE INTO entries (key, function, value, expires_at, last_access) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, function_name, data, now + ttl, now),
+                )
+                connection.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+                connection.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY last_access DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+        except (sqlite3.Error, pickle.PicklingError, TypeError, AttributeError) as e:
+            LOGGER.debug("Unable to write to persistent cache %s: %s", self.path, e)
+
+
+def _get_persistent_cache_scope():
+    """Return the version, region and account the persistent cache entries must be scoped to."""
+    from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
+    from pcluster.utils import get_installed_version  # pylint: disable=import-outside-toplevel
+
+    return get_installed_version(), get_region(), AWSApi.instance().sts.get_account_id()
+
+
 def get_region():
     """Get region used internally for all the AWS calls."""
-    region = boto3.session.Session().region_name
+    from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
+
+    # The region is set in the environment by all the entry points, there is no need to resolve it with a new session,
+    # unless the calls are scoped to a different region
+    region = AWSApi.scoped_region() or os.environ.get("AWS_DEFAULT_REGION") or _get_session().region_name
     if region is None:
         raise AWSClientError("get_region", "AWS region not configured")
     return region
@@ -10,6 +10,7 @@
 # limitations under the License.
 import itertools
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, List, Tuple
 
@@ -17,7 +18,15 @@ from botocore.exceptions import ClientError
 
 from pcluster import utils
 from pcluster.aws.aws_resources import CapacityReservationInfo, ImageInfo, InstanceTypeInfo
-from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client, Cache, ImageNotFoundError, get_region
+from pcluster.aws.common import (
+    AWSClientError,
+    AWSExceptionHandler,
+    Boto3Client,
+    Cache,
+    CacheScope,
+    ImageNotFoundError,
+    get_region,
+)
 from pcluster.constants import (
     IMAGE_NAME_PART_TO_OS_MAP,
     IMAGEBUILDER_ARN_TAG,
@@ -25,8 +34,21 @@ from pcluster.constants import (
     OS_TO_IMAGE_NAME_PART_MAP,
     PCLUSTER_IMAGE_BUILD_STATUS_TAG,
     PCLUSTER_IMAGE_ID_TAG,
+    PERSISTENT_CACHE_TTL_INSTANCE_TYPES,
+    PERSISTENT_CACHE_TTL_OFFICIAL_IMAGES,
+    PERSISTENT_CACHE_TTL_SUBNETS,
+    PROCESS_CACHE_TTL_INSTANCE_TYPES,
+    PROCESS_CACHE_TTL_OFFICIAL_IMAGES,
+)
+from pcluster.utils import get_chunks, get_partition
+
+# Maximum number of instance types accepted by a single DescribeInstanceTypes call
+DESCRIBE_INSTANCE_TYPES_MAX_INSTANCE_TYPES = 100
+
+# DescribeInstanceTypes data by region and instance type, shared by all the clients of the process
+_INSTANCE_TYPES_CACHE = Cache.create(
+    "Ec2Client.describe_instance_types", ttl=PROCESS_CACHE_TTL_INSTANCE_TYPES, scope=CacheScope.PROCESS
 )
-from pcluster.utils import get_partition
 
 
 class Ec2Client(Boto3Client):
@@ -56,7 +78,11 @@ class Ec2Client(Boto3Client):
         return list(self._paginate_results(self._client.describe_instance_type_offerings, **kwargs))
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(
+        ttl=PROCESS_CACHE_TTL_INSTANCE_TYPES,
+        persistent_ttl=PERSISTENT_CACHE_TTL_INSTANCE_TYPES,
+        scope=CacheScope.PROCESS,
+    )
     def get_default_instance_type(self):
         """If current region support free tier, return the free tier instance type. Otherwise, return t3.micro."""
         kwargs = {
@@ -111,7 +137,7 @@ class Ec2Client(Boto3Client):
         return result
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=PERSISTENT_CACHE_TTL_SUBNETS)
     def get_subnet_avail_zone(self, subnet_id):
         """Return the availability zone associated to the given subnet."""
         subnets = self.describe_subnets([subnet_id])
@@ -124,7 +150,7 @@ class Ec2Client(Boto3Client):
         return {subnet_id: self.get_subnet_avail_zone(subnet_id) for subnet_id in subnet_ids}
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=PERSISTENT_CACHE_TTL_SUBNETS)
     def get_subnet_vpc(self, subnet_id):
         """Return a vpc associated to the given subnet."""
         subnets = self.describe_subnets([subnet_id])
@@ -133,7 +159,7 @@ class Ec2Client(Boto3Client):
         raise AWSClientError(function_name="describe_subnets", message=f"Subnet {subnet_id} not found")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(persistent_ttl=PERSISTENT_CACHE_TTL_SUBNETS)
     def get_subnet_cidr(self, subnet_id):
         """Return cidr block  of the given subnet."""
         subnets = self.describe_subnets([subnet_id])
@@ -285,10 +311,58 @@ class Ec2Client(Boto3Client):
     def get_instance_type_info(self, instance_type):
         """Return the results of calling EC2's DescribeInstanceTypes API for the given instance type."""
         return InstanceTypeInfo(
-            self.additional_instance_types_data.get(instance_type)
-            or self._client.describe_instance_types(InstanceTypes=[instance_type]).get("InstanceTypes")[0]
+            self.additional_instance_types_data.get(instance_type) or self._describe_instance_type(instance_type)
         )
 
+    @Cache.cached(
+        ttl=PROCESS_CACHE_TTL_INSTANCE_TYPES,
+        persistent_ttl=PERSISTENT_CACHE_TTL_INSTANCE_TYPES,
+        scope=CacheScope.PROCESS,
+    )
+    def _describe_instance_type(self, instance_type):
+        """Return the raw DescribeInstanceTypes data for the given instance type."""
+        return self.describe_instance_types([instance_type])[0]
+
+    @AWSExceptionHandler.handle_client_exception
+    def describe_instance_types(self, instance_types: List[str], max_workers: int = 1) -> List[dict]:
+        """
+        Return the DescribeInstanceTypes data for the given instance types.
+
+        Instance types already described in the region are served from the cache, the others are described in batches
+        of 100 instance types per call. When max_workers is greater than 1, batches are described concurrently.
+        """
+        region = get_region()
+        cache_enabled = Cache.is_enabled()
+        instance_types_data = {}
+        for instance_type in dict.fromkeys(instance_types) if cache_enabled else []:
+            found, instance_type_data = _INSTANCE_TYPES_CACHE.get((region, instance_type))
+            if found:
+                instance_types_data[instance_type] = instance_type_data
+        missed_instance_types = [
+            instance_type for instance_type in dict.fromkeys(instance_types) if instance_type not in instance_types_data
+        ]
+        if missed_instance_types:
+            chunks = list(get_chunks(missed_instance_types, DESCRIBE_INSTANCE_TYPES_MAX_INSTANCE_TYPES))
+            if max_workers > 1 and len(chunks) > 1:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+                    responses = list(executor.map(self._describe_instance_types_chunk, chunks))
+            else:
+                responses = [self._describe_instance_types_chunk(chunk) for chunk in chunks]
+            for instance_type_data in itertools.chain.from_iterable(responses):
+                instance_types_data[instance_type_data.get("InstanceType")] = instance_type_data
+                if cache_enabled:
+                    _INSTANCE_TYPES_CACHE.put((region, instance_type_data.get("InstanceType")), instance_type_data)
+        return [
+            instance_types_data[instance_type]
+            for instance_type in instance_types
+            if instance_type in instance_types_data
+        ]
+
+    def _describe_instance_types_chunk(self, instance_types):
+        return list(self._paginate_results(self._client.describe_instance_types, InstanceTypes=instance_types))
+
+    # Request scoped, unlike the other instance type data, since it depends on the instance types data of the config.
+    # The DescribeInstanceTypes data it is computed from are kept across requests anyway.
     @AWSExceptionHandler.handle_client_exception
     @Cache.cached
     def get_supported_architectures(self, instance_type):
@@ -304,7 +378,11 @@ class Ec2Client(Boto3Client):
         return max(images, key=lambda image: ("0" if self._is_image_deprecated(image) else "1") + image["CreationDate"])
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(
+        ttl=PROCESS_CACHE_TTL_OFFICIAL_IMAGES,
+        persistent_ttl=PERSISTENT_CACHE_TTL_OFFICIAL_IMAGES,
+        scope=CacheScope.PROCESS,
+    )
     def get_official_image_id(self, os, architecture, filters=None):
         """Return the id of the current official image, for the provided os-architecture combination."""
         owner = filters.owner if filters and filters.owner else "amazon"
@@ -318,7 +396,11 @@ class Ec2Client(Boto3Client):
         return self._find_valid_official_image(images).get("ImageId")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(
+        ttl=PROCESS_CACHE_TTL_OFFICIAL_IMAGES,
+        persistent_ttl=PERSISTENT_CACHE_TTL_OFFICIAL_IMAGES,
+        scope=CacheScope.PROCESS,
+    )
     def get_official_images(self, os=None, architecture=None):
         """Get the list of official images, optionally filtered by os and architecture."""
         owners = ["amazon"]
@@ -382,7 +464,11 @@ class Ec2Client(Boto3Client):
         return instances, response.get("NextToken")
 
     @AWSExceptionHandler.handle_client_exception
-    @Cache.cached
+    @Cache.cached(
+        ttl=PROCESS_CACHE_TTL_INSTANCE_TYPES,
+        persistent_ttl=PERSISTENT_CACHE_TTL_INSTANCE_TYPES,
+        scope=CacheScope.PROCESS,
+    )
     def get_supported_az_for_instance_type(self, instance_type: str):
         """
         Return a tuple of availability zones that have the instance_type.
@@ -40,6 +40,11 @@ class ElbClient(Boto3Client):
         response = self._client.describe_load_balancers(**describe_load_balancers_kwargs)
         return response["LoadBalancers"], response.get("NextMarker")
 
+    @AWSExceptionHandler.handle_client_exception
+    def describe_load_balancers(self, load_balancer_arns: List[str]):
+        """Retrieve the load balancers with the given arns, up to 20 in a single call."""
+        return self._client.describe_load_balancers(LoadBalancerArns=load_balancer_arns).get("LoadBalancers")
+
     @AWSExceptionHandler.handle_client_exception
     def describe_tags(self, load_balancer_arns: []):
         """Retrieve a list of tags associated to the load balancer arns provided as parameter."""
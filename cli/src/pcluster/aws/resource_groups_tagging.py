@@ -0,0 +1,33 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+from typing import List, Tuple
+
+from pcluster.aws.common import AWSExceptionHandler, Boto3Client, Cache
+from pcluster.constants import LIST_STACKS_CACHE_TTL
+
+
+class ResourceGroupsTaggingClient(Boto3Client):
+    """Implement Resource Groups Tagging Boto3 client."""
+
+    def __init__(self):
+        super().__init__("resourcegroupstaggingapi")
+
+    @AWSExceptionHandler.handle_client_exception
+    @Cache.cached(ttl=LIST_STACKS_CACHE_TTL)
+    def get_stack_arns_with_tag(self, tag_key: str, next_token: str = None) -> Tuple[List[str], str]:
+        """Return a page of ARNs of the CloudFormation stacks having the given tag key and the token of the next one."""
+        get_resources_kwargs = {"TagFilters": [{"Key": tag_key}], "ResourceTypeFilters": ["cloudformation:stack"]}
+        if next_token:
+            get_resources_kwargs["PaginationToken"] = next_token
+        response = self._client.get_resources(**get_resources_kwargs)
+        stack_arns = [resource["ResourceARN"] for resource in response.get("ResourceTagMappingList", [])]
+        # An empty PaginationToken means there are no more pages
+        return stack_arns, response.get("PaginationToken") or None
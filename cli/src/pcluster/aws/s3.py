@@ -10,7 +10,7 @@
 # limitations under the License.
 from botocore.exceptions import ClientError
 
-from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client
+from pcluster.aws.common import AWSClientError, AWSExceptionHandler, Boto3Client, Cache
 
 
 class S3Client(Boto3Client):
@@ -70,6 +70,7 @@ class S3Client(Boto3Client):
         """Return true if bucket versioning is enabled."""
         return self._client.get_bucket_versioning(Bucket=bucket_name).get("Status")
 
+    @Cache.cached
     def get_bucket_region(self, bucket_name):
         """Return bucket region."""
         try:
@@ -123,6 +124,30 @@ class S3Client(Boto3Client):
         """Upload file to S3 bucket."""
         self._client.upload_file(Filename=file_path, Bucket=bucket_name, Key=key)
 
+    @AWSExceptionHandler.handle_client_exception
+    def create_multipart_upload(self, bucket_name, key):
+        """Initiate a multipart upload and return its id."""
+        return self._client.create_multipart_upload(Bucket=bucket_name, Key=key)["UploadId"]
+
+    @AWSExceptionHandler.handle_client_exception
+    def upload_part(self, bucket_name, key, upload_id, part_number, body):
+        """Upload a part of a multipart upload and return its ETag."""
+        return self._client.upload_part(
+            Bucket=bucket_name, Key=key, UploadId=upload_id, PartNumber=part_number, Body=body
+        )["ETag"]
+
+    @AWSExceptionHandler.handle_client_exception
+    def complete_multipart_upload(self, bucket_name, key, upload_id, parts):
+        """Complete a multipart upload by assembling the given parts, in the form [{"ETag": ..., "PartNumber": ...}]."""
+        self._client.complete_multipart_upload(
+            Bucket=bucket_name, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+        )
+
+    @AWSExceptionHandler.handle_client_exception
+    def abort_multipart_upload(self, bucket_name, key, upload_id):
+        """Abort a multipart upload, deleting the parts already uploaded."""
+        self._client.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload_id)
+
     @AWSExceptionHandler.handle_client_exception
     def create_presigned_url(self, bucket_name, object_name, version_id=None, expiration=3600):
         """Generate a pre-signed URL to share an S3 object."""
@@ -16,7 +16,6 @@ from argparse import ArgumentParser, ArgumentTypeError, Namespace
 from pcluster import utils
 from pcluster.cli.commands.common import CliCommand, ExportLogsCommand
 from pcluster.constants import PCLUSTER_BUCKET_PROTECTED_PREFIX
-from pcluster.models.cluster import Cluster
 
 LOGGER = logging.getLogger(__name__)
 
@@ -87,6 +86,8 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
     @staticmethod
     def _export_cluster_logs(args: Namespace, output_file: str = None):
         """Export the logs associated to the cluster."""
+        from pcluster.models.cluster import Cluster
+
         LOGGER.debug("Beginning export of logs for the cluster: %s", args.cluster_name)
         cluster = Cluster(args.cluster_name)
         url = cluster.export_logs(
@@ -94,6 +95,7 @@ class ExportClusterLogsCommand(ExportLogsCommand, CliCommand):
             bucket=args.bucket if args.bucket else cluster.bucket.name,
             bucket_prefix=args.bucket_prefix,
             keep_s3_objects=args.keep_s3_objects,
+            direct_export=args.direct_export,
             start_time=args.start_time,
             end_time=args.end_time,
             filters=args.filters,
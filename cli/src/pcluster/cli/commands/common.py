@@ -112,6 +112,16 @@ class ExportLogsCommand:
             default=False,
             help="Keep the exported objects exports to S3. (Defaults to 'false'.)",
         )
+        parser.add_argument(
+            "--direct-export",
+            type=partial(to_bool, "direct-export"),
+            default=False,
+            help=(
+                "Read the log streams in parallel instead of exporting them to S3 through CloudWatch Logs export "
+                "tasks. The bucket is used only to upload the archive when --output-file is not specified. "
+                "(Defaults to 'false'.)"
+            ),
+        )
         # Filters
         parser.add_argument(
             "--start-time",
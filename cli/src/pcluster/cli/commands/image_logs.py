@@ -13,11 +13,9 @@ from typing import List
 from argparse import ArgumentParser, Namespace
 
 from pcluster import utils
-from pcluster.api.controllers.common import assert_supported_operation
 from pcluster.aws.common import get_region
 from pcluster.cli.commands.common import CliCommand, ExportLogsCommand
 from pcluster.constants import PCLUSTER_BUCKET_PROTECTED_PREFIX, Operation
-from pcluster.models.imagebuilder import ImageBuilder
 
 LOGGER = logging.getLogger(__name__)
 
@@ -58,6 +56,8 @@ class ExportImageLogsCommand(ExportLogsCommand, CliCommand):
         )
 
     def execute(self, args: Namespace, extra_args: List[str]) -> None:  # noqa: D102 #pylint: disable=unused-argument
+        from pcluster.api.controllers.common import assert_supported_operation
+
         assert_supported_operation(operation=Operation.EXPORT_IMAGE_LOGS, region=args.region or get_region())
         try:
             if args.output_file:
@@ -79,6 +79,8 @@ class ExportImageLogsCommand(ExportLogsCommand, CliCommand):
     @staticmethod
     def _export_image_logs(args: Namespace, output_file: str = None):
         """Export the logs associated to the image."""
+        from pcluster.models.imagebuilder import ImageBuilder
+
         LOGGER.debug("Beginning export of logs for the image: %s", args.image_id)
 
         # retrieve imagebuilder config and generate model
@@ -88,6 +90,7 @@ class ExportImageLogsCommand(ExportLogsCommand, CliCommand):
             bucket=args.bucket if args.bucket else imagebuilder.bucket.name,
             bucket_prefix=args.bucket_prefix,
             keep_s3_objects=args.keep_s3_objects,
+            direct_export=args.direct_export,
             start_time=args.start_time,
             end_time=args.end_time,
             output_file=output_file,
@@ -28,16 +28,10 @@ os.environ["JSII_SILENCE_WARNING_KNOWN_BROKEN_NODE_VERSION"] = "1"
 os.environ["JSII_SILENCE_WARNING_UNTESTED_NODE_VERSION"] = "1"
 os.environ["JSII_SILENCE_WARNING_DEPRECATED_NODE_VERSION"] = "1"
 
-# Controllers
-import pcluster.api.controllers.cluster_compute_fleet_controller  # noqa: E402
-import pcluster.api.controllers.cluster_instances_controller  # noqa: E402
-import pcluster.api.controllers.cluster_operations_controller  # noqa: E402
-import pcluster.api.controllers.image_operations_controller  # noqa: E402
-import pcluster.api.errors  # noqa: E402
+# API controllers are imported only when an operation is dispatched to them, see pcluster.cli.model.call
 import pcluster.cli.commands.commands as cli_commands  # noqa: E402
 import pcluster.cli.logger as pcluster_logging  # noqa: E402
 import pcluster.cli.model  # noqa: E402
-from pcluster.api import encoder  # noqa: E402
 from pcluster.cli.commands.common import CliCommand, exit_msg, to_bool, to_int, to_number  # noqa: E402
 from pcluster.cli.exceptions import APIOperationException, ParameterException  # noqa: E402
 from pcluster.cli.logger import redirect_stdouterr_to_logger  # noqa: E402
@@ -203,6 +197,17 @@ def add_cli_commands(parser_map):
     add_additional_args(parser_map)
 
 
+def _format_exception(exception):
+    """Format exception messages in the same manner as the api."""
+    # pylint: disable=import-outside-toplevel
+    import pcluster.api.errors
+    from pcluster.api import encoder
+
+    message = pcluster.api.errors.exception_message(exception)
+    error_encoded = encoder.JSONEncoder().encode(message)
+    return APIOperationException(json.loads(error_encoded))
+
+
 def _run_operation(model, args, extra_args):
     if args.operation in model:
         try:
@@ -215,25 +220,20 @@ def _run_operation(model, args, extra_args):
         except ParameterException as e:
             raise e
         except Exception as e:
-            # format exception messages in the same manner as the api
-            message = pcluster.api.errors.exception_message(e)
-            error_encoded = encoder.JSONEncoder().encode(message)
-            raise APIOperationException(json.loads(error_encoded))
+            raise _format_exception(e)
     else:
         try:
             return args.func(args, extra_args)
-        except pcluster.api.errors.ParallelClusterApiException as e:
-            # Format exception messages in the same manner as the api
-            message = pcluster.api.errors.exception_message(e)
-            error_encoded = encoder.JSONEncoder().encode(message)
-            raise APIOperationException(json.loads(error_encoded))
         except Exception as e:
+            from pcluster.api.errors import ParallelClusterApiException  # pylint: disable=import-outside-toplevel
+
+            if isinstance(e, ParallelClusterApiException):
+                raise _format_exception(e)
             raise e
 
 
 def run(sys_args, model=None):
-    spec = pcluster.cli.model.package_spec()
-    model = model or pcluster.cli.model.load_model(spec)
+    model = model or pcluster.cli.model.package_model()
     parser, parser_map = gen_parser(model)
     add_cli_commands(parser_map)
     args, extra_args = parser.parse_known_args(sys_args)
@@ -253,8 +253,9 @@ def run(sys_args, model=None):
         del args.__dict__["debug"]
 
     # TODO: remove this logic from here
-    # set region in the environment to make it available to all the boto3 calls
-    if "region" in args and args.region:
+    # set region in the environment to make it available to all the boto3 calls,
+    # unless multiple regions are given, in which case the operation scopes the calls to each of them
+    if "region" in args and args.region and "," not in args.region:
         os.environ["AWS_DEFAULT_REGION"] = args.region
 
     LOGGER.info("Handling CLI command %s", args.operation)
@@ -11,12 +11,18 @@
 # implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import functools
+import glob
+import hashlib
 import importlib
 import json
+import logging
+import os
+import tempfile
 
 import jmespath
 
-from pcluster.api import encoder, openapi
+from pcluster.api import openapi
+from pcluster.aws.common import PersistentCache
 from pcluster.cli.exceptions import APIOperationException
 from pcluster.utils import to_kebab_case, to_snake_case, yaml_load
 
@@ -26,6 +32,13 @@ try:
 except ImportError:
     import importlib_resources as pkg_resources
 
+LOGGER = logging.getLogger(__name__)
+
+# Version of the format of the compiled model, to be increased when load_model output changes
+COMPILED_MODEL_VERSION = 1
+# Number of compiled models kept in the cache directory, e.g. for the versions of ParallelCluster installed side by side
+COMPILED_MODEL_MAX_FILES = 3
+
 
 def _param_overrides(operation, param):
     """Provide updates to the model that are specific to the CLI."""
@@ -86,10 +99,74 @@ def _resolve_body(spec, operation):
     return new_params
 
 
+def _read_package_spec():
+    with pkg_resources.open_text(openapi, "openapi.yaml") as spec_file:  # pylint: disable=deprecated-method
+        return spec_file.read()
+
+
 def package_spec():
     """Load the OpenAPI specification from the package."""
-    with pkg_resources.open_text(openapi, "openapi.yaml") as spec_file:  # pylint: disable=deprecated-method
-        return yaml_load(spec_file.read())
+    return yaml_load(_read_package_spec())
+
+
+def _is_compiled_model_cache_enabled():
+    return os.environ.get("PCLUSTER_CLI_MODEL_CACHE_DISABLED", "").lower() not in ["true", "1", "yes"]
+
+
+def _compiled_model_path(spec_text):
+    spec_hash = hashlib.sha256(f"{COMPILED_MODEL_VERSION}:{spec_text}".encode("utf-8")).hexdigest()[:16]
+    return os.path.join(PersistentCache.get_cache_dir(), f"cli-model-{spec_hash}.json")
+
+
+def _store_compiled_model(model_path, model):
+    """
+    Write the compiled model atomically, keeping only the COMPILED_MODEL_MAX_FILES most recent ones.
+
+    The models compiled from other versions of the spec are kept as well, so that the versions of ParallelCluster
+    installed side by side do not recompile their model at every run.
+    """
+    try:
+        model_dir = os.path.dirname(model_path)
+        os.makedirs(model_dir, mode=0o700, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=model_dir, suffix=".tmp", delete=False, encoding="utf-8") as tmp:
+            try:
+                json.dump(model, tmp)
+            except (TypeError, ValueError):
+                tmp.close()
+                os.remove(tmp.name)
+                raise
+        os.replace(tmp.name, model_path)
+        model_paths = sorted(glob.glob(os.path.join(model_dir, "cli-model-*.json")), key=os.path.getmtime, reverse=True)
+        for stale_model_path in model_paths[COMPILED_MODEL_MAX_FILES:]:
+            if stale_model_path != model_path:
+                os.remove(stale_model_path)
+    except (OSError, TypeError, ValueError) as e:
+        LOGGER.debug("Unable to store the compiled CLI model to %s: %s", model_path, e)
+
+
+def package_model():
+    """
+    Return the model of the OpenAPI specification of the package.
+
+    Parsing the specification takes a significant part of the CLI startup time, hence the model is compiled at
+    the first run and stored as JSON in the ParallelCluster cache directory, keyed by the hash of the specification.
+    Unlike the opt-in persistent cache, the compiled model is stored by default. Setting
+    PCLUSTER_CLI_MODEL_CACHE_DISABLED compiles it at every run without writing anything to disk.
+    """
+    spec_text = _read_package_spec()
+    if not _is_compiled_model_cache_enabled():
+        return load_model(yaml_load(spec_text))
+
+    model_path = _compiled_model_path(spec_text)
+    try:
+        with open(model_path, encoding="utf-8") as model_file:
+            return json.load(model_file)
+    except (OSError, ValueError) as e:
+        LOGGER.debug("Compiling the CLI model, unable to read %s: %s", model_path, e)
+
+    model = load_model(yaml_load(spec_text))
+    _store_compiled_model(model_path, model)
+    return model
 
 
 def load_model(spec):
@@ -206,6 +283,8 @@ def call(func_str, *args, **kwargs):
     tuple (instead of an object). Also uses the flask json-ifier to ensure data
     is converted the same as the API.
     """
+    from pcluster.api import encoder  # pylint: disable=import-outside-toplevel
+
     query = kwargs.pop("query", None)
     func = get_function_from_name(func_str)
     ret = func(*args, **kwargs)
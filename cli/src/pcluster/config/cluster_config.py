@@ -49,6 +49,7 @@ from pcluster.constants import (
     EBS_VOLUME_TYPE_DEFAULT,
     EBS_VOLUME_TYPE_IOPS_DEFAULT,
     FILECACHE,
+    INSTANCE_TYPES_PREFETCH_MAX_WORKERS,
     LUSTRE,
     MAX_COMPUTE_RESOURCES_PER_QUEUE,
     MAX_EBS_COUNT,
@@ -2088,6 +2089,30 @@ class BaseClusterConfig(Resource):
         """Get instance type infos for all instance types used in the configuration file."""
         return {}
 
+    @property
+    def referenced_instance_types(self) -> List[str]:
+        """Return the instance types referenced in the configuration file."""
+        instance_types = [self.head_node.instance_type]
+        for queue in self.scheduling.queues:
+            for compute_resource in queue.compute_resources:
+                instance_types.extend(compute_resource.instance_types)
+        return list(dict.fromkeys(instance_types))
+
+    def prefetch_instance_types_info(self):
+        """
+        Describe all the instance types referenced in the configuration file with batched calls.
+
+        Subsequent instance type info lookups performed by validators and template builders are served from the
+        cache. If AWSClientError happens (e.g. an instance type does not exist) the error is ignored since it will be
+        reported by the validators describing the single instance types.
+        """
+        try:
+            AWSApi.instance().ec2.describe_instance_types(
+                self.referenced_instance_types, max_workers=INSTANCE_TYPES_PREFETCH_MAX_WORKERS
+            )
+        except AWSClientError:
+            logging.warning("Unable to cache describe_instance_types results for all instance types.")
+
 
 class AwsBatchComputeResource(BaseComputeResource):
     """Represent the AwsBatch Compute Resource."""
@@ -2193,6 +2218,11 @@ class AwsBatchClusterConfig(BaseClusterConfig):
         """Return scheduler specific resources."""
         return pkg_resources.resource_filename(__name__, "../resources/batch")
 
+    @property
+    def referenced_instance_types(self) -> List[str]:
+        """Return the instance types referenced in the configuration file, excluding families and optimal."""
+        return [instance_type for instance_type in super().referenced_instance_types if "." in instance_type]
+
 
 class _BaseSlurmComputeResource(BaseComputeResource):
     """Represent the Slurm Compute Resource."""
@@ -2923,6 +2953,14 @@ class SlurmClusterConfig(BaseClusterConfig):
         except AWSClientError:
             logging.warning("Unable to cache describe_capacity_reservations results for all capacity reservation ids.")
 
+    @property
+    def referenced_instance_types(self) -> List[str]:
+        """Return the instance types referenced in the configuration file, including the login nodes ones."""
+        instance_types = super().referenced_instance_types
+        if self.login_nodes:
+            instance_types.extend(pool.instance_type for pool in self.login_nodes.pools)
+        return list(dict.fromkeys(instance_types))
+
     def get_instance_types_data(self):
         """Get instance type infos for all instance types used in the configuration file."""
         result = {}
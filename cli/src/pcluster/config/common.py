@@ -16,18 +16,41 @@ import asyncio
 import itertools
 import json
 import logging
+import os
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import wait
 from enum import Enum
 from typing import List, Set
 
+from pcluster.constants import VALIDATION_MAX_WORKERS_DEFAULT
+from pcluster.utils import DaemonThreadPool
 from pcluster.validators.common import AsyncValidator, FailureLevel, ValidationResult, Validator, ValidatorContext
 from pcluster.validators.iam_validators import AdditionalIamPolicyValidator
 from pcluster.validators.networking_validators import LambdaFunctionsVpcConfigValidator
+from pcluster.validators.profiler import ValidationProfiler
 from pcluster.validators.s3_validators import UrlValidator
 
 LOGGER = logging.getLogger(__name__)
 
 
+def get_validation_max_workers() -> int:
+    """Return the max number of sync validators executed concurrently."""
+    return int(os.environ.get("PCLUSTER_VALIDATION_MAX_WORKERS", VALIDATION_MAX_WORKERS_DEFAULT))
+
+
+def get_validation_timeout():
+    """Return the overall validation timeout in seconds, or None if validation can take an unbounded time."""
+    timeout = os.environ.get("PCLUSTER_VALIDATION_TIMEOUT")
+    return float(timeout) if timeout else None
+
+
+def _timed_out_validation_result(validator):
+    return ValidationResult(
+        f"Validation did not complete within {get_validation_timeout()} seconds.", FailureLevel.WARNING, validator.type
+    )
+
+
 class CapacityType(Enum):
     """Enum to identify the type compute supported by the queues."""
 
@@ -133,7 +156,9 @@ class Resource:
     def __init__(self, implied: bool = False):
         # Parameters registry
         self.__params = {}
+        self._pending_validators = []
         self._validation_futures = []
+        self._validation_path = type(self).__name__
         self._validation_failures: List[ValidationResult] = []
         self._validators: List = []
         self.implied = implied
@@ -200,26 +225,88 @@ class Resource:
 
     @staticmethod
     def _validator_execute_async(validator_args, validator):
-        return validator.execute_async(**validator_args)
+        return validator, validator.execute_async(**validator_args)
 
-    def _await_async_validators(self):
-        # here could be a good spot to add a cascading timeout for the async validators
-        # if they are taking too long to execute for a resource and its children since the use of
-        # get_async_timed_validator_type_for allows to decorate only on single validator at a time and
-        # does not cascade to child resources
-        return list(
-            itertools.chain.from_iterable(
-                asyncio.get_event_loop().run_until_complete(asyncio.gather(*self._validation_futures))
+    @staticmethod
+    def _validator_execute_profiled(validator_args, validator, resource_path, profiler: ValidationProfiler = None):
+        if not profiler:
+            return Resource._validator_execute_sync(validator_args, validator)
+        with profiler.profile(validator.type, resource_path):
+            return Resource._validator_execute_sync(validator_args, validator)
+
+    def _execute_validators(self, deadline: float = None, profiler: ValidationProfiler = None):
+        """
+        Execute the validators registered by the resource and its children.
+
+        With more than one worker, validators run on a thread pool while the async validators are awaited on the
+        event loop; otherwise they are executed serially in the calling thread.
+        Returns the results of the sync validators and of the async ones, each in registration order.
+        """
+        max_workers = get_validation_max_workers()
+        if max_workers <= 1 or not self._pending_validators:
+            failures = [
+                failure
+                for validator_args, validator, resource_path in self._pending_validators
+                for failure in self._validator_execute_profiled(validator_args, validator, resource_path, profiler)
+            ]
+            return failures, self._await_async_validators(deadline, profiler)
+
+        executor = DaemonThreadPool(
+            max_workers=min(max_workers, len(self._pending_validators)), thread_name_prefix="pcluster-validator"
+        )
+        try:
+            futures = [
+                (
+                    validator,
+                    executor.submit(
+                        self._validator_execute_profiled, validator_args, validator, resource_path, profiler
+                    ),
+                )
+                for validator_args, validator, resource_path in self._pending_validators
+            ]
+            async_failures = self._await_async_validators(deadline, profiler)
+            wait(
+                [future for _, future in futures],
+                timeout=max(deadline - time.monotonic(), 0) if deadline else None,
             )
+            failures = []
+            for validator, future in futures:
+                failures.extend(future.result() if future.done() else [_timed_out_validation_result(validator)])
+            return failures, async_failures
+        finally:
+            # Do not wait for validators that exceeded the deadline, their threads do not keep the process alive
+            executor.shutdown()
+
+    def _await_async_validators(self, deadline: float = None, profiler: ValidationProfiler = None):
+        # The deadline cascades to the async validators of the resource and of its children: the validators still
+        # pending when it expires are reported as timed out, without discarding the results of the others.
+        async def _await_until_deadline(validator, future):
+            try:
+                return await asyncio.wait_for(future, timeout=max(deadline - time.monotonic(), 0))
+            except asyncio.TimeoutError:
+                return [_timed_out_validation_result(validator)]
+
+        futures = []
+        for validator, future, resource_path in self._validation_futures:
+            if profiler:
+                future = profiler.profile_async(validator.type, resource_path, future)
+            futures.append(_await_until_deadline(validator, future) if deadline else future)
+        return list(
+            itertools.chain.from_iterable(asyncio.get_event_loop().run_until_complete(asyncio.gather(*futures)))
         )
 
     def _nested_resources(self):
+        """Return the nested resources along with their path, e.g. scheduling.queues[queue1]."""
         nested_resources = []
-        for _, value in self.__dict__.items():
+        for key, value in self.__dict__.items():
             if isinstance(value, Resource):
-                nested_resources.append(value)
+                nested_resources.append((f"{self._validation_path}.{key}", value))
             if isinstance(value, list) and value:
-                nested_resources.extend(item for item in value if isinstance(item, Resource))
+                nested_resources.extend(
+                    (f"{self._validation_path}.{key}[{getattr(item, 'name', None) or index}]", item)
+                    for index, item in enumerate(value)
+                    if isinstance(item, Resource)
+                )
         return nested_resources
 
     def validate(
@@ -228,12 +315,16 @@ class Resource:
         """
         Execute registered validators.
 
+        Validators of the resource and of its nested resources are registered first and then executed concurrently:
+        sync validators on a pool of PCLUSTER_VALIDATION_MAX_WORKERS threads and async validators on the event loop.
+        When PCLUSTER_VALIDATION_TIMEOUT is set, validators still running after that number of seconds are reported
+        as timed out. When PCLUSTER_VALIDATION_PROFILE is set, a report of the validators executions is printed
+        at the end of the validation (see ValidationProfiler).
+
         The "nested" parameter is used only for internal recursive calls to distinguish those from the top level
-        one where the async validators results should be awaited for.
+        one where the validators are executed and their results awaited for.
         """
-        # this validation logic is a responsibility that could be completely separated from the resource tree
-        # also until we need to support both sync and async validation this logic will be unnecessarily complex
-        # embracing async validation completely is possible and will greatly simplify this
+        self._pending_validators.clear()
         self._validation_futures.clear()
         self._validation_failures.clear()
 
@@ -242,20 +333,30 @@ class Resource:
             self._validate_self(context, suppressors)
         finally:
             if nested:
-                result = self._validation_failures, self._validation_futures.copy()
+                result = self._pending_validators.copy(), self._validation_futures.copy()
             else:
-                self._validation_failures.extend(self._await_async_validators())
+                timeout = get_validation_timeout()
+                profiler = ValidationProfiler.from_environment()
+                sync_failures, async_failures = self._execute_validators(
+                    time.monotonic() + timeout if timeout else None, profiler
+                )
+                self._validation_failures.extend(sync_failures)
+                self._validation_failures.extend(async_failures)
                 result = self._validation_failures
+                if profiler:
+                    profiler.print_report()
+            self._pending_validators.clear()
             self._validation_futures.clear()
 
         return result
 
     def _validate_nested_resources(self, context, suppressors):
-        # Call validators for nested resources
-        for nested_resource in self._nested_resources():
-            failures, futures = nested_resource.validate(suppressors, context, nested=True)
+        # Collect validators of nested resources
+        for resource_path, nested_resource in self._nested_resources():
+            nested_resource._validation_path = resource_path
+            pending_validators, futures = nested_resource.validate(suppressors, context, nested=True)
+            self._pending_validators.extend(pending_validators)
             self._validation_futures.extend(futures)
-            self._validation_failures.extend(failures)
 
     def _validate_self(self, context, suppressors):
         self._validators.clear()
@@ -264,11 +365,11 @@ class Resource:
             if issubclass(validator[0], AsyncValidator):
                 result = self._validator_execute(*validator, suppressors, self._validator_execute_async)
                 if result:
-                    self._validation_futures.extend([result])
+                    self._validation_futures.append((*result, self._validation_path))
             else:
-                self._validation_failures.extend(
-                    self._validator_execute(*validator, suppressors, self._validator_execute_sync) or []
-                )
+                result = self._validator_execute(*validator, suppressors, lambda args, instance: (args, instance))
+                if result:
+                    self._pending_validators.append((*result, self._validation_path))
 
     def _register_validators(self, context: ValidatorContext = None):
         """
@@ -13,8 +13,10 @@ import logging
 import re
 import sys
 from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
+from pcluster.aws.common import AWSClientError
 from pcluster.config.update_policy import UpdatePolicy
 from pcluster.schemas.cluster_schema import ClusterSchema
 from pcluster.schemas.common_schema import BaseSchema
@@ -30,6 +32,62 @@ if sys.version_info <= (3, 7):
 
 LOGGER = logging.getLogger(__name__)
 
+# Cluster methods retrieving the runtime state needed by the condition checker of each update policy
+_CLUSTER_STATE_PROBES = {
+    "AWSBATCH_CE_MAX_RESIZE": ["get_running_capacity"],
+    "QUEUE_UPDATE_STRATEGY": ["has_running_capacity"],
+    "RESIZE_UPDATE_STRATEGY_ON_REMOVE": ["has_running_capacity"],
+    "MANAGED_PLACEMENT_GROUP": ["has_running_capacity"],
+    "SHARED_STORAGE_UPDATE_POLICY": ["has_running_capacity", "has_running_login_nodes"],
+    "COMPUTE_FLEET_STOP_ON_REMOVE": ["has_running_capacity"],
+    "COMPUTE_FLEET_STOP": ["has_running_capacity"],
+    "MANAGED_FSX": ["has_running_capacity"],
+    "LOGIN_NODES_POOLS_UPDATE_POLICY": ["has_running_login_nodes"],
+    "LOGIN_NODES_STOP": ["has_running_login_nodes"],
+    "LOGIN_NODES_POOL_STOP": ["has_running_login_nodes"],
+    "COMPUTE_AND_LOGIN_NODES_STOP": ["has_running_capacity", "has_running_login_nodes"],
+}
+
+
+class ConfigIndex:
+    """
+    Name-keyed index of the queues and compute resources of a cluster configuration.
+
+    Queues are indexed by (queue_type, queue_name), e.g. ("SlurmQueues", "queue1"), and compute resources by
+    (queue_type, queue_name, compute_resource_type, compute_resource_name), matching the segments of a change path.
+    """
+
+    def __init__(self, config: dict):
+        self.queues = {}
+        self.compute_resources = {}
+        scheduling = (config or {}).get("Scheduling") or {}
+        for queue_type, queues in scheduling.items():
+            if not queue_type.endswith("Queues") or not isinstance(queues, list):
+                continue
+            for queue in queues:
+                queue_name = queue.get("Name")
+                self.queues.setdefault((queue_type, queue_name), queue)
+                for compute_resource_type, compute_resources in queue.items():
+                    if not compute_resource_type.endswith("ComputeResources") or not isinstance(
+                        compute_resources, list
+                    ):
+                        continue
+                    for compute_resource in compute_resources:
+                        self.compute_resources.setdefault(
+                            (queue_type, queue_name, compute_resource_type, compute_resource.get("Name")),
+                            compute_resource,
+                        )
+
+    def get_queue(self, queue_key):
+        """Return the queue identified by the given (queue_type, queue_name) key, or an empty dict."""
+        return self.queues.get(queue_key, {}) if queue_key else {}
+
+    def get_compute_resource(self, queue_key, compute_resource_key):
+        """Return the compute resource identified by the given queue and compute resource keys, or an empty dict."""
+        if not queue_key or not compute_resource_key:
+            return {}
+        return self.compute_resources.get((*queue_key, *compute_resource_key), {})
+
 
 class ConfigPatch:
     """
@@ -67,6 +125,10 @@ class ConfigPatch:
         self.base_config = copy.deepcopy(base_config)
         self.target_config = copy.deepcopy(target_config)
 
+        # Name-keyed indexes of the queues and compute resources, to let update policies resolve them in O(1)
+        self.base_index = ConfigIndex(self.base_config)
+        self.target_index = ConfigIndex(self.target_config)
+
         self.cluster_schema = ClusterSchema(cluster_name=cluster.name)
         self.changes = []
         self._compare()
@@ -169,9 +231,7 @@ class ConfigPatch:
 
     def _compare_nested_section(self, param_path, data_key, base_value, target_value, field_obj):
         # Compare nested sections and params
-        nested_path = copy.deepcopy(param_path)
-        nested_path.append(data_key)
-        self._compare_section(base_value, target_value, field_obj.schema, nested_path)
+        self._compare_section(base_value, target_value, field_obj.schema, [*param_path, data_key])
 
     def _compare_list(self, base_section, target_section, param_path, data_key, field_obj, change_update_policy):
         """
@@ -181,23 +241,22 @@ class ConfigPatch:
         """
         update_key = field_obj.metadata.get("update_key")
 
-        # Compare items in the list by searching the right item to compare through update_key value
+        base_nested_sections = base_section.get(data_key, []) if base_section else []
+        # Index base items by update_key value, keeping the first one in case of duplicates
+        base_nested_sections_by_key = {}
+        for base_nested_section in base_nested_sections:
+            base_nested_sections_by_key.setdefault(base_nested_section.get(update_key), base_nested_section)
+
+        # Compare items in the list by looking up the right item to compare through update_key value
         # First, compare all sections from target vs base config and mark visited base sections.
+        visited_sections = set()
         for target_nested_section in target_section.get(data_key, []):
             update_key_value = target_nested_section.get(update_key)
-            base_nested_section = next(
-                (
-                    nested_section
-                    for nested_section in base_section.get(data_key, [])
-                    if nested_section.get(update_key) == update_key_value
-                ),
-                None,
-            )
+            base_nested_section = base_nested_sections_by_key.get(update_key_value)
             if base_nested_section:
-                nested_path = copy.deepcopy(param_path)
-                nested_path.append(f"{data_key}[{update_key_value}]")
+                nested_path = [*param_path, f"{data_key}[{update_key_value}]"]
                 self._compare_section(base_nested_section, target_nested_section, field_obj.schema, nested_path)
-                base_nested_section["visited"] = True
+                visited_sections.add(id(base_nested_section))
             else:
                 self.changes.append(
                     Change(
@@ -210,19 +269,18 @@ class ConfigPatch:
                     )
                 )
         # Then, compare all non visited base sections vs target config.
-        if base_section:
-            for base_nested_section in base_section.get(data_key, []):
-                if not base_nested_section.get("visited", False):
-                    self.changes.append(
-                        Change(
-                            param_path,
-                            data_key,
-                            base_nested_section,
-                            None,
-                            change_update_policy,
-                            is_list=True,
-                        )
+        for base_nested_section in base_nested_sections:
+            if id(base_nested_section) not in visited_sections:
+                self.changes.append(
+                    Change(
+                        param_path,
+                        data_key,
+                        base_nested_section,
+                        None,
+                        change_update_policy,
+                        is_list=True,
                     )
+                )
 
     @property
     def update_policy_level(self):
@@ -254,6 +312,7 @@ class ConfigPatch:
         ]
 
         patch_allowed = True
+        self._gather_cluster_state()
 
         for change in self.changes:
             check_result, reason, action_needed, print_change = change.update_policy.check(change, self)
@@ -277,6 +336,35 @@ class ConfigPatch:
 
         return patch_allowed, rows
 
+    def _gather_cluster_state(self):
+        """
+        Retrieve concurrently the runtime state of the cluster probed by the update policies of the patch.
+
+        The compute fleet status and the login nodes status are cached by the cluster, so that all the condition
+        checkers share the same snapshot regardless of the number of changes. Failures are only logged here,
+        the probes are retried and their errors raised by the condition checkers actually needing them.
+        """
+        probe_names = set()
+        for change in self.changes:
+            if change.update_policy.condition_checker and change.update_policy.level > UpdatePolicy.SUPPORTED.level:
+                probe_names.update(_CLUSTER_STATE_PROBES.get(change.update_policy.name, ()))
+        if not probe_names:
+            return
+
+        try:
+            # The probes share the lazily loaded stack, which must not be loaded concurrently by them
+            _ = self.cluster.stack
+        except AWSClientError as e:
+            LOGGER.debug("Unable to retrieve cluster stack: %s", e)
+            return
+
+        probes = [getattr(self.cluster, probe_name) for probe_name in sorted(probe_names)]
+        with ThreadPoolExecutor(max_workers=len(probes), thread_name_prefix="pcluster-cluster-state") as executor:
+            futures = [executor.submit(probe) for probe in probes]
+        for future in futures:
+            if future.exception():
+                LOGGER.debug("Unable to retrieve cluster state: %s", future.exception())
+
     @staticmethod
     def build_config_param_path(path, parameter):
         """Compose the parameter path following the YAML Path standard.
@@ -10,6 +10,7 @@
 # limitations under the License.
 import re
 from enum import Enum
+from functools import lru_cache
 
 from pcluster.config.cluster_config import QueueUpdateStrategy
 from pcluster.config.update_policy_utils import SharedStorageChangeInfo
@@ -156,33 +157,29 @@ def extract_type_and_name_from_path(path):
     return obj_type, obj_name
 
 
-def get_q_from_config(change, config):
-    # Example path=['Scheduling', 'SlurmQueues[q-pg-enabled]', 'ComputeResources[cr-pg-enabled]']
-    # This function would return the dictionary 'q-pg-enabled' from the config using the key from the change path
-    q_type, q_name = None, None
-    for path in change.path:
-        if re.search("Queues\\[", path):
-            q_type, q_name = extract_type_and_name_from_path(path)
-    if q_type and q_name:
-        for queue in config.get("Scheduling", {}).get(q_type, {}):
-            if queue.get("Name", None) == q_name:
-                return queue
-    return {}
-
-
-def get_cr_from_config(change, config):
-    # Example path=['Scheduling', 'SlurmQueues[q-pg-enabled]', 'ComputeResources[cr-pg-enabled]']
-    # This function would return the dictionary 'cr-pg-enabled' from the config using the key from the change path
-    cr_type, cr_name = None, None
-    for path in change.path:
-        if re.search("ComputeResources\\[", path):
-            cr_type, cr_name = extract_type_and_name_from_path(path)
-    if cr_type and cr_name:
-        queue = get_q_from_config(change, config)
-        for compute_resource in queue.get(cr_type, {}):
-            if compute_resource.get("Name", None) == cr_name:
-                return compute_resource
-    return {}
+@lru_cache(maxsize=1024)
+def _get_q_and_cr_keys_from_path(path):
+    # Example path=('Scheduling', 'SlurmQueues[q-pg-enabled]', 'ComputeResources[cr-pg-enabled]')
+    # This function would return the keys ('SlurmQueues', 'q-pg-enabled'), ('ComputeResources', 'cr-pg-enabled')
+    # Paths are shared by all the changes of the same section, hence they are parsed only once.
+    queue_key, compute_resource_key = None, None
+    for segment in path:
+        if "Queues[" in segment:
+            queue_key = extract_type_and_name_from_path(segment)
+        if "ComputeResources[" in segment:
+            compute_resource_key = extract_type_and_name_from_path(segment)
+    return queue_key, compute_resource_key
+
+
+def get_q_from_config(change, config_index):
+    """Return the queue the change refers to, looked up in the given ConfigIndex."""
+    queue_key, _ = _get_q_and_cr_keys_from_path(tuple(change.path))
+    return config_index.get_queue(queue_key)
+
+
+def get_cr_from_config(change, config_index):
+    """Return the compute resource the change refers to, looked up in the given ConfigIndex."""
+    return config_index.get_compute_resource(*_get_q_and_cr_keys_from_path(tuple(change.path)))
 
 
 def is_placement_group_managed_for_compute_resource(queue_networking, compute_resource_networking):
@@ -193,10 +190,10 @@ def is_placement_group_managed_for_compute_resource(queue_networking, compute_re
 
 
 def is_managed_placement_group_deletion(change, patch):
-    base_q_networking = get_q_from_config(change, patch.base_config).get("Networking", {})
-    base_cr_networking = get_cr_from_config(change, patch.base_config).get("Networking", {})
-    target_q_networking = get_q_from_config(change, patch.target_config).get("Networking", {})
-    target_cr_networking = get_cr_from_config(change, patch.target_config).get("Networking", {})
+    base_q_networking = get_q_from_config(change, patch.base_index).get("Networking", {})
+    base_cr_networking = get_cr_from_config(change, patch.base_index).get("Networking", {})
+    target_q_networking = get_q_from_config(change, patch.target_index).get("Networking", {})
+    target_cr_networking = get_cr_from_config(change, patch.target_index).get("Networking", {})
     return is_placement_group_managed_for_compute_resource(
         base_q_networking, base_cr_networking
     ) and not is_placement_group_managed_for_compute_resource(target_q_networking, target_cr_networking)
@@ -307,3 +307,61 @@ IAM_POLICY_REGEX = "^arn:.*:policy/"
 PCLUSTER_BUCKET_PROTECTED_FOLDER = "parallelcluster"
 PCLUSTER_BUCKET_PROTECTED_PREFIX = f"{PCLUSTER_BUCKET_PROTECTED_FOLDER}/"
 PCLUSTER_BUCKET_REQUIRED_BOOTSTRAP_FEATURES = ["basic", "export-logs"]
+
+# Performance tuning settings, grouped by feature
+
+# AWS clients
+# Default size of the connection pool of each boto3 client, overridable with PCLUSTER_AWS_MAX_POOL_CONNECTIONS.
+# It must allow the concurrent calls of the validators and of the logs exporters to reuse the open connections.
+AWS_API_MAX_POOL_CONNECTIONS_DEFAULT = 32
+# Default retry configuration of the boto3 clients, used unless AWS_RETRY_MODE or AWS_MAX_ATTEMPTS are set
+AWS_API_RETRY_MODE_DEFAULT = "standard"
+AWS_API_MAX_ATTEMPTS_DEFAULT = 5
+
+# Caches
+# TTLs (in seconds) of the entries stored in the persistent cache, by kind of data
+PERSISTENT_CACHE_TTL_INSTANCE_TYPES = 24 * 60 * 60
+PERSISTENT_CACHE_TTL_OFFICIAL_IMAGES = 60 * 60
+PERSISTENT_CACHE_TTL_SUBNETS = 60 * 60
+# TTLs (in seconds) of the region-static data kept in memory across the requests served by the API, by kind of data
+PROCESS_CACHE_TTL_INSTANCE_TYPES = 60 * 60
+PROCESS_CACHE_TTL_OFFICIAL_IMAGES = 10 * 60
+
+# Configuration validation
+# Default max number of sync validators executed concurrently, overridable with PCLUSTER_VALIDATION_MAX_WORKERS
+VALIDATION_MAX_WORKERS_DEFAULT = 10
+# Max number of concurrent DescribeInstanceTypes calls used to retrieve the instance types of a cluster config
+INSTANCE_TYPES_PREFETCH_MAX_WORKERS = 4
+
+# Cluster and image artifacts
+# Max number of cluster and image artifacts uploaded concurrently to the S3 bucket
+ARTIFACTS_UPLOAD_MAX_WORKERS = 8
+
+# Describe and list operations
+# Default timeout in seconds of the lookups executed concurrently by describe-cluster, overridable with
+# PCLUSTER_DESCRIBE_CLUSTER_TIMEOUT. Lookups exceeding it are omitted from the response.
+DESCRIBE_CLUSTER_TIMEOUT_DEFAULT = 15
+# Max number of concurrent DescribeStacks calls used to describe the candidate stacks when listing clusters and images
+LIST_STACKS_DESCRIBE_MAX_WORKERS = 10
+# Time in seconds the pages of candidate stacks returned by the Resource Groups Tagging API are cached
+LIST_STACKS_CACHE_TTL = 10
+# Statuses of the stacks listed with ListStacks, in addition to the ones returned by the Resource Groups Tagging API,
+# to include the stacks created too recently to be returned by the eventually consistent Tagging API
+LIST_STACKS_IN_CREATION_STATUSES = ["REVIEW_IN_PROGRESS", "CREATE_IN_PROGRESS"]
+# Max number of regions queried concurrently by the multi-region list-clusters and list-images
+MULTI_REGION_LIST_MAX_WORKERS = 8
+
+# Logs export
+# Max number of exported log objects downloaded concurrently
+LOGS_EXPORT_DOWNLOAD_MAX_WORKERS = 10
+# Size of the exported log streams kept in memory while being added to the logs archive, larger ones are spooled to disk
+LOGS_EXPORT_SPOOL_MAX_SIZE = 16 * 1024 * 1024
+# Size of the parts of the multipart upload of the logs archive (the minimum allowed by S3 is 5 MiB)
+LOGS_ARCHIVE_UPLOAD_PART_SIZE = 8 * 1024 * 1024
+
+# API logging
+# Default max size in bytes of the request and response bodies logged by the API when body logging is enabled with
+# PCLUSTER_API_LOG_BODIES, overridable with PCLUSTER_API_LOG_BODIES_MAX_SIZE. Larger bodies are truncated.
+API_LOG_BODIES_MAX_SIZE_DEFAULT = 2048
+# Default fraction of the requests whose bodies are logged, overridable with PCLUSTER_API_LOG_BODIES_SAMPLE_RATE
+API_LOG_BODIES_SAMPLE_RATE_DEFAULT = 1.0
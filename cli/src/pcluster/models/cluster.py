@@ -14,9 +14,8 @@
 #
 import json
 import logging
-import os
-import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime
 from enum import Enum
@@ -47,15 +46,16 @@ from pcluster.models.cluster_resources import (
 from pcluster.models.common import (
     BadRequest,
     CloudWatchLogsExporter,
+    CloudWatchLogStreamsExporter,
     Conflict,
     LimitExceeded,
     LogStream,
     LogStreams,
     NotFound,
-    create_logs_archive,
+    check_logs_bucket,
     export_stack_events,
+    open_logs_archive,
     parse_config,
-    upload_archive,
 )
 from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus, ComputeFleetStatusManager
 from pcluster.models.login_nodes_status import LoginNodesStatus
@@ -172,7 +172,8 @@ class Cluster:
         self.__official_ami = None
         self.__has_running_capacity = None
         self.__running_capacity = None
-        self.__has_running_login_nodes = None
+        self.__login_nodes_status = None
+        self.__has_running_login_nodes = {}
 
     @property
     def stack(self):
@@ -367,24 +368,11 @@ class Cluster:
                 validator_suppressors, validation_failure_level
             )
 
-            LOGGER.info("Generating artifact dir, uploading config and instance types data...")
+            LOGGER.info("Generating artifact dir, uploading cluster artifacts and building the template...")
             self._add_tags()
             self._generate_artifact_dir()
             artifact_dir_generated = True
-            self._upload_config()
-            self._upload_instance_types_data()
-            LOGGER.info("Generation and upload completed successfully")
-
-            # Create template if not provided by the user
-            assets_metadata = None
-            if not (self.config.dev_settings and self.config.dev_settings.cluster_template):
-                self.template_body, assets_metadata = CDKTemplateBuilder().build_cluster_template(
-                    cluster_config=self.config, bucket=self.bucket, stack_name=self.stack_name
-                )
-
-            LOGGER.info("Uploading cluster artifacts...")
-            # upload cluster artifacts and generated template
-            self._upload_artifacts()
+            assets_metadata = self._upload_artifacts_and_build_template()
             LOGGER.info("Upload of cluster artifacts completed successfully")
 
             LOGGER.info("Creating stack named: %s", self.stack_name)
@@ -489,6 +477,7 @@ class Cluster:
             Cluster._load_additional_instance_type_data(cluster_config_dict)
             config = self._load_config(cluster_config_dict)
             config.official_ami = self.__official_ami
+            config.prefetch_instance_types_info()
             if context.during_update:
                 config.managed_head_node_security_group = self.stack.get_resource_physical_id("HeadNodeSecurityGroup")
                 config.managed_compute_security_group = self.stack.get_resource_physical_id("ComputeSecurityGroup")
@@ -574,7 +563,7 @@ class Cluster:
                 LOGGER.error(message)
                 raise _cluster_error_mapper(e, message)
 
-    def _upload_artifacts(self):
+    def _upload_artifacts(self, resources: bool = True, template: bool = True):
         """
         Upload cluster specific resources and cluster template.
 
@@ -586,18 +575,20 @@ class Cluster:
         LOGGER.info("Uploading cluster artifacts to S3...")
         self._check_bucket_existence()
         try:
-            resources = pkg_resources.resource_filename(__name__, "../resources/custom_resources")
-            self.bucket.upload_resources(
-                resource_dir=resources, custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("custom_artifacts_name")
-            )
-            if self.config.scheduler_resources:
+            if resources:
+                resources_dir = pkg_resources.resource_filename(__name__, "../resources/custom_resources")
                 self.bucket.upload_resources(
-                    resource_dir=self.config.scheduler_resources,
-                    custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("scheduler_resources_name"),
+                    resource_dir=resources_dir,
+                    custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("custom_artifacts_name"),
                 )
+                if self.config.scheduler_resources:
+                    self.bucket.upload_resources(
+                        resource_dir=self.config.scheduler_resources,
+                        custom_artifacts_name=PCLUSTER_S3_ARTIFACTS_DICT.get("scheduler_resources_name"),
+                    )
 
             # Upload template
-            if self.template_body:
+            if template and self.template_body:
                 self.bucket.upload_cfn_template(self.template_body, PCLUSTER_S3_ARTIFACTS_DICT.get("template_name"))
 
             LOGGER.info("Cluster artifacts uploaded correctly.")
@@ -608,6 +599,36 @@ class Cluster:
             LOGGER.error(message)
             raise _cluster_error_mapper(e, message)
 
+    def _upload_artifacts_and_build_template(self, changes=None, log_group_name: str = None):
+        """
+        Upload the cluster artifacts and build the cluster template, if not provided by the user.
+
+        The template depends on the versions of the uploaded config and instance types data, so it is built once
+        they are uploaded, while the static resources, which do not depend on the template, are uploaded in background.
+        The template is uploaded as soon as it is built, without waiting for the static resources.
+        Return the metadata of the assets of the template.
+        """
+        self._check_bucket_existence()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            resources_upload = executor.submit(self._upload_artifacts, template=False)
+            # The versions of the uploaded config and instance types data are referenced by the template
+            self._upload_config()
+            self._upload_instance_types_data()
+            self._upload_change_set(changes)
+
+            assets_metadata = None
+            if not (self.config.dev_settings and self.config.dev_settings.cluster_template):
+                self.template_body, assets_metadata = CDKTemplateBuilder().build_cluster_template(
+                    cluster_config=self.config,
+                    bucket=self.bucket,
+                    stack_name=self.stack_name,
+                    log_group_name=log_group_name,
+                )
+            self._upload_artifacts(resources=False)
+            resources_upload.result()
+
+        return assets_metadata
+
     def delete(self, keep_logs: bool = True):
         """Delete cluster preserving log groups."""
         try:
@@ -758,16 +779,19 @@ class Cluster:
         """
         Return True if the cluster has running login nodes, or a specific pool if a pool name is provided.
 
-        Note: the value will be cached.
+        Note: the status of the login nodes is retrieved once and the value will be cached by pool.
         """
-        healthy_nodes = self.login_nodes_status.get_healthy_nodes(pool_name=pool_name)
-        unhealthy_nodes = self.login_nodes_status.get_unhealthy_nodes(pool_name=pool_name)
-
-        if self.__has_running_login_nodes is None or updated_value:
-            self.__has_running_login_nodes = (
+        if self.__login_nodes_status is None or updated_value:
+            self.__login_nodes_status = self.login_nodes_status
+            self.__has_running_login_nodes = {}
+
+        if pool_name not in self.__has_running_login_nodes:
+            healthy_nodes = self.__login_nodes_status.get_healthy_nodes(pool_name=pool_name)
+            unhealthy_nodes = self.__login_nodes_status.get_unhealthy_nodes(pool_name=pool_name)
+            self.__has_running_login_nodes[pool_name] = (
                 healthy_nodes is not None and unhealthy_nodes is not None and healthy_nodes + unhealthy_nodes != 0
             )
-        return self.__has_running_login_nodes
+        return self.__has_running_login_nodes[pool_name]
 
     def get_running_capacity(self, updated_value: bool = False):
         """Return the number of instances or desired capacity. Note: the value will be cached."""
@@ -921,22 +945,9 @@ class Cluster:
             self.__source_config_text = target_source_config
 
             self._add_tags()
-            self._upload_config()
-            self._upload_instance_types_data()
-            self._upload_change_set(changes)
-
-            # Create template if not provided by the user
-            assets_metadata = None
-            if not (self.config.dev_settings and self.config.dev_settings.cluster_template):
-                self.template_body, assets_metadata = CDKTemplateBuilder().build_cluster_template(
-                    cluster_config=self.config,
-                    bucket=self.bucket,
-                    stack_name=self.stack_name,
-                    log_group_name=self.stack.log_group_name,
-                )
-
-            # upload cluster artifacts and generated template
-            self._upload_artifacts()
+            assets_metadata = self._upload_artifacts_and_build_template(
+                changes=changes, log_group_name=self.stack.log_group_name
+            )
 
             asset_parameters = self._generate_asset_parameters(assets_metadata)
 
@@ -996,6 +1007,7 @@ class Cluster:
         end_time: datetime = None,
         filters: List[str] = None,
         output_file: str = None,
+        direct_export: bool = False,
     ):
         """
         Export cluster's logs in the given output path, by using given bucket as a temporary folder.
@@ -1009,29 +1021,36 @@ class Cluster:
         :param end_time: End time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssTZD
         :param filters: Filters in the format ["Name=name,Values=value1,value2"]
                Accepted filters are: private_dns_name, node_type==HeadNode
+        :param direct_export: Read the log streams directly instead of exporting them to the bucket through
+               CloudWatch Logs export tasks. The bucket is used only to upload the archive if output_file is not given
         """
         # check stack
         if not AWSApi.instance().cfn.stack_exists(self.stack_name):
             raise NotFoundClusterActionError(f"Cluster {self.name} does not exist.")
 
         try:
-            with tempfile.TemporaryDirectory() as output_tempdir:
-                # Create root folder for the archive
-                archive_name = f"{self.name}-logs-{datetime.now().strftime('%Y%m%d%H%M')}"
-                root_archive_dir = os.path.join(output_tempdir, archive_name)
-                os.makedirs(root_archive_dir, exist_ok=True)
-
+            # The archive is created while logs are exported and it is saved to output_file or uploaded to the bucket
+            archive_name = f"{self.name}-logs-{datetime.now().strftime('%Y%m%d%H%M')}"
+            if not output_file or (self.stack.log_group_name and not direct_export):
+                # Fail before creating the archive if the bucket cannot be used
+                check_logs_bucket(bucket, self.name)
+            with open_logs_archive(archive_name, output_file, bucket, bucket_prefix) as archive:
                 if self.stack.log_group_name:
                     # Export logs from CloudWatch
                     export_logs_filters = self._init_export_logs_filters(start_time, end_time, filters)
-                    logs_exporter = CloudWatchLogsExporter(
-                        resource_id=self.name,
-                        log_group_name=self.stack.log_group_name,
-                        bucket=bucket,
-                        output_dir=root_archive_dir,
-                        bucket_prefix=bucket_prefix,
-                        keep_s3_objects=keep_s3_objects,
-                    )
+                    if direct_export:
+                        logs_exporter = CloudWatchLogStreamsExporter(
+                            log_group_name=self.stack.log_group_name, archive=archive
+                        )
+                    else:
+                        logs_exporter = CloudWatchLogsExporter(
+                            resource_id=self.name,
+                            log_group_name=self.stack.log_group_name,
+                            bucket=bucket,
+                            archive=archive,
+                            bucket_prefix=bucket_prefix,
+                            keep_s3_objects=keep_s3_objects,
+                        )
                     logs_exporter.execute(
                         log_stream_prefix=export_logs_filters.log_stream_prefix,
                         start_time=export_logs_filters.start_time,
@@ -1043,16 +1062,13 @@ class Cluster:
                         {self.name},
                     )
 
-                # Get stack events and write them into a file
-                stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
-                export_stack_events(self.stack_name, stack_events_file)
+                # Get stack events and add them to the archive
+                export_stack_events(self.stack_name, archive, self._stack_events_stream_name)
 
-                archive_path = create_logs_archive(root_archive_dir, output_file)
-                if output_file:
-                    return output_file
-                else:
-                    s3_path = upload_archive(bucket, bucket_prefix, archive_path)
-                    return create_s3_presigned_url(s3_path)
+            if output_file:
+                return output_file
+            else:
+                return create_s3_presigned_url(archive.location)
         except Exception as e:
             raise ClusterActionError(f"Unexpected error when exporting cluster's logs: {e}")
 
@@ -9,13 +9,21 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import functools
 import gzip
 import json
 import logging
 import os
 import os.path
+import posixpath
+import shutil
 import tarfile
+import tempfile
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing, contextmanager
+from io import BytesIO
 from typing import List
 
 import configparser
@@ -23,7 +31,12 @@ import configparser
 from pcluster.api.encoder import JSONEncoder
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError, get_region
-from pcluster.utils import datetime_to_epoch, to_utc_datetime, yaml_load
+from pcluster.constants import (
+    LOGS_ARCHIVE_UPLOAD_PART_SIZE,
+    LOGS_EXPORT_DOWNLOAD_MAX_WORKERS,
+    LOGS_EXPORT_SPOOL_MAX_SIZE,
+)
+from pcluster.utils import datetime_to_epoch, to_iso_timestr, to_utc_datetime, wait_until, yaml_load
 
 LOGGER = logging.getLogger(__name__)
 
@@ -134,20 +147,26 @@ class LogsExporterError(Exception):
         super().__init__(message)
 
 
+def check_logs_bucket(bucket: str, resource_id: str):
+    """Verify that the bucket used for exporting logs is accessible and in the same region as the resource."""
+    bucket_region = AWSApi.instance().s3.get_bucket_region(bucket_name=bucket)
+    if bucket_region != get_region():
+        raise LogsExporterError(
+            f"The bucket used for exporting logs must be in the same region as the {resource_id}. "
+            f"The given resource is in {get_region()}, but the bucket's region is {bucket_region}."
+        )
+
+
 class CloudWatchLogsExporter:
     """Utility class used to export log group logs."""
 
-    def __init__(self, resource_id, log_group_name, bucket, output_dir, bucket_prefix=None, keep_s3_objects=False):
-        # check bucket
-        bucket_region = AWSApi.instance().s3.get_bucket_region(bucket_name=bucket)
-        if bucket_region != get_region():
-            raise LogsExporterError(
-                f"The bucket used for exporting logs must be in the same region as the {resource_id}. "
-                f"The given resource is in {get_region()}, but the bucket's region is {bucket_region}."
-            )
+    def __init__(
+        self, resource_id, log_group_name, bucket, archive: "LogsArchive", bucket_prefix=None, keep_s3_objects=False
+    ):
+        check_logs_bucket(bucket, resource_id)
         self.bucket = bucket
         self.log_group_name = log_group_name
-        self.output_dir = output_dir
+        self.archive = archive
         self.keep_s3_objects = keep_s3_objects
 
         if bucket_prefix:
@@ -161,15 +180,14 @@ class CloudWatchLogsExporter:
             self.delete_everything_under_prefix = AWSApi.instance().s3_resource.is_empty(bucket, self.bucket_prefix)
 
     def execute(self, log_stream_prefix=None, start_time: datetime.datetime = None, end_time: datetime.datetime = None):
-        """Start export task. Returns logs streams folder."""
+        """Start export task and add the exported log streams to the archive."""
         # Export logs to S3
         task_id = self._export_logs_to_s3(log_stream_prefix=log_stream_prefix, start_time=start_time, end_time=end_time)
         LOGGER.info("Log export task id: %s", task_id)
-        # Download exported S3 objects to output dir subfolder
+        # Download exported S3 objects to the archive subfolder
         try:
-            log_streams_dir = os.path.join(self.output_dir, "cloudwatch-logs")
-            self._download_s3_objects_with_prefix(task_id, log_streams_dir)
-            LOGGER.info("Archive of CloudWatch logs saved to %s", self.output_dir)
+            self._download_s3_objects_with_prefix(task_id, "cloudwatch-logs")
+            LOGGER.info("CloudWatch logs added to the archive %s", self.archive.location)
         except OSError:
             raise LogsExporterError("Unable to download archive logs from S3, double check your filters are correct.")
         finally:
@@ -214,35 +232,156 @@ class CloudWatchLogsExporter:
     def _wait_for_task_completion(task_id):
         """Wait for the CloudWatch logs export task given by task_id to finish."""
         LOGGER.debug("Waiting for export task with task ID=%s to finish...", task_id)
-        status = "PENDING"
         still_running_statuses = ("PENDING", "PENDING_CANCEL", "RUNNING")
-        while status in still_running_statuses:
-            time.sleep(1)
-            status = AWSApi.instance().logs.get_export_task_status(task_id)
-        return status
+        return wait_until(
+            poll=lambda: AWSApi.instance().logs.get_export_task_status(task_id),
+            is_done=lambda status: status not in still_running_statuses,
+            initial_delay=1,
+            max_delay=10,
+            on_poll=lambda status: LOGGER.debug("Export task %s status: %s", task_id, status),
+        )
 
     def _download_s3_objects_with_prefix(self, task_id, destdir):
-        """Download all object in bucket with given prefix into destdir."""
+        """
+        Download all object in bucket with given prefix into destdir of the archive.
+
+        Objects are downloaded concurrently and decompressed while they are streamed to a temporary file, which is
+        then appended to the archive. The objects of a log stream exported in multiple parts are concatenated in key
+        order.
+        """
         prefix = f"{self.bucket_prefix}/{task_id}"
         LOGGER.debug("Downloading exported logs from s3 bucket %s (under key %s) to %s", self.bucket, prefix, destdir)
+        keys_by_name = {}
         for archive_object in AWSApi.instance().s3_resource.get_objects(bucket_name=self.bucket, prefix=prefix):
-            decompressed_path = os.path.dirname(os.path.join(destdir, archive_object.key))
-            decompressed_path = decompressed_path.replace(
-                r"{unwanted_path_segment}{sep}".format(unwanted_path_segment=prefix, sep=os.path.sep), ""
-            )
-            compressed_path = f"{decompressed_path}.gz"
+            name = posixpath.dirname(posixpath.join(destdir, archive_object.key)).replace(f"{prefix}/", "")
+            keys_by_name.setdefault(name, []).append(archive_object.key)
+
+        # S3 clients, unlike resources, are thread safe
+        s3_client = AWSApi.instance().s3
+        _add_to_archive_concurrently(
+            self.archive,
+            (
+                (name, functools.partial(self._download_and_decompress_s3_objects, s3_client, sorted(keys)))
+                for name, keys in keys_by_name.items()
+            ),
+        )
 
-            LOGGER.debug("Downloading object with key=%s to %s", archive_object.key, compressed_path)
-            os.makedirs(os.path.dirname(compressed_path), exist_ok=True)
-            AWSApi.instance().s3_resource.download_file(
-                bucket_name=self.bucket, key=archive_object.key, output=compressed_path
-            )
+    def _download_and_decompress_s3_objects(self, s3_client, keys, logs_file):
+        """Stream the given gzip compressed objects through a decompressor to logs_file."""
+        for key in keys:
+            LOGGER.debug("Downloading and extracting object with key=%s", key)
+            body = s3_client.get_object(bucket_name=self.bucket, key=key)["Body"]
+            with closing(body), gzip.GzipFile(fileobj=body) as gfile:
+                shutil.copyfileobj(gfile, logs_file)
 
-            # Create a decompressed copy of the downloaded archive and remove the original
-            LOGGER.debug("Extracting object at %s to %s", compressed_path, decompressed_path)
-            with gzip.open(compressed_path) as gfile, open(decompressed_path, "wb") as outfile:
-                outfile.write(gfile.read())
-            os.remove(compressed_path)
+
+class CloudWatchLogStreamsExporter:
+    """
+    Utility class used to export log group logs by reading the log streams, without CloudWatch Logs export tasks.
+
+    Log streams are read in parallel with GetLogEvents, hence the export is neither serialized with the other
+    export tasks of the account, that can be only one at a time, nor does it need to pass through an S3 bucket.
+    Every log stream is exported to a file with a line per log event, in the same format used by export tasks.
+    """
+
+    def __init__(self, log_group_name, archive: "LogsArchive"):
+        self.log_group_name = log_group_name
+        self.archive = archive
+
+    def execute(self, log_stream_prefix=None, start_time: datetime.datetime = None, end_time: datetime.datetime = None):
+        """Add the log streams with the given prefix and events in the given time window to the archive."""
+        start_time = start_time and datetime_to_epoch(start_time)
+        end_time = end_time and datetime_to_epoch(end_time)
+        log_stream_names = self._get_log_stream_names(log_stream_prefix, start_time, end_time)
+        LOGGER.debug("Exporting %d log streams of log group %s", len(log_stream_names), self.log_group_name)
+        logs_client = AWSApi.instance().logs
+        _add_to_archive_concurrently(
+            self.archive,
+            (
+                (
+                    f"cloudwatch-logs/{log_stream_name}",
+                    functools.partial(self._export_log_stream, logs_client, log_stream_name, start_time, end_time),
+                )
+                for log_stream_name in log_stream_names
+            ),
+        )
+        LOGGER.info("CloudWatch logs added to the archive %s", self.archive.location)
+
+    def _get_log_stream_names(self, log_stream_prefix, start_time, end_time):
+        """Return the names of the log streams with the given prefix that may have events in the time window."""
+        log_stream_names = []
+        next_token = None
+        while True:
+            response = AWSApi.instance().logs.describe_log_streams(
+                self.log_group_name, log_stream_name_prefix=log_stream_prefix, next_token=next_token
+            )
+            for log_stream in response.get("logStreams", []):
+                first_event_time = log_stream.get("firstEventTimestamp", log_stream.get("creationTime"))
+                last_ingestion_time = log_stream.get("lastIngestionTime")
+                if (end_time and first_event_time and first_event_time > end_time) or (
+                    start_time and last_ingestion_time and last_ingestion_time < start_time
+                ):
+                    continue
+                log_stream_names.append(log_stream["logStreamName"])
+            next_token = response.get("nextToken")
+            if not next_token:
+                return log_stream_names
+
+    def _export_log_stream(self, logs_client, log_stream_name, start_time, end_time, logs_file):
+        """Write the events of the given log stream to logs_file, a line per event."""
+        LOGGER.debug("Exporting log stream %s", log_stream_name)
+        next_token = None
+        while True:
+            response = logs_client.get_log_events(
+                self.log_group_name,
+                log_stream_name,
+                start_time=start_time,
+                end_time=end_time,
+                start_from_head=True,
+                next_token=next_token,
+            )
+            for event in response.get("events", []):
+                timestamp = to_iso_timestr(to_utc_datetime(event["timestamp"]))
+                logs_file.write(f"{timestamp} {event['message']}\n".encode("utf-8"))
+            # The end of the stream is reached when the same token is returned
+            if response.get("nextForwardToken") in (None, next_token):
+                return
+            next_token = response.get("nextForwardToken")
+
+
+def _add_to_archive_concurrently(archive: "LogsArchive", files):
+    """
+    Add the given files to the archive, retrieving their content concurrently.
+
+    :param files: iterable of (name, write_content) pairs, where write_content writes the content of the file to
+                  the given file object. Contents are spooled in memory up to LOGS_EXPORT_SPOOL_MAX_SIZE, then to disk,
+                  until they are added to the archive, in the given order.
+    """
+
+    def _retrieve_content(write_content):
+        logs_file = tempfile.SpooledTemporaryFile(max_size=LOGS_EXPORT_SPOOL_MAX_SIZE)  # pylint: disable=R1732
+        try:
+            write_content(logs_file)
+            return logs_file
+        except BaseException:
+            logs_file.close()
+            raise
+
+    def _add_to_archive(name, future):
+        with future.result() as logs_file:
+            size = logs_file.tell()
+            logs_file.seek(0)
+            archive.add_file(name, logs_file, size)
+
+    with ThreadPoolExecutor(max_workers=LOGS_EXPORT_DOWNLOAD_MAX_WORKERS) as executor:
+        # Limit the number of retrieved files waiting to be added to the archive
+        pending = deque()
+        for name, write_content in files:
+            pending.append((name, executor.submit(_retrieve_content, write_content)))
+            if len(pending) >= 2 * LOGS_EXPORT_DOWNLOAD_MAX_WORKERS:
+                _add_to_archive(*pending.popleft())
+        while pending:
+            _add_to_archive(*pending.popleft())
 
 
 def get_all_stack_events(stack_name: str):
@@ -256,31 +395,129 @@ def get_all_stack_events(stack_name: str):
     return stack_events
 
 
-def export_stack_events(stack_name: str, output_file: str):
-    """Save CFN stack events into a file."""
+def export_stack_events(stack_name: str, archive: "LogsArchive", file_name: str):
+    """Save CFN stack events into a file of the archive."""
     stack_events = get_all_stack_events(stack_name)
+    archive.add_bytes(file_name, json.dumps(stack_events, cls=JSONEncoder, indent=2).encode("utf-8"))
+
+
+class LogsArchive:
+    """
+    tar.gz archive of exported logs, created as a stream.
+
+    Files are appended under the archive root directory as soon as they are available and the compressed stream
+    is written to the given file object, so that the archive does not need to be created from a copy of the logs
+    on disk nor to be entirely loaded in memory.
+    """
+
+    def __init__(self, root_dir: str, fileobj, location: str):
+        self.root_dir = root_dir
+        self.location = location
+        self._tar = tarfile.open(fileobj=fileobj, mode="w|gz")  # pylint: disable=R1732
+
+    def add_file(self, name: str, fileobj, size: int):
+        """Add the content of the given file object, of the given size, as the file name of the archive."""
+        tarinfo = tarfile.TarInfo(f"{self.root_dir}/{name}")
+        tarinfo.size = size
+        tarinfo.mtime = int(time.time())
+        tarinfo.mode = 0o644
+        self._tar.addfile(tarinfo, fileobj)
 
-    with open(output_file, "w", encoding="utf-8") as cfn_events_file:
-        cfn_events_file.write(json.dumps(stack_events, cls=JSONEncoder, indent=2))
+    def add_bytes(self, name: str, data: bytes):
+        """Add the given data as the file name of the archive."""
+        self.add_file(name, BytesIO(data), len(data))
 
+    def close(self):
+        """Write the end of the archive."""
+        self._tar.close()
 
-def create_logs_archive(directory: str, output_file: str = None):
-    base_directory = os.path.dirname(directory)
-    base_name = os.path.basename(directory)
-    output_file = output_file or f"{os.path.join(base_directory, base_name)}.tar.gz"
-    LOGGER.debug("Creating archive of logs and saving it to %s", output_file)
-    with tarfile.open(output_file, "w:gz") as tar:
-        tar.add(directory, arcname=base_name)
-    return output_file
 
+class S3MultipartUploadStream:
+    """
+    Writable stream uploading the written data to an S3 object, with a part every LOGS_ARCHIVE_UPLOAD_PART_SIZE.
 
-def upload_archive(bucket: str, bucket_prefix: str, archive_path: str):
-    archive_filename = os.path.basename(archive_path)
-    with open(archive_path, "rb") as archive_file:
-        archive_data = archive_file.read()
-    bucket_path = f"{bucket_prefix}/{archive_filename}" if bucket_prefix else archive_filename
-    AWSApi.instance().s3.put_object(bucket, archive_data, bucket_path)
-    return f"s3://{bucket}/{bucket_path}"
+    The multipart upload is created with the first part, so that nothing is left in the bucket when the stream is
+    aborted before any part is uploaded.
+    """
+
+    def __init__(self, bucket: str, key: str):
+        self.bucket = bucket
+        self.key = key
+        self._s3_client = AWSApi.instance().s3
+        self._upload_id = None
+        self._parts = []
+        self._buffer = bytearray()
+        self._aborted = False
+
+    def write(self, data):
+        """Buffer the given data, uploading a part when enough data is available."""
+        if self._aborted:
+            # Discard the data written after the upload has been aborted
+            return len(data)
+        self._buffer.extend(data)
+        while len(self._buffer) >= LOGS_ARCHIVE_UPLOAD_PART_SIZE:
+            self._upload_part(bytes(self._buffer[:LOGS_ARCHIVE_UPLOAD_PART_SIZE]))
+            del self._buffer[:LOGS_ARCHIVE_UPLOAD_PART_SIZE]
+        return len(data)
+
+    def _upload_part(self, data):
+        if not self._upload_id:
+            self._upload_id = self._s3_client.create_multipart_upload(self.bucket, self.key)
+        part_number = len(self._parts) + 1
+        etag = self._s3_client.upload_part(self.bucket, self.key, self._upload_id, part_number, data)
+        self._parts.append({"ETag": etag, "PartNumber": part_number})
+
+    def complete(self):
+        """Upload the remaining data and complete the upload. The last part can be smaller than the minimum size."""
+        if self._buffer or not self._parts:
+            self._upload_part(bytes(self._buffer))
+            self._buffer.clear()
+        self._s3_client.complete_multipart_upload(self.bucket, self.key, self._upload_id, self._parts)
+
+    def abort(self):
+        """Abort the upload, deleting the parts already uploaded."""
+        self._aborted = True
+        if not self._upload_id:
+            return
+        try:
+            self._s3_client.abort_multipart_upload(self.bucket, self.key, self._upload_id)
+        except AWSClientError as e:
+            LOGGER.warning("Unable to abort multipart upload of s3://%s/%s: %s", self.bucket, self.key, e)
+
+
+@contextmanager
+def open_logs_archive(archive_name: str, output_file: str = None, bucket: str = None, bucket_prefix: str = None):
+    """
+    Create a LogsArchive saved to output_file, if given, or uploaded to the bucket while being created.
+
+    The archive is finalized when the context exits successfully, otherwise the partial archive is discarded.
+    """
+    if output_file:
+        try:
+            with open(output_file, "wb") as fileobj:
+                archive = LogsArchive(archive_name, fileobj, location=output_file)
+                try:
+                    yield archive
+                finally:
+                    archive.close()
+        except BaseException:
+            if os.path.exists(output_file):
+                os.remove(output_file)
+            raise
+    else:
+        key = f"{bucket_prefix}/{archive_name}.tar.gz" if bucket_prefix else f"{archive_name}.tar.gz"
+        upload_stream = S3MultipartUploadStream(bucket, key)
+        archive = None
+        try:
+            archive = LogsArchive(archive_name, upload_stream, location=f"s3://{bucket}/{key}")
+            yield archive
+            archive.close()
+            upload_stream.complete()
+        except BaseException:
+            upload_stream.abort()
+            if archive:
+                archive.close()
+            raise
 
 
 class LogStreams:
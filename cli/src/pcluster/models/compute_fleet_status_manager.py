@@ -9,7 +9,6 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import logging
-import time
 from abc import ABCMeta, abstractmethod
 from datetime import datetime, timezone
 from enum import Enum
@@ -20,6 +19,7 @@ from pkg_resources import packaging
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError
 from pcluster.constants import PCLUSTER_DYNAMODB_PREFIX
+from pcluster.utils import wait_until
 
 LOGGER = logging.getLogger(__name__)
 
@@ -79,17 +79,16 @@ class ComputeFleetStatusManager(metaclass=ABCMeta):
         status, _ = self.get_status_with_last_updated_time(status_fallback=fallback)
         return status
 
-    def _wait_for_status_transition(self, wait_on_status, timeout=300, retry_every_seconds=15):
-        current_status = self.get_status()
-        start_time = time.time()
-        while current_status == wait_on_status and not self._timeout_expired(start_time, timeout):
-            current_status = self.get_status()
-            time.sleep(retry_every_seconds)
-
-        if current_status == wait_on_status:
-            raise TimeoutError("Timeout expired while waiting for status transition.")
-
-        return current_status
+    def _wait_for_status_transition(self, wait_on_status, timeout=300, max_retry_interval=15):
+        return wait_until(
+            poll=self.get_status,
+            is_done=lambda status: status != wait_on_status,
+            initial_delay=2,
+            max_delay=max_retry_interval,
+            timeout=timeout,
+            on_poll=lambda status: LOGGER.debug("Compute fleet status is: %s", status),
+            description="status transition",
+        )
 
     def update_status(self, request_status, in_progress_status, final_status, wait_transition=False):
         """
@@ -151,10 +150,6 @@ class ComputeFleetStatusManager(metaclass=ABCMeta):
         else:
             return JsonComputeFleetStatusManager(cluster_name)
 
-    @staticmethod
-    def _timeout_expired(start_time, timeout):
-        return (time.time() - start_time) > timeout
-
 
 class JsonComputeFleetStatusManager(ComputeFleetStatusManager):
     """
@@ -14,10 +14,7 @@
 #
 import copy
 import logging
-import os
-import os.path
 import re
-import tempfile
 from datetime import datetime
 from typing import Set
 
@@ -52,16 +49,17 @@ from pcluster.models.cluster_resources import FiltersParserError
 from pcluster.models.common import (
     BadRequest,
     CloudWatchLogsExporter,
+    CloudWatchLogStreamsExporter,
     Conflict,
     LimitExceeded,
     LogGroupTimeFiltersParser,
     LogStream,
     LogStreams,
     NotFound,
-    create_logs_archive,
+    check_logs_bucket,
     export_stack_events,
+    open_logs_archive,
     parse_config,
-    upload_archive,
 )
 from pcluster.models.imagebuilder_resources import (
     BadRequestStackError,
@@ -678,6 +676,7 @@ class ImageBuilder:
         start_time: datetime = None,
         end_time: datetime = None,
         output_file: str = None,
+        direct_export: bool = False,
     ):
         """
         Export image builder's logs in the given output path, by using given bucket as a temporary folder.
@@ -688,6 +687,8 @@ class ImageBuilder:
         :param keep_s3_objects: Keep the exported objects exports to S3. The default behavior is to delete them
         :param start_time: Start time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssTZD
         :param end_time: End time of interval of interest for log events. ISO 8601 format: YYYY-MM-DDThh:mm:ssTZD
+        :param direct_export: Read the log streams directly instead of exporting them to the bucket through
+               CloudWatch Logs export tasks. The bucket is used only to upload the archive if output_file is not given
         """
         # check stack
         stack_exists = self._stack_exists()
@@ -695,23 +696,29 @@ class ImageBuilder:
             LOGGER.debug("CloudFormation Stack for Image %s does not exist.", self.image_id)
 
         try:
-            with tempfile.TemporaryDirectory() as output_tempdir:
-                # Create root folder for the archive
-                archive_name = f"{self.image_id}-logs-{datetime.now().strftime('%Y%m%d%H%M')}"
-                root_archive_dir = os.path.join(output_tempdir, archive_name)
-                os.makedirs(root_archive_dir, exist_ok=True)
-
-                if AWSApi.instance().logs.log_group_exists(self._log_group_name):
+            # The archive is created while logs are exported and it is saved to output_file or uploaded to the bucket
+            archive_name = f"{self.image_id}-logs-{datetime.now().strftime('%Y%m%d%H%M')}"
+            log_group_exists = AWSApi.instance().logs.log_group_exists(self._log_group_name)
+            if not output_file or (log_group_exists and not direct_export):
+                # Fail before creating the archive if the bucket cannot be used
+                check_logs_bucket(bucket, self.image_id)
+            with open_logs_archive(archive_name, output_file, bucket, bucket_prefix) as archive:
+                if log_group_exists:
                     # Export logs from CloudWatch
                     export_logs_filters = self._init_export_logs_filters(start_time, end_time)
-                    logs_exporter = CloudWatchLogsExporter(
-                        resource_id=self.image_id,
-                        log_group_name=self._log_group_name,
-                        bucket=bucket,
-                        output_dir=root_archive_dir,
-                        bucket_prefix=bucket_prefix,
-                        keep_s3_objects=keep_s3_objects,
-                    )
+                    if direct_export:
+                        logs_exporter = CloudWatchLogStreamsExporter(
+                            log_group_name=self._log_group_name, archive=archive
+                        )
+                    else:
+                        logs_exporter = CloudWatchLogsExporter(
+                            resource_id=self.image_id,
+                            log_group_name=self._log_group_name,
+                            bucket=bucket,
+                            archive=archive,
+                            bucket_prefix=bucket_prefix,
+                            keep_s3_objects=keep_s3_objects,
+                        )
                     logs_exporter.execute(
                         start_time=export_logs_filters.start_time, end_time=export_logs_filters.end_time
                     )
@@ -721,15 +728,13 @@ class ImageBuilder:
                     )
 
                 if stack_exists:
-                    # Get stack events and write them into a file
-                    stack_events_file = os.path.join(root_archive_dir, self._stack_events_stream_name)
-                    export_stack_events(self.stack.name, stack_events_file)
-                archive_path = create_logs_archive(root_archive_dir, output_file)
-                if output_file:
-                    return output_file
-                else:
-                    s3_path = upload_archive(bucket, bucket_prefix, archive_path)
-                    return create_s3_presigned_url(s3_path)
+                    # Get stack events and add them to the archive
+                    export_stack_events(self.stack.name, archive, self._stack_events_stream_name)
+
+            if output_file:
+                return output_file
+            else:
+                return create_s3_presigned_url(archive.location)
         except Exception as e:
             raise ImageBuilderActionError(f"Unexpected error when exporting image's logs: {e}")
 
@@ -12,10 +12,21 @@ import logging
 from enum import Enum
 
 from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSClientError
 from pcluster.utils import get_chunks
 
 LOGGER = logging.getLogger(__name__)
 
+# Prefix of the logical id of the nested stack of the login nodes pools in the cluster stack
+LOGIN_NODES_STACK_LOGICAL_ID_PREFIX = "LoginNodes"
+
+
+def _retrieve_load_balancers_tags(load_balancer_arns):
+    tags = []
+    for chunk in get_chunks(load_balancer_arns):
+        tags.extend(AWSApi.instance().elb.describe_tags(chunk))
+    return tags
+
 
 class LoginNodesPoolState(Enum):
     """Represents the internal status of the login nodes pools."""
@@ -31,7 +42,13 @@ class LoginNodesPoolState(Enum):
 class PoolStatus:
     """Represents the status of a pool of login nodes."""
 
-    def __init__(self, stack_name, pool_name):
+    def __init__(self, stack_name, pool_name, load_balancers=None, load_balancers_tags=None):
+        """
+        Retrieve the status of the pool.
+
+        The load balancer of the pool is searched among the given load balancers and their tags, when provided,
+        otherwise among all the load balancers of the account.
+        """
         self._dns_name = None
         self._status = None
         self._scheme = None
@@ -42,7 +59,7 @@ class PoolStatus:
         self._unhealthy_nodes = None
         self._load_balancer_arn = None
         self._target_group_arn = None
-        self._retrieve_data()
+        self._retrieve_data(load_balancers, load_balancers_tags)
 
     def __str__(self):
         return (
@@ -74,17 +91,18 @@ class PoolStatus:
         """Return the schema of the login node pool."""
         return self._scheme
 
-    def _retrieve_data(self):
+    def _retrieve_data(self, load_balancers=None, load_balancers_tags=None):
         """Initialize the class with the information related to the login nodes pool."""
-        self._retrieve_assigned_load_balancer()
+        self._retrieve_assigned_load_balancer(load_balancers, load_balancers_tags)
         if self._load_balancer_arn:
             self._pool_available = True
             self._populate_target_groups()
             self._populate_target_group_health()
 
-    def _retrieve_assigned_load_balancer(self):
-        load_balancers = AWSApi.instance().elb.list_load_balancers()
-        tags_list = self._retrieve_all_tags([o.get("LoadBalancerArn") for o in load_balancers])
+    def _retrieve_assigned_load_balancer(self, load_balancers=None, tags_list=None):
+        if load_balancers is None:
+            load_balancers = AWSApi.instance().elb.list_load_balancers()
+            tags_list = self._retrieve_all_tags([o.get("LoadBalancerArn") for o in load_balancers])
         self._load_balancer_arn_from_tags(tags_list)
         if self._load_balancer_arn:
             for load_balancer in load_balancers:
@@ -108,12 +126,7 @@ class PoolStatus:
         return False
 
     def _retrieve_all_tags(self, load_balancers):
-        tags = []
-        if len(load_balancers) > 0:
-            chunks = get_chunks(load_balancers)
-            for chunk in chunks:
-                tags.extend(AWSApi.instance().elb.describe_tags(chunk))
-        return tags
+        return _retrieve_load_balancers_tags(load_balancers)
 
     def _map_status(self, load_balancer_state):
         if load_balancer_state == "provisioning":
@@ -195,8 +208,13 @@ class LoginNodesStatus:
 
     def retrieve_data(self, login_node_pool_names):
         """Initialize the class with the information related to the login node fleet."""
+        load_balancers, load_balancers_tags = (
+            self._retrieve_load_balancers(login_node_pool_names) if login_node_pool_names else ([], [])
+        )
         for pool_name in login_node_pool_names:
-            self._pool_status_dict[pool_name] = PoolStatus(self._stack_name, pool_name)
+            self._pool_status_dict[pool_name] = PoolStatus(
+                self._stack_name, pool_name, load_balancers, load_balancers_tags
+            )
         self._total_healthy_nodes = sum(
             (
                 pool_status.get_healthy_nodes()
@@ -214,3 +232,64 @@ class LoginNodesStatus:
         self._login_nodes_pool_available = any(
             (pool_status.get_pool_available() for pool_status in self._pool_status_dict.values())
         )
+
+    def _retrieve_load_balancers(self, login_node_pool_names):
+        """
+        Retrieve the load balancers of the login nodes pools and their tags, in a single pass for all the pools.
+
+        The load balancers are resolved from the resources of the login nodes stack, falling back to the scan of all
+        the load balancers of the account when the stack resources cannot be retrieved or do not include the load
+        balancer of every pool.
+        """
+        load_balancer_arns = self._get_load_balancer_arns_from_stack()
+        if load_balancer_arns:
+            load_balancers = []
+            for chunk in get_chunks(load_balancer_arns):
+                load_balancers.extend(AWSApi.instance().elb.describe_load_balancers(chunk))
+            load_balancers_tags = _retrieve_load_balancers_tags(
+                [load_balancer.get("LoadBalancerArn") for load_balancer in load_balancers]
+            )
+            missing_pool_names = set(login_node_pool_names) - self._get_pool_names_from_tags(load_balancers_tags)
+            if not missing_pool_names:
+                return load_balancers, load_balancers_tags
+            LOGGER.debug(
+                "Load balancers of the login nodes pools %s not found in the cluster stack", sorted(missing_pool_names)
+            )
+
+        load_balancers = AWSApi.instance().elb.list_load_balancers()
+        load_balancers_tags = _retrieve_load_balancers_tags(
+            [load_balancer.get("LoadBalancerArn") for load_balancer in load_balancers]
+        )
+        return load_balancers, load_balancers_tags
+
+    def _get_pool_names_from_tags(self, load_balancers_tags):
+        """Return the names of the login nodes pools of the cluster having a load balancer among the given tags."""
+        pool_names = set()
+        for tags in load_balancers_tags:
+            tags_dict = {tag.get("Key"): tag.get("Value") for tag in tags.get("Tags")}
+            if tags_dict.get("parallelcluster:cluster-name") == self._stack_name:
+                pool_names.add(tags_dict.get("parallelcluster:login-nodes-pool"))
+        return pool_names
+
+    def _get_load_balancer_arns_from_stack(self):
+        """Return the arns of the load balancers of the login nodes stack, None if it cannot be found."""
+        try:
+            cfn = AWSApi.instance().cfn
+            login_nodes_stack_ids = [
+                resource.get("PhysicalResourceId")
+                for resource in cfn.list_stack_resources(self._stack_name)
+                if resource.get("ResourceType") == "AWS::CloudFormation::Stack"
+                and resource.get("LogicalResourceId", "").startswith(LOGIN_NODES_STACK_LOGICAL_ID_PREFIX)
+                and resource.get("PhysicalResourceId")
+            ]
+            if not login_nodes_stack_ids:
+                return None
+            return [
+                resource.get("PhysicalResourceId")
+                for resource in cfn.list_stack_resources(login_nodes_stack_ids[0])
+                if resource.get("ResourceType") == "AWS::ElasticLoadBalancingV2::LoadBalancer"
+                and resource.get("PhysicalResourceId")
+            ]
+        except AWSClientError as e:
+            LOGGER.debug("Unable to retrieve the load balancers of the login nodes from the cluster stack: %s", e)
+            return None
@@ -17,13 +17,18 @@ import json
 import logging
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 
 import yaml
 
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.common import AWSClientError, get_region
-from pcluster.constants import PCLUSTER_BUCKET_REQUIRED_BOOTSTRAP_FEATURES, PCLUSTER_S3_BUCKET_VERSION
+from pcluster.constants import (
+    ARTIFACTS_UPLOAD_MAX_WORKERS,
+    PCLUSTER_BUCKET_REQUIRED_BOOTSTRAP_FEATURES,
+    PCLUSTER_S3_BUCKET_VERSION,
+)
 from pcluster.utils import format_arn, get_partition, get_service_principal, get_url_domain_suffix, yaml_load, zip_dir
 
 LOGGER = logging.getLogger(__name__)
@@ -323,9 +328,10 @@ class S3Bucket:
         )
 
     def upload_cfn_asset(self, asset_file_content, asset_name: str, format=S3FileFormat.YAML):
-        """Upload cloudformation assets to S3 bucket."""
-        return self.upload_file(
-            file_type=S3FileType.ASSETS, content=asset_file_content, file_name=asset_name, format=format
+        """Upload cloudformation assets to S3 bucket, unless unchanged."""
+        return self._upload_if_changed(
+            key=self.get_object_key(S3FileType.ASSETS, asset_name),
+            body=format_content(asset_file_content, format).encode("utf-8"),
         )
 
     def upload_dna_cfn_asset(self, asset_file_content, asset_name: str, file_type=S3FileType, format=S3FileFormat.YAML):
@@ -336,23 +342,26 @@ class S3Bucket:
         """
         Upload custom resources to S3 bucket.
 
+        The resources are uploaded concurrently, skipping the ones whose content is unchanged.
+
         :param resource_dir: resource directory containing the resources to upload.
         :param custom_artifacts_name: custom_artifacts_name for zipped dir
         """
-        for res in os.listdir(resource_dir):
+        artifacts = {}
+        for res in sorted(os.listdir(resource_dir)):
             path = os.path.join(resource_dir, res)
             if os.path.isdir(path):
-                AWSApi.instance().s3.upload_fileobj(
-                    file_obj=zip_dir(os.path.join(resource_dir, res)),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name),
-                )
+                artifacts[self.get_object_key(S3FileType.CUSTOM_RESOURCES, custom_artifacts_name)] = zip_dir(
+                    path
+                ).getvalue()
             elif os.path.isfile(path):
-                AWSApi.instance().s3.upload_file(
-                    file_path=os.path.join(resource_dir, res),
-                    bucket_name=self.name,
-                    key=self.get_object_key(S3FileType.CUSTOM_RESOURCES, res),
-                )
+                with open(path, "rb") as artifact_file:
+                    artifacts[self.get_object_key(S3FileType.CUSTOM_RESOURCES, res)] = artifact_file.read()
+
+        with ThreadPoolExecutor(max_workers=ARTIFACTS_UPLOAD_MAX_WORKERS) as executor:
+            futures = [executor.submit(self._upload_if_changed, key, body) for key, body in artifacts.items()]
+            for future in futures:
+                future.result()
 
     def get_config(self, config_name, version_id=None, format=S3FileFormat.TEXT):
         """Get config file from S3 bucket."""
@@ -396,6 +405,24 @@ class S3Bucket:
             key=self.get_object_key(file_type, file_name),
         )
 
+    def _upload_if_changed(self, key: str, body: bytes):
+        """
+        Upload the content to the given key, unless the object stored there has the same content.
+
+        The content is compared through the ETag of the object, which is the MD5 digest of its content
+        for objects not uploaded in multiple parts and not encrypted with KMS keys, otherwise it is always uploaded.
+        Return the response of the upload, None if skipped.
+        """
+        digest = hashlib.md5(body, usedforsecurity=False).hexdigest()  # nosec B324 not used for security
+        try:
+            etag = AWSApi.instance().s3.head_object(bucket_name=self.name, object_name=key).get("ETag", "")
+        except AWSClientError:
+            etag = None
+        if etag and etag.strip('"') == digest:
+            LOGGER.info("Skipping upload of unchanged object %s", key)
+            return None
+        return AWSApi.instance().s3.put_object(bucket_name=self.name, body=body, key=key)
+
     def _get_file(self, file_name, file_type, version_id=None, format=S3FileFormat.YAML):
         """Get file from S3 bucket."""
         result = AWSApi.instance().s3.get_object(
@@ -14,11 +14,13 @@
 #
 import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List
 
 from aws_cdk.cx_api import CloudAssembly, CloudFormationStackArtifact
 
+from pcluster.constants import ARTIFACTS_UPLOAD_MAX_WORKERS
 from pcluster.models.s3_bucket import S3Bucket, S3FileFormat, S3FileType
 from pcluster.utils import LOGGER, load_json_dict
 
@@ -135,6 +137,7 @@ class CDKArtifactsManager:
         """
         cdk_assets = self.cluster_cdk_assembly.get_assets()
         assets_metadata = []
+        assets_contents = {}
 
         for cdk_asset in cdk_assets:
             asset_file_path = os.path.join(self.cluster_cdk_assembly.get_cloud_assembly_directory(), cdk_asset.path)
@@ -153,10 +156,22 @@ class CDKArtifactsManager:
                     "content": asset_file_content,
                 }
             )
-            LOGGER.info(f"Uploading asset {asset_id} to S3")
-
-            bucket.upload_cfn_asset(
-                asset_file_content=asset_file_content, asset_name=asset_id, format=S3FileFormat.MINIFIED_JSON
-            )
+            assets_contents[asset_id] = asset_file_content
+
+        # Assets are uploaded concurrently, the unchanged ones are skipped by the bucket
+        with ThreadPoolExecutor(max_workers=ARTIFACTS_UPLOAD_MAX_WORKERS) as executor:
+            uploads = []
+            for asset_id, asset_file_content in assets_contents.items():
+                LOGGER.info(f"Uploading asset {asset_id} to S3")
+                uploads.append(
+                    executor.submit(
+                        bucket.upload_cfn_asset,
+                        asset_file_content=asset_file_content,
+                        asset_name=asset_id,
+                        format=S3FileFormat.MINIFIED_JSON,
+                    )
+                )
+            for upload in uploads:
+                upload.result()
 
         return assets_metadata
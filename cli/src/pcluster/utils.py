@@ -9,29 +9,31 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import contextvars
 import datetime
 import functools
 import itertools
 import json
 import logging
 import os
+import queue
 import random
 import re
 import string
 import sys
+import threading
 import time
 import urllib
 import zipfile
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from io import BytesIO
 from shlex import quote
-from typing import Callable, NoReturn
+from typing import Callable, Dict, NoReturn
 from urllib.error import URLError
 from urllib.parse import urlparse
 
 import boto3
 import dateutil.parser
-import pkg_resources
 import yaml
 from yaml import SafeLoader
 from yaml.constructor import ConstructorError
@@ -144,13 +146,16 @@ def zip_dir(path):
     Create a zip archive containing all files and dirs rooted in path.
 
     The archive is created in memory and a file handler is returned by the function.
+    The archive is deterministic, entries are sorted and have a fixed timestamp, so that the same content
+    always produces the same archive.
     :param path: directory containing the resources to archive.
     :return: file handler pointing to the compressed archive.
     """
     file_out = BytesIO()
     with zipfile.ZipFile(file_out, "w", zipfile.ZIP_DEFLATED) as ziph:
-        for root, _, files in os.walk(path):
-            for file in files:
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for file in sorted(files):
                 _add_file_to_zip(
                     ziph,
                     os.path.join(root, file),
@@ -266,6 +271,49 @@ def get_stack_output_value(stack_outputs, output_key):
     return next((o.get("OutputValue") for o in stack_outputs if o.get("OutputKey") == output_key), None)
 
 
+def wait_until(
+    poll: Callable,
+    is_done: Callable,
+    initial_delay: float = 1,
+    max_delay: float = 30,
+    backoff_factor: float = 2,
+    jitter: float = 0.25,
+    timeout: float = None,
+    on_poll: Callable = None,
+    description: str = "the operation to complete",
+):
+    """
+    Call poll until is_done returns True for its result, waiting with exponential backoff and jitter between calls.
+
+    The delay starts from initial_delay and it is multiplied by backoff_factor after every call, up to max_delay,
+    minus a random fraction (up to jitter) of it, so that concurrent waiters do not poll in lockstep.
+
+    :param poll: function returning the current state
+    :param is_done: function telling if the given state is the one to wait for
+    :param timeout: max seconds to wait, a TimeoutError is raised when the deadline expires. None to wait forever
+    :param on_poll: optional hook called with the state returned by every poll, e.g. to report progress
+    :param description: description of the awaited event, used in the timeout error message
+    :return: the last state returned by poll
+    """
+    deadline = time.monotonic() + timeout if timeout is not None else None
+    delay = initial_delay
+    while True:
+        state = poll()
+        if on_poll:
+            on_poll(state)
+        if is_done(state):
+            return state
+
+        sleep_time = delay * (1 - jitter * random.random())  # nosec B311
+        if deadline is not None:
+            remaining_time = deadline - time.monotonic()
+            if remaining_time <= 0:
+                raise TimeoutError(f"Timeout expired while waiting for {description}.")
+            sleep_time = min(sleep_time, remaining_time)
+        time.sleep(sleep_time)
+        delay = min(delay * backoff_factor, max_delay)
+
+
 def verify_stack_status(stack_name, waiting_states, successful_states):
     """
     Wait for the stack creation to be completed and notify if the stack creation fails.
@@ -277,17 +325,26 @@ def verify_stack_status(stack_name, waiting_states, successful_states):
     """
     from pcluster.aws.aws_api import AWSApi  # pylint: disable=import-outside-toplevel
 
-    status = AWSApi.instance().cfn.describe_stack(stack_name).get("StackStatus")
     resource_status = ""
-    while status in waiting_states:
-        status = AWSApi.instance().cfn.describe_stack(stack_name).get("StackStatus")
-        events = AWSApi.instance().cfn.get_stack_events(stack_name)["StackEvents"][0]
-        resource_status = ("Status: %s - %s" % (events.get("LogicalResourceId"), events.get("ResourceStatus"))).ljust(
-            80
-        )
-        sys.stdout.write("\r%s" % resource_status)
-        sys.stdout.flush()
-        time.sleep(5)
+
+    def _print_resource_status(status):
+        nonlocal resource_status
+        if status in waiting_states:
+            events = AWSApi.instance().cfn.get_stack_events(stack_name)["StackEvents"][0]
+            resource_status = (
+                "Status: %s - %s" % (events.get("LogicalResourceId"), events.get("ResourceStatus"))
+            ).ljust(80)
+            sys.stdout.write("\r%s" % resource_status)
+            sys.stdout.flush()
+
+    status = wait_until(
+        poll=lambda: AWSApi.instance().cfn.describe_stack(stack_name).get("StackStatus"),
+        is_done=lambda status: status not in waiting_states,
+        initial_delay=2,
+        max_delay=15,
+        on_poll=_print_resource_status,
+        description=f"stack {stack_name}",
+    )
     # print the last status update in the logs
     if resource_status != "":
         LOGGER.debug(resource_status)
@@ -305,6 +362,9 @@ def get_templates_bucket_path():
 
 def get_installed_version(base_version_only: bool = False):
     """Get the version of the installed aws-parallelcluster package."""
+    # Imported only when needed, since it takes a significant part of the CLI startup time
+    import pkg_resources  # pylint: disable=import-outside-toplevel
+
     pkg_distribution = pkg_resources.get_distribution("aws-parallelcluster")
     return pkg_distribution.version if not base_version_only else pkg_distribution.parsed_version.base_version
 
@@ -480,6 +540,65 @@ def batch_by_property_callback(items, property_callback: Callable[..., int], bat
             yield current_batch
 
 
+class DaemonThreadPool:
+    """
+    Minimal thread pool running the submitted functions on daemon threads.
+
+    Unlike ThreadPoolExecutor, whose threads are joined at interpreter exit, functions still running when the pool is
+    shut down do not prevent the process from exiting, e.g. the ones exceeding the timeout they were waited for.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self._max_workers = max_workers
+        self._tasks = queue.SimpleQueue()
+        self._futures = []
+        for index in range(max_workers):
+            threading.Thread(target=self._work, name=f"{thread_name_prefix}_{index}", daemon=True).start()
+
+    def submit(self, function, *args) -> Future:
+        """Schedule the execution of the function with the given arguments."""
+        future = Future()
+        self._futures.append(future)
+        self._tasks.put((future, function, args))
+        return future
+
+    def shutdown(self):
+        """Cancel the functions not started yet and stop the threads once the running functions complete."""
+        for future in self._futures:
+            future.cancel()
+        for _ in range(self._max_workers):
+            self._tasks.put(None)
+
+    def _work(self):
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                return
+            future, function, args = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(function(*args))
+            except BaseException as e:  # pylint: disable=broad-except
+                future.set_exception(e)
+
+
+def execute_concurrently(functions: Dict[str, Callable], timeout: float = None) -> Dict[str, Future]:
+    """
+    Execute the given functions concurrently, waiting for their completion up to the given timeout.
+
+    Return the futures of the executions by name. The futures not done are the ones that exceeded the timeout:
+    they are not waited for, their result is discarded and they do not delay the exit of the process.
+    """
+    executor = DaemonThreadPool(max_workers=max(len(functions), 1), thread_name_prefix="pcluster-concurrent")
+    try:
+        futures = {name: executor.submit(function) for name, function in functions.items()}
+        wait(futures.values(), timeout=timeout)
+        return futures
+    finally:
+        executor.shutdown()
+
+
 class AsyncUtils:
     """Utility class for async functions."""
 
@@ -556,8 +675,10 @@ class AsyncUtils:
 
         @functools.wraps(func)
         async def wrapper(self, *args, **kwargs):
+            # Propagate the context of the calling task, e.g. to track the AWS calls issued on its behalf
+            context = contextvars.copy_context()
             return await asyncio.get_event_loop().run_in_executor(
-                AsyncUtils._thread_pool_executor, lambda: func(self, *args, **kwargs)
+                AsyncUtils._thread_pool_executor, lambda: context.run(func, self, *args, **kwargs)
             )
 
         return wrapper
@@ -576,6 +697,8 @@ def retrieve_supported_regions():
                 retrieve_supported_regions.cache = f.read().decode("utf-8").split("\n")
         except URLError:
             # When the file is not found on the URL, use local file. This is useful when developing new versions.
+            import pkg_resources  # pylint: disable=import-outside-toplevel
+
             with open(pkg_resources.resource_filename(__name__, "/resources/supported-regions"), encoding="utf-8") as f:
                 retrieve_supported_regions.cache = f.read().split("\n")
     return retrieve_supported_regions.cache
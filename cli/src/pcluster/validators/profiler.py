@@ -0,0 +1,131 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+from tabulate import tabulate
+
+from pcluster.aws.common import track_call_stats
+
+LOGGER = logging.getLogger(__name__)
+
+PROFILE_FORMAT_TABLE = "table"
+PROFILE_FORMAT_JSON = "json"
+
+
+class _ProfileRecord:
+    """Aggregated counters of the validators executions."""
+
+    def __init__(self):
+        self.executions = 0
+        self.wall_time = 0.0
+        self.aws_calls = 0
+        self.cache_hits = 0
+
+    def add(self, wall_time, aws_calls, cache_hits):
+        self.executions += 1
+        self.wall_time += wall_time
+        self.aws_calls += aws_calls
+        self.cache_hits += cache_hits
+
+    def to_dict(self):
+        return {
+            "executions": self.executions,
+            "wallTime": round(self.wall_time, 3),
+            "awsCalls": self.aws_calls,
+            "cacheHits": self.cache_hits,
+        }
+
+
+class ValidationProfiler:
+    """
+    Collect wall time, AWS calls and cache hits of the executed validators, by validator type and by resource path.
+
+    The profiling is opt-in and is enabled by setting PCLUSTER_VALIDATION_PROFILE to "table" or "json",
+    the format of the report written to stderr at the end of the validation.
+    Since validators are executed concurrently, the wall time of a validator may include the time spent waiting
+    for the others, hence the sum of the wall times can exceed the total validation time.
+    """
+
+    def __init__(self, report_format: str = PROFILE_FORMAT_TABLE):
+        self._format = report_format
+        self._lock = threading.Lock()
+        self._by_validator = {}
+        self._by_resource = {}
+        self._start_time = time.perf_counter()
+
+    @staticmethod
+    def from_environment():
+        """Return a profiler if enabled by PCLUSTER_VALIDATION_PROFILE, None otherwise."""
+        report_format = os.environ.get("PCLUSTER_VALIDATION_PROFILE", "").strip().lower()
+        if report_format in ("", "false", "0"):
+            return None
+        return ValidationProfiler(PROFILE_FORMAT_JSON if report_format == PROFILE_FORMAT_JSON else PROFILE_FORMAT_TABLE)
+
+    @contextmanager
+    def profile(self, validator_type: str, resource_path: str):
+        """Record the execution of the validator executed in the context."""
+        start = time.perf_counter()
+        with track_call_stats() as stats:
+            try:
+                yield
+            finally:
+                wall_time = time.perf_counter() - start
+                with self._lock:
+                    for records, key in ((self._by_validator, validator_type), (self._by_resource, resource_path)):
+                        records.setdefault(key, _ProfileRecord()).add(wall_time, stats.aws_calls, stats.cache_hits)
+
+    async def profile_async(self, validator_type: str, resource_path: str, coroutine):
+        """Await the given validator coroutine recording its execution."""
+        with self.profile(validator_type, resource_path):
+            return await coroutine
+
+    def report(self):
+        """Return the collected counters, sorted by descending wall time."""
+
+        def _sorted(records, key_name):
+            return [
+                {key_name: key, **record.to_dict()}
+                for key, record in sorted(records.items(), key=lambda item: item[1].wall_time, reverse=True)
+            ]
+
+        with self._lock:
+            return {
+                "totalWallTime": round(time.perf_counter() - self._start_time, 3),
+                "validators": _sorted(self._by_validator, "validator"),
+                "resources": _sorted(self._by_resource, "resource"),
+            }
+
+    def format_report(self):
+        """Return the report in the configured format."""
+        report = self.report()
+        if self._format == PROFILE_FORMAT_JSON:
+            return json.dumps(report, indent=2)
+
+        headers = ["Executions", "Wall time (s)", "AWS calls", "Cache hits"]
+        return "\n\n".join(
+            [
+                f"Validation completed in {report['totalWallTime']} seconds",
+                tabulate([list(entry.values()) for entry in report["validators"]], headers=["Validator", *headers]),
+                tabulate([list(entry.values()) for entry in report["resources"]], headers=["Resource", *headers]),
+            ]
+        )
+
+    def print_report(self):
+        """Write the report to stderr, to not interfere with the output of the command, and to the log."""
+        formatted_report = self.format_report()
+        LOGGER.info("Validation profile:\n%s", formatted_report)
+        print(formatted_report, file=sys.stderr)
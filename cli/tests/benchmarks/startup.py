@@ -0,0 +1,128 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Startup benchmarks of the pcluster CLI and of the API Lambda handler.
+
+Print a report of the import time by module and of the CLI and Lambda timings with:
+
+    python -m tests.benchmarks.startup [--repeat N] [--top N]
+
+from the cli directory. AWS API calls are stubbed, so neither credentials nor network access are required.
+"""
+
+import json
+import os
+import statistics
+import subprocess  # nosec B404
+import sys
+import tempfile
+
+import argparse
+from tabulate import tabulate
+
+CLI_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# CLI commands measured by the benchmarks
+CLI_BENCHMARKS = {
+    "pcluster --help": ["--help"],
+    "pcluster list-clusters": ["list-clusters"],
+}
+
+
+def isolated_env(home: str):
+    """
+    Return the environment of the benchmarked processes, with the given home directory.
+
+    The CLI stores the compiled model of the API specification in the cache directory under the home directory, so
+    every process run with a new home directory measures the startup of the first run, without writing to the
+    cache directory of the user.
+    """
+    env = {**os.environ, "HOME": home}
+    env.pop("PCLUSTER_PERSISTENT_CACHE_DIR", None)
+    env.pop("PCLUSTER_CLI_MODEL_CACHE_DISABLED", None)
+    return env
+
+
+def import_times(module: str):
+    """
+    Return the import time of the given module and of the modules it imports, in a fresh interpreter.
+
+    :return: list of (module, self time, cumulative time) tuples in seconds, sorted by descending cumulative time
+    """
+    with tempfile.TemporaryDirectory() as home:
+        output = subprocess.run(  # nosec B603
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            cwd=CLI_DIR,
+            env=isolated_env(home),
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+    times = []
+    for line in output.splitlines():
+        # Lines are in the format "import time: <self us> | <cumulative us> | <indented module name>"
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative_time, name = line.split(":", 1)[1].split("|")
+        times.append((name.strip(), int(self_time) / 1e6, int(cumulative_time) / 1e6))
+    return sorted(times, key=lambda entry: entry[2], reverse=True)
+
+
+def run_stubbed(target: str, args=None, home: str = None):
+    """
+    Execute the CLI with the given args or the Lambda handler in a fresh interpreter, with stubbed AWS API calls.
+
+    :param target: "cli" or "lambda"
+    :param home: home directory of the process, a new empty one by default, i.e. the startup of the first run
+    :return: a dict with the timings in seconds of the execution phases and the list of the imported modules
+    """
+    with tempfile.TemporaryDirectory() as result_dir:
+        result_file = os.path.join(result_dir, "result.json")
+        subprocess.run(  # nosec B603
+            [sys.executable, "-m", "tests.benchmarks.stubbed_runner", result_file, target, *(args or [])],
+            cwd=CLI_DIR,
+            env=isolated_env(home or result_dir),
+            capture_output=True,
+            check=True,
+        )
+        with open(result_file, encoding="utf-8") as result:
+            return json.load(result)
+
+
+def median_timings(target: str, args=None, repeat: int = 5, home: str = None):
+    """Return the median of the timings of the given number of executions of run_stubbed."""
+    runs = [run_stubbed(target, args, home)["timings"] for _ in range(repeat)]
+    return {phase: statistics.median(run[phase] for run in runs) for phase in runs[0]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the startup time of the pcluster CLI and API Lambda.")
+    parser.add_argument("--repeat", type=int, default=5, help="Executions of every benchmark (default: 5)")
+    parser.add_argument("--top", type=int, default=20, help="Modules listed in the import report (default: 20)")
+    args = parser.parse_args()
+
+    for module in ["pcluster.cli.entrypoint", "pcluster.api.awslambda.entrypoint"]:
+        times = import_times(module)
+        print(f"Import time of {module}: {times[0][2]:.3f}s\n")
+        rows = [(name, f"{self_time:.3f}", f"{cumulative:.3f}") for name, self_time, cumulative in times[: args.top]]
+        print(tabulate(rows, headers=["Module", "Self (s)", "Cumulative (s)"]) + "\n")
+
+    rows = []
+    for name, cli_args in CLI_BENCHMARKS.items():
+        rows.append((name, *(f"{value:.3f}" for value in median_timings("cli", cli_args, args.repeat).values())))
+    print(tabulate(rows, headers=["CLI command", "Import (s)", "Run (s)"]) + "\n")
+
+    timings = median_timings("lambda", repeat=args.repeat)
+    print(tabulate([[f"{value:.3f}" for value in timings.values()]], headers=["Import (s)", "Cold (s)", "Warm (s)"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Execute the pcluster CLI or the API Lambda handler with stubbed AWS API calls and write their timings to a file.
+
+Every measurement is executed in a fresh interpreter by the startup benchmarks, so that the import time is
+measured as a user would experience it. Usage:
+
+    python -m tests.benchmarks.stubbed_runner RESULT_FILE cli [CLI_ARGS...]
+    python -m tests.benchmarks.stubbed_runner RESULT_FILE lambda
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+
+# Responses returned in place of the AWS API calls, operations not listed here return an empty response
+STUBBED_RESPONSES = {
+    "ListStacks": {"StackSummaries": []},
+    "DescribeStacks": {"Stacks": []},
+}
+STUBBED_REGION = "us-east-1"
+
+
+def _stub_aws():
+    """Replace all the AWS API calls with the stubbed responses, without network calls nor credentials."""
+    import botocore.client  # pylint: disable=import-outside-toplevel
+
+    from pcluster.utils import retrieve_supported_regions  # pylint: disable=import-outside-toplevel
+
+    def _make_api_call(_client, operation_name, _api_params):
+        return STUBBED_RESPONSES.get(operation_name, {})
+
+    botocore.client.BaseClient._make_api_call = _make_api_call
+    retrieve_supported_regions.cache = [STUBBED_REGION]
+
+
+def _run_cli(args):
+    start = time.perf_counter()
+    from pcluster.cli.entrypoint import run  # pylint: disable=import-outside-toplevel
+
+    imported = time.perf_counter()
+    _stub_aws()
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.suppress(SystemExit):
+        run(args)
+    return {"import": imported - start, "run": time.perf_counter() - imported}
+
+
+def _list_clusters_event():
+    return {
+        "resource": "/v3/clusters",
+        "path": "/v3/clusters",
+        "httpMethod": "GET",
+        "headers": None,
+        "multiValueHeaders": None,
+        "queryStringParameters": None,
+        "multiValueQueryStringParameters": None,
+        "pathParameters": None,
+        "stageVariables": None,
+        "requestContext": {"resourcePath": "/v3/clusters", "httpMethod": "GET", "path": "/v3/clusters"},
+        "body": None,
+        "isBase64Encoded": False,
+    }
+
+
+class _LambdaContext:
+    function_name = "pcluster-benchmark"
+    memory_limit_in_mb = 128
+    invoked_function_arn = f"arn:aws:lambda:{STUBBED_REGION}:123456789012:function:pcluster-benchmark"
+    aws_request_id = "00000000-0000-0000-0000-000000000000"
+
+
+def _run_lambda():
+    os.environ.update({"AWS_REGION": STUBBED_REGION, "POWERTOOLS_TRACE_DISABLED": "1", "POWERTOOLS_LOG_LEVEL": "ERROR"})
+    start = time.perf_counter()
+    from pcluster.api.awslambda.entrypoint import lambda_handler  # pylint: disable=import-outside-toplevel
+
+    imported = time.perf_counter()
+    _stub_aws()
+    with contextlib.redirect_stdout(io.StringIO()):
+        response = lambda_handler(_list_clusters_event(), _LambdaContext())
+        cold = time.perf_counter()
+        lambda_handler(_list_clusters_event(), _LambdaContext())
+        warm = time.perf_counter()
+    if response["statusCode"] != 200:
+        raise RuntimeError(f"Unexpected response from the Lambda handler: {response}")
+    return {"import": imported - start, "cold": cold - imported, "warm": warm - cold}
+
+
+def main():
+    result_file, target, args = sys.argv[1], sys.argv[2], sys.argv[3:]
+    os.environ.update(
+        {"AWS_DEFAULT_REGION": STUBBED_REGION, "AWS_ACCESS_KEY_ID": "benchmark", "AWS_SECRET_ACCESS_KEY": "benchmark"}
+    )
+    timings = _run_cli(args) if target == "cli" else _run_lambda()
+    with open(result_file, "w", encoding="utf-8") as result:
+        json.dump({"timings": timings, "modules": sorted(sys.modules)}, result)
+
+
+if __name__ == "__main__":
+    main()
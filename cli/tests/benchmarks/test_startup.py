@@ -0,0 +1,75 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import pytest
+from assertpy import assert_that
+
+from tests.benchmarks.startup import CLI_BENCHMARKS, import_times, median_timings, run_stubbed
+
+# Modules that must be imported only by the commands that need them, since they dominate the CLI startup time
+HEAVY_MODULES = ["aws_cdk", "connexion", "flask", "pkg_resources", "pcluster.api.controllers", "pcluster.models"]
+
+# Startup time budgets in seconds, scaled by PCLUSTER_BENCHMARK_BUDGET_FACTOR on slower machines
+CLI_BUDGETS = {"pcluster --help": 1.0, "pcluster list-clusters": 2.0}
+LAMBDA_BUDGETS = {"import": 2.0, "cold": 2.0, "warm": 0.5}
+
+run_benchmarks = pytest.mark.skipif(
+    not os.environ.get("PCLUSTER_RUN_BENCHMARKS"),
+    reason="Startup benchmarks run only if PCLUSTER_RUN_BENCHMARKS is set",
+)
+
+
+def _budget(seconds):
+    return seconds * float(os.environ.get("PCLUSTER_BENCHMARK_BUDGET_FACTOR", "1"))
+
+
+@pytest.mark.parametrize("first_run", [True, False])
+def test_cli_help_does_not_import_heavy_modules(tmp_path, first_run):
+    if not first_run:
+        run_stubbed("cli", ["--help"], str(tmp_path))
+    modules = run_stubbed("cli", ["--help"], None if first_run else str(tmp_path))["modules"]
+
+    heavy_modules = [
+        module
+        for module in modules
+        if any(module == heavy or module.startswith(f"{heavy}.") for heavy in HEAVY_MODULES)
+    ]
+    assert_that(heavy_modules).is_empty()
+
+
+def test_import_times():
+    times = import_times("pcluster.cli.entrypoint")
+
+    assert_that(times[0][0]).is_equal_to("pcluster.cli.entrypoint")
+    assert_that([name for name, _, _ in times]).contains("pcluster.cli.model", "boto3")
+    assert_that(all(cumulative >= self_time >= 0 for _, self_time, cumulative in times)).is_true()
+
+
+@run_benchmarks
+@pytest.mark.parametrize("name", CLI_BUDGETS.keys())
+@pytest.mark.parametrize("first_run", [True, False])
+def test_cli_startup_time(tmp_path, name, first_run):
+    # Every first run has a new home directory, the others reuse the model compiled in the temporary home directory
+    home = None if first_run else str(tmp_path)
+    if home:
+        run_stubbed("cli", CLI_BENCHMARKS[name], home)
+    timings = median_timings("cli", CLI_BENCHMARKS[name], home=home)
+
+    assert_that(sum(timings.values())).is_less_than(_budget(CLI_BUDGETS[name]))
+
+
+@run_benchmarks
+def test_lambda_startup_time():
+    timings = median_timings("lambda")
+
+    for phase, budget in LAMBDA_BUDGETS.items():
+        assert_that(timings[phase]).described_as(phase).is_less_than(_budget(budget))
@@ -34,10 +34,13 @@ def clear_env(mocker):
 
 @pytest.fixture(autouse=True)
 def reset_aws_api():
-    """Reset AWSApi singleton to remove dependencies between tests."""
+    """Reset AWSApi singleton and caches to remove dependencies between tests."""
     from pcluster.aws.aws_api import AWSApi
+    from pcluster.aws.common import Cache
 
-    AWSApi._instance = None
+    AWSApi.reset()
+    # Process scoped cache entries are not bound to the AWSApi instance
+    Cache.clear_all()
 
 
 @pytest.fixture
@@ -95,6 +98,7 @@ def boto3_stubber(mocker, boto3_stubber_path):
     # use **kwargs to skip parameters passed to the boto3.client other than the "service"
     # e.g. boto3.client("ec2", region_name=region, ...) --> x = ec2
     mocked_client_factory.client.side_effect = lambda x, **kwargs: mocked_clients[x]
+    mocked_client_factory.session.Session.return_value.client.side_effect = lambda x, **kwargs: mocked_clients[x]
 
     def _boto3_stubber(service, mocked_requests):
         if "AWS_DEFAULT_REGION" not in os.environ:
@@ -6,6 +6,7 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 import json
+import threading
 from datetime import datetime
 
 import pytest
@@ -17,7 +18,7 @@ from pcluster.api.controllers.common import get_validator_suppressors
 from pcluster.api.models import CloudFormationStackStatus
 from pcluster.api.models.cluster_status import ClusterStatus
 from pcluster.api.models.validation_level import ValidationLevel
-from pcluster.aws.common import AWSClientError, BadRequestError, LimitExceededError, StackNotFoundError
+from pcluster.aws.common import AWSClientError, BadRequestError, LimitExceededError, StackNotFoundError, get_region
 from pcluster.config.common import AllValidatorsSuppressor, TypeMatchValidatorsSuppressor
 from pcluster.config.update_policy import UpdatePolicy
 from pcluster.models.cluster import (
@@ -1163,6 +1164,41 @@ class TestDescribeCluster:
             assert_that(response.status_code).is_equal_to(200)
             assert_that(response.get_json()).is_equal_to(expected_response)
 
+    def test_lookups_timeout(self, client, mocker, set_env):
+        set_env("PCLUSTER_DESCRIBE_CLUSTER_TIMEOUT", "1")
+        release = threading.Event()
+        mocker.patch(
+            "pcluster.aws.cfn.CfnClient.describe_stack",
+            return_value=cfn_describe_stack_mock_response({"StackStatus": "CREATE_COMPLETE"}),
+        )
+        mocker.patch(
+            "pcluster.aws.ec2.Ec2Client.describe_instances",
+            side_effect=lambda *_: release.wait(5) and ([], None),
+        )
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.compute_fleet_status", new_callable=mocker.PropertyMock
+        ).side_effect = (lambda: release.wait(5) and ComputeFleetStatus.RUNNING)
+        mocker.patch(
+            "pcluster.models.cluster.Cluster.config_presigned_url", new_callable=mocker.PropertyMock
+        ).return_value = "presigned-url"
+        mocker.patch("pcluster.models.login_nodes_status.LoginNodesStatus.retrieve_data")
+        mocker.patch(
+            "pcluster.models.login_nodes_status.LoginNodesStatus.get_login_nodes_pool_available",
+            return_value=False,
+        )
+
+        try:
+            response = self._send_test_request(client)
+        finally:
+            release.set()
+
+        # The lookups exceeding the timeout are omitted from the response, without discarding the others
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(200)
+            assert_that(response.get_json()).does_not_contain_key("headNode")
+            assert_that(response.get_json()).contains_entry({"computeFleetStatus": "UNKNOWN"})
+            assert_that(response.get_json()).contains_entry({"clusterConfiguration": {"url": "presigned-url"}})
+
     @pytest.mark.parametrize(
         "error_type, error_code, http_code",
         [
@@ -1779,6 +1815,66 @@ class TestListClusters:
             assert_that(response.status_code).is_equal_to(400)
             assert_that(response.get_json()).is_equal_to(expected_response)
 
+    def test_multi_region_request(self, mocker, client):
+        region_calls = []
+
+        def _list_pcluster_stacks(next_token=None):
+            region = get_region()
+            region_calls.append((region, next_token))
+            if region == "us-west-2":
+                raise LimitExceededError("list_pcluster_stacks", "error message")
+            stack = {
+                "StackName": f"cluster-{region}",
+                "StackId": f"arn:{region}",
+                "CreationTime": datetime(2021, 4, 30),
+                "StackStatus": CloudFormationStackStatus.CREATE_COMPLETE,
+                "Tags": [{"Key": "parallelcluster:version", "Value": "3.0.0"}],
+                "Parameters": [{"ParameterKey": "Scheduler", "ParameterValue": "slurm"}],
+            }
+            return [stack], "token" if region == "eu-west-1" and not next_token else None
+
+        mocker.patch("pcluster.aws.cfn.CfnClient.list_pcluster_stacks", side_effect=_list_pcluster_stacks)
+
+        response = self._send_test_request(client, "us-east-1,eu-west-1,us-west-2")
+        assert_that(response.status_code).is_equal_to(200)
+        clusters = response.get_json()["clusters"]
+        assert_that([(cluster["clusterName"], cluster["region"]) for cluster in clusters]).is_equal_to(
+            [("cluster-us-east-1", "us-east-1"), ("cluster-eu-west-1", "eu-west-1")]
+        )
+        assert_that(region_calls).contains_only(("us-east-1", None), ("eu-west-1", None), ("us-west-2", None))
+
+        # Only the regions having more clusters and the failed ones are queried with the next token
+        region_calls.clear()
+        response = self._send_test_request(client, "us-east-1,eu-west-1,us-west-2", response.get_json()["nextToken"])
+        assert_that(response.status_code).is_equal_to(200)
+        assert_that(response.get_json()["clusters"]).is_length(1)
+        assert_that(region_calls).contains_only(("eu-west-1", "token"), ("us-west-2", ""))
+
+        # The error is returned if all the queried regions fail
+        region_calls.clear()
+        response = self._send_test_request(client, "us-east-1,eu-west-1,us-west-2", response.get_json()["nextToken"])
+        assert_that(response.status_code).is_equal_to(429)
+        assert_that(region_calls).is_equal_to([("us-west-2", "")])
+
+    @pytest.mark.parametrize(
+        "region, next_token, expected_message",
+        [
+            ("us-east-1,us-east-", None, "Bad Request: invalid or unsupported region 'us-east-'"),
+            ("us-east-1,eu-west-1", "invalid", "Bad Request: invalid nextToken for the given regions"),
+            (
+                "us-east-1,eu-west-1",
+                "eyJ1cy13ZXN0LTIiOiBudWxsfQ==",  # {"us-west-2": null}
+                "Bad Request: invalid nextToken for the given regions",
+            ),
+        ],
+    )
+    def test_malformed_multi_region_request(self, client, region, next_token, expected_message):
+        response = self._send_test_request(client, region, next_token)
+
+        with soft_assertions():
+            assert_that(response.status_code).is_equal_to(400)
+            assert_that(response.get_json()).is_equal_to({"message": expected_message})
+
     @pytest.mark.parametrize(
         "error_type, error_code, http_code",
         [
@@ -53,6 +53,31 @@ class TestConfigureAwsRegion:
             assert_that(os.environ["AWS_DEFAULT_REGION"]).is_equal_to(region)
 
 
+@pytest.mark.parametrize(
+    "region, expected_region",
+    [("eu-west-1,", "eu-west-1"), (" eu-west-1 ", "eu-west-1"), (",", "us-east-1"), ("", "us-east-1")],
+)
+def test_configure_aws_region_multi_region_single_region(set_env, region, expected_region):
+    @configure_aws_region(multi_region=True)
+    def _decorated_func(region):
+        pass
+
+    set_env("AWS_DEFAULT_REGION", "us-east-1")
+    # A list with a single region is handled as that region, an empty list as the default one
+    _decorated_func(region=region)
+    assert_that(os.environ["AWS_DEFAULT_REGION"]).is_equal_to(expected_region)
+
+
+def test_configure_aws_region_list_not_allowed():
+    @configure_aws_region()
+    def _decorated_func(region):
+        pass
+
+    with pytest.raises(BadRequestException) as e:
+        _decorated_func(region="eu-west-1,")
+    assert_that(str(e.value.content)).contains("invalid or unsupported region")
+
+
 @pytest.mark.parametrize(
     "region, yaml, error",
     [
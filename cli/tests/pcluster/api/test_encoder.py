@@ -0,0 +1,112 @@
+#  Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+#  Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+#  with the License. A copy of the License is located at http://aws.amazon.com/apache2.0/
+#  or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+#  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+#  limitations under the License.
+from datetime import datetime
+
+import flask
+import pytest
+from assertpy import assert_that
+from connexion.jsonifier import Jsonifier
+
+from pcluster.api import encoder
+from pcluster.api.flask_app import CustomFlaskApi, ParallelClusterFlaskApp
+from pcluster.api.models import (
+    DescribeImageResponseContent,
+    Ec2AmiInfo,
+    ImageBuildStatus,
+    ListClusterLogStreamsResponseContent,
+    LogStream,
+    Tag,
+)
+
+
+@pytest.fixture
+def app_context():
+    with ParallelClusterFlaskApp().flask_app.app_context():
+        yield
+
+
+def _log_streams_response(count):
+    return ListClusterLogStreamsResponseContent(
+        log_streams=[
+            LogStream(
+                log_stream_name=f"ip-10-0-0-{index}.i-{index:017x}.cfn-init",
+                log_stream_arn=f"arn:aws:logs:us-east-1:111111111111:log-group:cluster:log-stream:stream-{index}",
+                creation_time=datetime(2021, 6, 1, 12, 30, 45),
+                first_event_timestamp=datetime(2021, 6, 1, 12, 30, 45, 123000),
+                last_event_timestamp=datetime(2021, 6, 2, 8, 0, 0),
+                last_ingestion_time=datetime(2021, 6, 2, 8, 0, 1),
+            )
+            for index in range(count)
+        ],
+        next_token="token",
+    )
+
+
+def _image_response():
+    return DescribeImageResponseContent(
+        image_id="image",
+        region="us-east-1",
+        version="3.13.0",
+        image_build_status=ImageBuildStatus.BUILD_COMPLETE,
+        image_configuration={"url": "https://s3.amazonaws.com/config.yaml"},
+        creation_time=datetime(2021, 6, 1, 12, 30, 45),
+        ec2_ami_info=Ec2AmiInfo(ami_id="ami-12345678", tags=[Tag(key="key", value="value")]),
+    )
+
+
+@pytest.mark.parametrize("response", [_log_streams_response(3), _image_response()])
+def test_to_dict(response):
+    """Verify the compiled serialized fields produce the same dict as the reflective walk of the model properties."""
+    expected = {}
+    for attr in response.openapi_types:
+        value = getattr(response, attr)
+        if isinstance(value, list):
+            value = [item.to_dict() if hasattr(item, "to_dict") else item for item in value]
+        elif hasattr(value, "to_dict"):
+            value = value.to_dict()
+        expected[attr] = value
+
+    assert_that(response.to_dict()).is_equal_to(expected)
+
+
+@pytest.mark.usefixtures("app_context")
+@pytest.mark.parametrize(
+    "response",
+    [
+        _log_streams_response(3),
+        _image_response(),
+        [_image_response()],
+        {"creationTime": datetime(2021, 6, 1, 12, 30, 45)},
+    ],
+)
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_fast_jsonifier(mocker, response, use_orjson):
+    """Verify the fast path jsonifier produces the same document of the Flask encoder, with or without orjson."""
+    if not use_orjson:
+        mocker.patch("pcluster.api.encoder.orjson", None)
+    elif encoder.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    expected = Jsonifier(flask.json, indent=2).dumps(response)
+
+    assert_that(encoder.FastJsonifier(flask.json, indent=2).dumps(response)).is_equal_to(expected)
+    assert_that(expected).contains('"creationTime": "2021-06-01T12:30:45.000Z"')
+
+
+@pytest.mark.usefixtures("app_context")
+def test_fast_jsonifier_fallback():
+    """Verify the data not supported by orjson are dumped with the configured json library."""
+    response = {"size": 2**64}
+
+    assert_that(encoder.FastJsonifier(flask.json, indent=2).dumps(response)).is_equal_to(
+        Jsonifier(flask.json, indent=2).dumps(response)
+    )
+
+
+def test_flask_api_jsonifier():
+    assert_that(CustomFlaskApi.jsonifier).is_instance_of(encoder.FastJsonifier)
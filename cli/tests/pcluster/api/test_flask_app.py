@@ -185,8 +185,81 @@ class TestParallelClusterFlaskApp:
             body={"message": "Unsupported Media Type: Invalid Content-type (text/plain), expected JSON data"},
             code=415,
         )
-        assert_that(caplog.records[2].levelno).is_equal_to(logging.INFO)
-        assert_that(caplog.records[2].message).contains(
+        assert_that(caplog.records[1].message).contains(
             "'Unsupported Media Type: Invalid Content-type (text/plain), expected JSON data'}"
         )
+        assert_that(caplog.records[2].levelno).is_equal_to(logging.INFO)
+        assert_that(caplog.records[2].message).starts_with(
+            "Responding to request POST /v3/clusters?region=eu-west-1: 415 in "
+        ).ends_with(" ms - Body size: 92")
+        assert_that(caplog.records[2].response).contains_entry({"status": 415}, {"body_size": 92})
         assert_that(caplog.records[2].exc_info).is_false()
+
+    @pytest.mark.parametrize(
+        "log_bodies, sample_rate, expected_request_message, expected_response_message",
+        [
+            (None, None, "Handling request: POST /echo? - Body size: 10", "Responding to request POST /echo?: 200 in "),
+            (
+                "true",
+                None,
+                "Handling request: POST /echo? - Body size: 10 - Body: 0123456789",
+                '- Body size: 14 - Body: {"body":"0... (truncated)',
+            ),
+            (
+                "true",
+                "0",
+                "Handling request: POST /echo? - Body size: 10",
+                "Responding to request POST /echo?: 200 in ",
+            ),
+        ],
+        ids=["disabled", "enabled", "not_sampled"],
+    )
+    def test_log_bodies(
+        self, caplog, set_env, unset_env, log_bodies, sample_rate, expected_request_message, expected_response_message
+    ):
+        for variable, value in [
+            ("PCLUSTER_API_LOG_BODIES", log_bodies),
+            ("PCLUSTER_API_LOG_BODIES_SAMPLE_RATE", sample_rate),
+        ]:
+            if value:
+                set_env(variable, value)
+            else:
+                unset_env(variable)
+        set_env("PCLUSTER_API_LOG_BODIES_MAX_SIZE", "10")
+        flask_app = ParallelClusterFlaskApp(swagger_ui=False, validate_responses=True).flask_app
+        flask_app.add_url_rule("/echo", "echo", view_func=lambda: {"body": "01"}, methods=["POST"])
+
+        with flask_app.test_client() as client:
+            client.post("/echo", data="0123456789")
+
+        assert_that(caplog.records).is_length(2)
+        assert_that(caplog.records[0].message).is_equal_to(expected_request_message)
+        assert_that(caplog.records[1].message).contains(expected_response_message)
+        if not log_bodies or sample_rate:
+            assert_that(caplog.records[1].message).does_not_contain("Body:")
+
+    def test_log_bodies_invalid_settings(self, caplog, set_env):
+        set_env("PCLUSTER_API_LOG_BODIES", "true")
+        set_env("PCLUSTER_API_LOG_BODIES_SAMPLE_RATE", "always")
+        set_env("PCLUSTER_API_LOG_BODIES_MAX_SIZE", "-1")
+        flask_app = ParallelClusterFlaskApp(swagger_ui=False, validate_responses=True).flask_app
+        flask_app.add_url_rule("/echo", "echo", view_func=lambda: {"body": "01"}, methods=["POST"])
+
+        # The invalid settings are reported once, when the app is created, and replaced by the default values
+        assert_that(caplog.records).is_length(2)
+        assert_that(caplog.records[0].levelno).is_equal_to(logging.WARNING)
+        assert_that(caplog.records[0].message).is_equal_to(
+            "Invalid value always for PCLUSTER_API_LOG_BODIES_SAMPLE_RATE, using the default value 1.0"
+        )
+        assert_that(caplog.records[1].message).is_equal_to(
+            "Invalid value -1 for PCLUSTER_API_LOG_BODIES_MAX_SIZE, using the default value 2048"
+        )
+        with flask_app.test_client() as client:
+            client.post("/echo", data="0123456789")
+            client.post("/echo", data="0123456789")
+
+        assert_that(caplog.records).is_length(6)
+        assert_that(caplog.records[2].message).is_equal_to(
+            "Handling request: POST /echo? - Body size: 10 - Body: 0123456789"
+        )
+        assert_that(caplog.records[3].message).contains('- Body size: 14 - Body: {"body":"01"}')
@@ -24,6 +24,7 @@ from pcluster.aws.imagebuilder import ImageBuilderClient
 from pcluster.aws.kms import KmsClient
 from pcluster.aws.logs import LogsClient
 from pcluster.aws.resource_groups import ResourceGroupsClient
+from pcluster.aws.resource_groups_tagging import ResourceGroupsTaggingClient
 from pcluster.aws.route53 import Route53Client
 from pcluster.aws.s3 import S3Client
 from pcluster.aws.s3_resource import S3Resource
@@ -97,6 +98,8 @@ class _DummyInstanceTypeInfo(InstanceTypeInfo):
 class _DummyAWSApi(AWSApi):
     def __init__(self):
         os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+        self.aws_region = "us-east-1"
+        self._session = None
         self._ec2 = _DummyEc2Client()
         self._efs = _DummyEfsClient()
         self._fsx = _DummyFSxClient()
@@ -112,6 +115,7 @@ class _DummyAWSApi(AWSApi):
         self._ddb_resource = _DummyDynamoResource()
         self._route53 = _DummyRoute53Client()
         self._resource_groups = _DummyResourceGroupsClient()
+        self._resource_groups_tagging = _DummyResourceGroupsTaggingClient()
         self._secretsmanager = _DummySecretsManagerClient()
         self._ssm = _DummySsmClient()
 
@@ -124,6 +128,9 @@ class _DummyCfnClient(CfnClient):
     def describe_stack_resources(self, stack_name: str):
         return {}
 
+    def list_stack_resources(self, stack_name: str):
+        return []
+
 
 class _DummyEc2Client(Ec2Client):
     def __init__(self):
@@ -139,6 +146,9 @@ class _DummyEc2Client(Ec2Client):
     def get_official_image_id(self, os, architecture, filters=None):
         return "dummy-ami-id"
 
+    def describe_instance_types(self, instance_types, max_workers=1):
+        return []
+
     def describe_subnets(self, subnet_ids):
         return [
             {
@@ -386,6 +396,15 @@ class _DummyResourceGroupsClient(ResourceGroupsClient):
         )
 
 
+class _DummyResourceGroupsTaggingClient(ResourceGroupsTaggingClient):
+    def __init__(self):
+        """Override Parent constructor. No real boto3 client is created."""
+        pass
+
+    def get_stack_arns_with_tag(self, tag_key: str, next_token: str = None):
+        return [], None
+
+
 class _DummySecretsManagerClient(SecretsManagerClient):
     def __init__(self):
         """Override Parent constructor. No real boto3 client is created."""
@@ -17,7 +17,8 @@ from datetime import datetime
 import pytest
 from assertpy import assert_that
 
-from pcluster.aws.common import AWSExceptionHandler, ImageNotFoundError, StackNotFoundError
+from pcluster.aws.aws_api import AWSApi
+from pcluster.aws.common import AWSExceptionHandler, ImageNotFoundError, StackNotFoundError, get_region
 from tests.pcluster.aws.dummy_aws_api import _DummyAWSApi, mock_aws_api
 from tests.pcluster.test_utils import FAKE_NAME
 from tests.utils import MockedBoto3Request
@@ -122,3 +123,78 @@ def test_ssm_get_parameter(mocker, response):
     mock_aws_api(mocker)
     mocker.patch("pcluster.aws.ssm.SsmClient.get_parameter", side_effect=response)
     assert_that(_DummyAWSApi().instance().ssm.get_parameter(FAKE_SSM_PARAMETER)).is_equal_to(response)
+
+
+@pytest.mark.parametrize(
+    "env, expected_max_pool_connections, expected_retries",
+    [
+        ({}, 32, {"mode": "standard", "total_max_attempts": 5}),
+        (
+            {"PCLUSTER_AWS_MAX_POOL_CONNECTIONS": "64", "AWS_RETRY_MODE": "adaptive", "AWS_MAX_ATTEMPTS": "3"},
+            64,
+            {"mode": "adaptive", "total_max_attempts": 3},
+        ),
+    ],
+)
+def test_session(set_env, env, expected_max_pool_connections, expected_retries):
+    """Verify that the clients share the session of the AWSApi instance and its connection pool and retries config."""
+    set_env("AWS_DEFAULT_REGION", "eu-west-1")
+    for key, value in env.items():
+        set_env(key, value)
+
+    aws_api = AWSApi.instance()
+    assert_that(aws_api.session).is_same_as(AWSApi.instance().session)
+    assert_that(aws_api.session.region_name).is_equal_to("eu-west-1")
+    for client in [aws_api.cfn._client, aws_api.s3._client, aws_api.s3_resource._resource.meta.client]:
+        assert_that(client.meta.region_name).is_equal_to("eu-west-1")
+        assert_that(client.meta.config.max_pool_connections).is_equal_to(expected_max_pool_connections)
+        assert_that(client.meta.config.retries).is_equal_to(expected_retries)
+    # Client specific settings are merged with the shared ones
+    assert_that(aws_api.s3._client.meta.config.s3).is_equal_to({"addressing_style": "virtual"})
+
+    # A new session is created when the region changes
+    set_env("AWS_DEFAULT_REGION", "us-east-2")
+    assert_that(AWSApi.instance().session).is_not_same_as(aws_api.session)
+    assert_that(AWSApi.instance().cfn._client.meta.region_name).is_equal_to("us-east-2")
+
+
+def test_region_scope(set_env):
+    """Verify that the instances of the scoped regions are reused and that the environment is not changed."""
+    set_env("AWS_DEFAULT_REGION", "eu-west-1")
+    AWSApi.reset()
+    default_aws_api = AWSApi.instance()
+
+    with AWSApi.region_scope("us-east-2") as aws_api:
+        assert_that(AWSApi.instance()).is_same_as(aws_api)
+        assert_that(AWSApi.scoped_region()).is_equal_to("us-east-2")
+        assert_that(get_region()).is_equal_to("us-east-2")
+        assert_that(aws_api.cfn._client.meta.region_name).is_equal_to("us-east-2")
+        with AWSApi.region_scope("ap-south-1"):
+            assert_that(AWSApi.instance().cfn._client.meta.region_name).is_equal_to("ap-south-1")
+        assert_that(AWSApi.instance()).is_same_as(aws_api)
+
+    assert_that(AWSApi.scoped_region()).is_none()
+    assert_that(AWSApi.instance()).is_same_as(default_aws_api)
+    assert_that(get_region()).is_equal_to("eu-west-1")
+    with AWSApi.region_scope("us-east-2"):
+        assert_that(AWSApi.instance()).is_same_as(aws_api)
+
+    AWSApi.reset()
+    with AWSApi.region_scope("us-east-2"):
+        assert_that(AWSApi.instance()).is_not_same_as(aws_api)
+
+
+def test_reset_keeping_sessions(set_env):
+    """Verify that the boto3 clients are reused by the new instances when the sessions are kept."""
+    set_env("AWS_DEFAULT_REGION", "eu-west-1")
+    AWSApi.reset()
+    aws_api = AWSApi.instance()
+    cfn_client = aws_api.cfn
+
+    AWSApi.reset(keep_sessions=True)
+    assert_that(AWSApi.instance()).is_not_same_as(aws_api)
+    assert_that(AWSApi.instance().cfn).is_not_same_as(cfn_client)
+    assert_that(AWSApi.instance().cfn._client).is_same_as(cfn_client._client)
+
+    AWSApi.reset()
+    assert_that(AWSApi.instance().cfn._client).is_not_same_as(cfn_client._client)
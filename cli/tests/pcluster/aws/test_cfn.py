@@ -12,7 +12,7 @@ from assertpy import assert_that
 
 from pcluster import utils as utils
 from pcluster.aws.cfn import CfnClient
-from pcluster.aws.common import AWSClientError
+from pcluster.aws.common import AWSClientError, Cache
 from tests.pcluster.test_utils import FAKE_NAME, _generate_stack_event
 from tests.utils import MockedBoto3Request
 
@@ -22,6 +22,27 @@ def boto3_stubber_path():
     return "pcluster.aws.common.boto3"
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    Cache.clear_all()
+
+
+def _mock_tagging_api_access_denied(boto3_stubber, tag, next_token):
+    expected_params = {"TagFilters": [{"Key": tag}], "ResourceTypeFilters": ["cloudformation:stack"]}
+    if next_token:
+        expected_params["PaginationToken"] = next_token
+    mocked_requests = [
+        MockedBoto3Request(
+            method="get_resources",
+            response="not authorized to perform: tag:GetResources",
+            expected_params=expected_params,
+            generate_error=True,
+            error_code="AccessDeniedException",
+        )
+    ]
+    boto3_stubber("resourcegroupstaggingapi", mocked_requests)
+
+
 class TestCfnClient:
     @pytest.mark.parametrize(
         "next_token, describe_stacks_response, expected_stacks",
@@ -88,6 +109,7 @@ class TestCfnClient:
             )
         ]
         boto3_stubber("cloudformation", mocked_requests)
+        _mock_tagging_api_access_denied(boto3_stubber, "parallelcluster:version", next_token)
 
         if not generate_error:
             stacks, next_token = CfnClient().list_pcluster_stacks(next_token=next_token)
@@ -98,6 +120,129 @@ class TestCfnClient:
                 CfnClient().list_pcluster_stacks(next_token=next_token)
             assert_that(e.value.error_code).is_equal_to("error")
 
+    @pytest.mark.parametrize(
+        "next_token, pagination_token, expected_next_token, expected_stacks",
+        [
+            # Stacks being created are added to the first page, since they can be missing from the Tagging API
+            (None, "", None, ["cluster", "new"]),
+            ("token", "next-token", "next-token", ["cluster"]),
+        ],
+    )
+    def test_list_pcluster_stacks_with_tagging_api(
+        self, set_env, boto3_stubber, mocker, next_token, pagination_token, expected_next_token, expected_stacks
+    ):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        # Serial describes to make deterministic the order of the stubbed responses
+        mocker.patch("pcluster.aws.cfn.LIST_STACKS_DESCRIBE_MAX_WORKERS", 1)
+        version_tag = {"Key": "parallelcluster:version", "Value": "3.13.0"}
+        stacks = {
+            "cluster": {"Tags": [version_tag]},
+            "nested": {"Tags": [version_tag], "ParentId": "arn:cluster"},
+            "image": {"Tags": [version_tag, {"Key": "parallelcluster:image_id", "Value": "image"}]},
+            "deleted": {"Tags": [version_tag], "StackStatus": "DELETE_COMPLETE"},
+            "missing": None,
+        }
+        # Stacks being created, not yet returned by the Tagging API
+        stacks_in_creation = {
+            "new": {"Tags": [version_tag], "StackStatus": "CREATE_IN_PROGRESS"},
+            "new-nested": {"Tags": [version_tag], "StackStatus": "CREATE_IN_PROGRESS", "ParentId": "arn:new"},
+            "other": {"Tags": [], "StackStatus": "CREATE_IN_PROGRESS"},
+        }
+
+        expected_get_resources_params = {
+            "TagFilters": [{"Key": "parallelcluster:version"}],
+            "ResourceTypeFilters": ["cloudformation:stack"],
+        }
+        if next_token:
+            expected_get_resources_params["PaginationToken"] = next_token
+        boto3_stubber(
+            "resourcegroupstaggingapi",
+            MockedBoto3Request(
+                method="get_resources",
+                response={
+                    "ResourceTagMappingList": [{"ResourceARN": f"arn:{name}", "Tags": []} for name in stacks],
+                    "PaginationToken": pagination_token,
+                },
+                expected_params=expected_get_resources_params,
+            ),
+        )
+        mocked_requests = []
+        if not next_token:
+            mocked_requests.append(
+                MockedBoto3Request(
+                    method="list_stacks",
+                    response={
+                        "StackSummaries": [
+                            {
+                                "StackId": f"arn:{name}",
+                                "StackName": name,
+                                "CreationTime": datetime.now(),
+                                "StackStatus": stack["StackStatus"],
+                                **({"ParentId": stack["ParentId"]} if "ParentId" in stack else {}),
+                            }
+                            for name, stack in [("cluster", {"StackStatus": "CREATE_IN_PROGRESS"})]
+                            + list(stacks_in_creation.items())
+                        ]
+                    },
+                    expected_params={"StackStatusFilter": ["REVIEW_IN_PROGRESS", "CREATE_IN_PROGRESS"]},
+                )
+            )
+            stacks.update({name: stack for name, stack in stacks_in_creation.items() if "ParentId" not in stack})
+        mocked_requests.extend(
+            MockedBoto3Request(
+                method="describe_stacks",
+                response=(
+                    {
+                        "Stacks": [
+                            {
+                                "StackName": name,
+                                "CreationTime": datetime.now(),
+                                "StackStatus": "CREATE_COMPLETE",
+                                **stack,
+                            }
+                        ]
+                    }
+                    if stack
+                    else f"Stack with id arn:{name} does not exist"
+                ),
+                expected_params={"StackName": f"arn:{name}"},
+                generate_error=stack is None,
+                error_code=None if stack else "ValidationError",
+            )
+            for name, stack in stacks.items()
+        )
+        boto3_stubber("cloudformation", mocked_requests)
+
+        stacks, next_token = CfnClient().list_pcluster_stacks(next_token=next_token)
+        assert_that(next_token).is_equal_to(expected_next_token)
+        assert_that([stack["StackName"] for stack in stacks]).is_equal_to(expected_stacks)
+
+    def test_list_stack_resources(self, boto3_stubber):
+        resources = [
+            {
+                "LogicalResourceId": f"Resource{index}",
+                "PhysicalResourceId": f"resource-{index}",
+                "ResourceType": "AWS::EC2::SecurityGroup",
+                "LastUpdatedTimestamp": datetime(2021, 1, 1),
+                "ResourceStatus": "CREATE_COMPLETE",
+            }
+            for index in range(3)
+        ]
+        mocked_requests = [
+            MockedBoto3Request(
+                method="list_stack_resources",
+                response={"StackResourceSummaries": resources[:2], "NextToken": "token"},
+                expected_params={"StackName": FAKE_NAME},
+            ),
+            MockedBoto3Request(
+                method="list_stack_resources",
+                response={"StackResourceSummaries": resources[2:]},
+                expected_params={"StackName": FAKE_NAME, "NextToken": "token"},
+            ),
+        ]
+        boto3_stubber("cloudformation", mocked_requests)
+        assert_that(CfnClient().list_stack_resources(FAKE_NAME)).is_equal_to(resources)
+
     def test_get_stack_events_retry(self, boto3_stubber, mocker):
         sleep_mock = mocker.patch("pcluster.aws.common.time.sleep")
         expected_events = [_generate_stack_event()]
@@ -164,7 +309,8 @@ class TestCfnClient:
         boto3_stubber("cloudformation", mocked_requests)
         verified = utils.verify_stack_status(FAKE_NAME, ["CREATE_IN_PROGRESS"], "CREATE_COMPLETE")
         assert_that(verified).is_false()
-        sleep_mock.assert_called_with(5)
+        # Throttled describe_stack_events call is retried
+        sleep_mock.assert_any_call(5)
 
     @pytest.mark.parametrize(
         "next_token, describe_stacks_response, expected_stacks",
@@ -233,6 +379,7 @@ class TestCfnClient:
             )
         ]
         boto3_stubber("cloudformation", mocked_requests)
+        _mock_tagging_api_access_denied(boto3_stubber, "parallelcluster:image_id", next_token)
 
         if not generate_error:
             stacks, next_token = CfnClient().get_imagebuilder_stacks(next_token=next_token)
@@ -240,5 +387,5 @@ class TestCfnClient:
             assert_that({s["StackName"] for s in stacks}).is_equal_to(expected_stacks)
         else:
             with pytest.raises(AWSClientError) as e:
-                CfnClient().list_pcluster_stacks(next_token=next_token)
+                CfnClient().get_imagebuilder_stacks(next_token=next_token)
             assert_that(e.value.error_code).is_equal_to("error")
@@ -18,7 +18,7 @@ from pcluster.aws.dynamo import DynamoResource
 @pytest.fixture()
 def mocked_dynamo_table(mocker):
     mock_table = mocker.MagicMock(autospec=True)
-    mock_dynamo_resource = mocker.patch("boto3.resource")
+    mock_dynamo_resource = mocker.patch("boto3.session.Session.resource")
     mock_dynamo_resource.return_value.Table.return_value = mock_table
     return mock_table
 
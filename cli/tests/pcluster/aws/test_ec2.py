@@ -506,6 +506,60 @@ def test_describe_subnets_cache(boto3_stubber):
     assert_that(AWSApi.instance().ec2.describe_subnets([subnet])[0]["State"]).is_equal_to("available")
 
 
+def get_describe_instance_types_mocked_request(instance_types):
+    return MockedBoto3Request(
+        method="describe_instance_types",
+        response={"InstanceTypes": [{"InstanceType": instance_type} for instance_type in instance_types]},
+        expected_params={"InstanceTypes": instance_types},
+    )
+
+
+def test_describe_instance_types_cache(boto3_stubber):
+    instance_types = [f"c5.{size}xlarge" for size in range(0, 150)]
+    additional_instance_type = "t3.micro"
+    # The first call describes the instance types in batches of 100, the second one only the missing instance type
+    mocked_requests = [
+        get_describe_instance_types_mocked_request(instance_types[0:100]),
+        get_describe_instance_types_mocked_request(instance_types[100:150]),
+        get_describe_instance_types_mocked_request([additional_instance_type]),
+    ]
+    boto3_stubber("ec2", mocked_requests)
+    response = AWSApi.instance().ec2.describe_instance_types(instance_types + instance_types[0:10])
+    assert_that([data["InstanceType"] for data in response]).is_equal_to(instance_types + instance_types[0:10])
+
+    response = AWSApi.instance().ec2.describe_instance_types([additional_instance_type, instance_types[0]])
+    assert_that(response).is_length(2)
+
+    # Instance type info is served from the cache filled by describe_instance_types
+    assert_that(AWSApi.instance().ec2.get_instance_type_info(instance_types[120]).instance_type()).is_equal_to(
+        instance_types[120]
+    )
+
+
+def test_describe_instance_types_cache_disabled(boto3_stubber, set_env):
+    set_env("PCLUSTER_CACHE_DISABLED", "true")
+    instance_type = "c5.xlarge"
+    # Every call describes the instance type when the cache is disabled
+    boto3_stubber("ec2", [get_describe_instance_types_mocked_request([instance_type])] * 2)
+    for _ in range(2):
+        response = AWSApi.instance().ec2.describe_instance_types([instance_type])
+        assert_that(response).is_equal_to([{"InstanceType": instance_type}])
+
+
+def test_describe_instance_types_concurrently(boto3_stubber, mocker):
+    boto3_stubber("ec2", [])
+    instance_types = [f"c5.{size}xlarge" for size in range(0, 250)]
+    describe_chunk_mock = mocker.patch(
+        "pcluster.aws.ec2.Ec2Client._describe_instance_types_chunk",
+        side_effect=lambda chunk: [{"InstanceType": instance_type} for instance_type in chunk],
+    )
+
+    response = Ec2Client().describe_instance_types(instance_types, max_workers=4)
+
+    assert_that(response).is_length(250)
+    assert_that(describe_chunk_mock.call_count).is_equal_to(3)
+
+
 def test_get_subnet_ids_az_mapping(boto3_stubber):
     subnet_ids = ["subnet-123", "subnet-456"]
     avail_zones = {"subnet-123": "us-east-1a", "subnet-456": "us-east-1b"}
@@ -69,6 +69,34 @@ def test_list_load_balancers(boto3_stubber, generate_error):
         assert_that(return_value).is_equal_to([dummy_load_balancer, dummy_load_balancer_2])
 
 
+@pytest.mark.parametrize("generate_error", [True, False])
+def test_describe_load_balancers(boto3_stubber, generate_error):
+    """Verify that describe_load_balancers behaves as expected."""
+    dummy_message = "dummy error message"
+    dummy_load_balancer = {
+        "LoadBalancerArn": "dummy_load_balancer_arn",
+        "DNSName": "dummy_dns_name",
+        "LoadBalancerName": "dummy-load-balancer",
+        "Scheme": "internet-facing",
+        "State": {"Code": "active"},
+    }
+    mocked_requests = [
+        MockedBoto3Request(
+            method="describe_load_balancers",
+            expected_params={"LoadBalancerArns": ["dummy_load_balancer_arn"]},
+            response=dummy_message if generate_error else {"LoadBalancers": [dummy_load_balancer]},
+            generate_error=generate_error,
+        )
+    ]
+    boto3_stubber("elbv2", mocked_requests)
+    if generate_error:
+        with pytest.raises(BaseException, match=dummy_message):
+            ElbClient().describe_load_balancers(["dummy_load_balancer_arn"])
+    else:
+        return_value = ElbClient().describe_load_balancers(["dummy_load_balancer_arn"])
+        assert_that(return_value).is_equal_to([dummy_load_balancer])
+
+
 @pytest.mark.parametrize("generate_error", [True, False])
 def test_describe_tags(boto3_stubber, generate_error):
     """Verify that list_instance_types behaves as expected."""
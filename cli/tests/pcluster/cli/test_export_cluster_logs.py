@@ -84,6 +84,7 @@ class TestExportClusterLogsCommand:
         [
             {},
             {"output_file": "output-path"},
+            {"output_file": "output-path", "direct_export": True},
             {"bucket": "bucket-name", "keep_s3_objects": True},
             {"bucket": "bucket-name", "bucket_prefix": "test", "keep_s3_objects": True},
             {"filters": "Name=private-dns-name,Values=ip-10-10-10-10"},
@@ -116,7 +117,7 @@ class TestExportClusterLogsCommand:
     )
     def test_execute(self, mocker, set_env, args):
         export_logs_mock = mocker.patch(
-            "pcluster.cli.commands.cluster_logs.Cluster.export_logs",
+            "pcluster.models.cluster.Cluster.export_logs",
             return_value=args.get("output_file", "https://u.r.l."),
         )
         set_env("AWS_DEFAULT_REGION", "us-east-1")
@@ -135,6 +136,7 @@ class TestExportClusterLogsCommand:
             "bucket": "bucketname",
             "bucket_prefix": None,
             "keep_s3_objects": False,
+            "direct_export": False,
             "filters": None,
             "start_time": None,
             "end_time": None,
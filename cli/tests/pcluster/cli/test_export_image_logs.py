@@ -44,6 +44,7 @@ class TestExportImageLogsCommand:
         [
             {},
             {"output_file": "output-path"},
+            {"output_file": "output-path", "direct_export": True},
             {"bucket": "bucket-name", "bucket_prefix": "test", "keep_s3_objects": True},
             {
                 "output_file": "output-path",
@@ -64,9 +65,9 @@ class TestExportImageLogsCommand:
         ],
     )
     def test_execute(self, mocker, set_env, args):
-        mocked_assert_supported_operation = mocker.patch("pcluster.cli.commands.image_logs.assert_supported_operation")
+        mocked_assert_supported_operation = mocker.patch("pcluster.api.controllers.common.assert_supported_operation")
         export_logs_mock = mocker.patch(
-            "pcluster.cli.commands.image_logs.ImageBuilder.export_logs",
+            "pcluster.models.imagebuilder.ImageBuilder.export_logs",
             return_value=args.get("output_file", "https://u.r.l."),
         )
         set_env("AWS_DEFAULT_REGION", "us-east-1")
@@ -85,6 +86,7 @@ class TestExportImageLogsCommand:
             "bucket": "bucketname",
             "bucket_prefix": None,
             "keep_s3_objects": False,
+            "direct_export": False,
             "start_time": None,
             "end_time": None,
         }
@@ -105,11 +107,11 @@ class TestExportImageLogsCommand:
         set_env("AWS_DEFAULT_REGION", "us-east-1")
 
         mocked_assert_supported_operation = mocker.patch(
-            "pcluster.cli.commands.image_logs.assert_supported_operation",
+            "pcluster.api.controllers.common.assert_supported_operation",
             side_effect=None if is_operation_supported else BadRequestException("ERROR MESSAGE"),
         )
 
-        mocked_export_logs = mocker.patch("pcluster.cli.commands.image_logs.ImageBuilder.export_logs")
+        mocked_export_logs = mocker.patch("pcluster.models.imagebuilder.ImageBuilder.export_logs")
 
         command = ["export-image-logs"] + self._build_cli_args(
             {**REQUIRED_ARGS},
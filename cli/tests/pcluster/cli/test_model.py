@@ -6,9 +6,12 @@
 #  OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import os
+
 import pytest
 from assertpy import assert_that
 
+import pcluster.cli.model
 from pcluster.cli.entrypoint import ParameterException, gen_parser
 
 
@@ -93,3 +96,68 @@ class TestCliModel:
         path = str(test_datadir / "notfound")
         with pytest.raises(ParameterException):
             _run_model(model, ["op", "--file", path])
+
+
+class TestPackageModel:
+    def test_compiled_model(self, mocker, set_env, tmpdir):
+        cache_dir = os.path.join(tmpdir, "cache")
+        set_env("PCLUSTER_PERSISTENT_CACHE_DIR", cache_dir)
+        os.makedirs(cache_dir)
+        other_models = [f"cli-model-{index:016d}.json" for index in range(3)]
+        for index, other_model in enumerate(other_models):
+            other_model_path = os.path.join(cache_dir, other_model)
+            with open(other_model_path, "w", encoding="utf-8") as other_model_file:
+                other_model_file.write("{}")
+            os.utime(other_model_path, (1000 + index, 1000 + index))
+        expected_model = pcluster.cli.model.load_model(pcluster.cli.model.package_spec())
+        load_model_spy = mocker.spy(pcluster.cli.model, "load_model")
+
+        # The model is compiled at the first run, keeping only the most recent ones compiled from other versions
+        assert_that(pcluster.cli.model.package_model()).is_equal_to(expected_model)
+        assert_that(load_model_spy.call_count).is_equal_to(1)
+        compiled_models = sorted(set(os.listdir(cache_dir)) - set(other_models))
+        assert_that(compiled_models).is_length(1)
+        assert_that(os.listdir(cache_dir)).is_length(pcluster.cli.model.COMPILED_MODEL_MAX_FILES).contains(
+            *other_models[1:]
+        )
+
+        # The compiled model is reused by the following runs
+        assert_that(pcluster.cli.model.package_model()).is_equal_to(expected_model)
+        assert_that(load_model_spy.call_count).is_equal_to(1)
+
+        # A corrupted compiled model is replaced
+        with open(os.path.join(cache_dir, compiled_models[0]), "w", encoding="utf-8") as compiled_model_file:
+            compiled_model_file.write("{")
+        assert_that(pcluster.cli.model.package_model()).is_equal_to(expected_model)
+        assert_that(load_model_spy.call_count).is_equal_to(2)
+        assert_that(pcluster.cli.model.package_model()).is_equal_to(expected_model)
+        assert_that(load_model_spy.call_count).is_equal_to(2)
+
+    def test_compiled_model_dir_permissions(self, set_env, tmpdir):
+        cache_dir = os.path.join(tmpdir, "cache")
+        set_env("PCLUSTER_PERSISTENT_CACHE_DIR", cache_dir)
+
+        pcluster.cli.model.package_model()
+
+        # The cache directory is private to the user, as the one of the persistent cache
+        assert_that(os.stat(cache_dir).st_mode & 0o777).is_equal_to(0o700)
+        assert_that(os.listdir(cache_dir)).is_length(1)
+
+    def test_compiled_model_not_writable(self, set_env, tmpdir):
+        cache_dir = os.path.join(tmpdir, "not-a-dir")
+        with open(cache_dir, "w", encoding="utf-8"):
+            pass
+        set_env("PCLUSTER_PERSISTENT_CACHE_DIR", cache_dir)
+
+        assert_that(pcluster.cli.model.package_model()).contains_key("describe-cluster", "list-clusters")
+
+    def test_compiled_model_cache_disabled(self, mocker, set_env, tmpdir):
+        set_env("PCLUSTER_PERSISTENT_CACHE_DIR", str(tmpdir))
+        set_env("PCLUSTER_CLI_MODEL_CACHE_DISABLED", "true")
+        load_model_spy = mocker.spy(pcluster.cli.model, "load_model")
+
+        # The model is compiled at every run and nothing is written to the cache directory
+        for call_count in [1, 2]:
+            assert_that(pcluster.cli.model.package_model()).contains_key("describe-cluster", "list-clusters")
+            assert_that(load_model_spy.call_count).is_equal_to(call_count)
+        assert_that(os.listdir(tmpdir)).is_empty()
@@ -647,6 +647,44 @@ class TestBaseClusterConfig:
     def test_get_instance_types_data(self, base_cluster_config):
         assert_that(base_cluster_config.get_instance_types_data()).is_equal_to({})
 
+    def test_prefetch_instance_types_info(self, aws_api_mock):
+        cluster_config = SlurmClusterConfig(
+            cluster_name="clustername",
+            image=Image("alinux2"),
+            head_node=HeadNode("c5.xlarge", HeadNodeNetworking("subnet")),
+            scheduling=SlurmScheduling(
+                [
+                    SlurmQueue(
+                        name="queue0",
+                        networking=SlurmQueueNetworking(subnet_ids=["subnet"]),
+                        compute_resources=[
+                            SlurmComputeResource(name="compute_resource_1", instance_type="c5.xlarge"),
+                            SlurmFlexibleComputeResource(
+                                name="compute_resource_2",
+                                instances=[FlexibleInstanceType("c5.2xlarge"), FlexibleInstanceType("c5.4xlarge")],
+                            ),
+                        ],
+                    )
+                ]
+            ),
+            login_nodes=LoginNodes(
+                pools=[
+                    LoginNodesPool(
+                        name="pool",
+                        instance_type="t3.xlarge",
+                        networking=LoginNodesNetworking(subnet_ids=["subnet"]),
+                        ssh=LoginNodesSsh(key_name="mykey"),
+                    )
+                ]
+            ),
+        )
+
+        cluster_config.prefetch_instance_types_info()
+
+        aws_api_mock.ec2.describe_instance_types.assert_called_once_with(
+            ["c5.xlarge", "c5.2xlarge", "c5.4xlarge", "t3.xlarge"], max_workers=4
+        )
+
     @pytest.mark.parametrize(
         "queue_parameters, expected_result",
         [
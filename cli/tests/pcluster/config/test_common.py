@@ -9,6 +9,8 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
+import threading
+import time
 from typing import List
 from unittest.mock import MagicMock
 
@@ -64,6 +66,30 @@ class FakeAsyncMultiErrorValidator(AsyncValidator):
         self._add_failure(f"Error async 2 {param}.", FailureLevel.ERROR)
 
 
+class FakeBarrierValidator(Validator):
+    """Dummy validator that completes only when executed together with other validators."""
+
+    def _validate(self, param, barrier):
+        barrier.wait()
+        self._add_failure(f"Wrong value {param}.", FailureLevel.INFO)
+
+
+class FakeSlowValidator(Validator):
+    """Dummy slow validator."""
+
+    def _validate(self, param, delay):
+        time.sleep(delay)
+        self._add_failure(f"Wrong value {param}.", FailureLevel.INFO)
+
+
+class FakeAsyncSlowValidator(AsyncValidator):
+    """Dummy slow async validator."""
+
+    async def _validate_async(self, param, delay):
+        await asyncio.sleep(delay)
+        self._add_failure(f"Wrong async value {param}.", FailureLevel.INFO)
+
+
 class FakeComplexValidator(Validator):
     """Dummy validator requiring multiple parameters as input."""
 
@@ -256,6 +282,103 @@ def test_async_resource_validation_with_timeout():
     assert_validation_result(validation_failures[3], FailureLevel.INFO, "Wrong async value other-value.")
 
 
+def test_resource_validate_concurrently(monkeypatch):
+    """Verify that sync validators of a resource and of its children are executed concurrently."""
+    monkeypatch.setenv("PCLUSTER_VALIDATION_MAX_WORKERS", "3")
+    barrier = threading.Barrier(3, timeout=5)
+
+    class FakeNestedResource(Resource):
+        """Fake nested resource class to test validators."""
+
+        def __init__(self, fake_value):
+            super().__init__()
+            self.fake_attribute = fake_value
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeBarrierValidator, param=self.fake_attribute, barrier=barrier)
+
+    class FakeParentResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self):
+            super().__init__()
+            self.list_of_resources = [FakeNestedResource("value1"), FakeNestedResource("value2")]
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeBarrierValidator, param="value3", barrier=barrier)
+            self._register_validator(FakeAsyncInfoValidator, param="value4")
+
+    validation_failures = FakeParentResource().validate()
+
+    # Results are returned in registration order regardless of the completion order
+    assert_that(validation_failures).is_length(4)
+    assert_validation_result(validation_failures[0], FailureLevel.INFO, "Wrong value value1.")
+    assert_validation_result(validation_failures[1], FailureLevel.INFO, "Wrong value value2.")
+    assert_validation_result(validation_failures[2], FailureLevel.INFO, "Wrong value value3.")
+    assert_validation_result(validation_failures[3], FailureLevel.INFO, "Wrong async value value4.")
+
+
+def test_resource_validate_serially(monkeypatch):
+    """Verify that sync validators are executed in the calling thread when a single worker is configured."""
+    monkeypatch.setenv("PCLUSTER_VALIDATION_MAX_WORKERS", "1")
+    barrier = threading.Barrier(2, timeout=0.1)
+
+    class FakeResource(Resource):
+        """Fake resource class to test validators."""
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeBarrierValidator, param="value1", barrier=barrier)
+            self._register_validator(FakeInfoValidator, param="value2")
+
+    validation_failures = FakeResource().validate()
+
+    # The barrier can not be passed if validators are not executed concurrently
+    assert_that(validation_failures).is_length(2)
+    assert_that(validation_failures[0].level).is_equal_to(FailureLevel.ERROR)
+    assert_validation_result(validation_failures[1], FailureLevel.INFO, "Wrong value value2.")
+
+
+def test_resource_validate_with_timeout(monkeypatch):
+    """Verify that validators exceeding the overall validation timeout are reported as timed out."""
+    monkeypatch.setenv("PCLUSTER_VALIDATION_TIMEOUT", "0.5")
+
+    class FakeNestedResource(Resource):
+        """Fake nested resource class to test validators."""
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeSlowValidator, param="slow-nested", delay=3)
+            self._register_validator(FakeAsyncSlowValidator, param="slow-nested", delay=3)
+
+    class FakeParentResource(Resource):
+        """Fake resource class to test validators."""
+
+        def __init__(self):
+            super().__init__()
+            self.fake_resource = FakeNestedResource()
+
+        def _register_validators(self, context: ValidatorContext = None):
+            self._register_validator(FakeInfoValidator, param="fast")
+            self._register_validator(FakeAsyncInfoValidator, param="fast")
+
+    start = time.monotonic()
+    validation_failures = FakeParentResource().validate()
+
+    assert_that(time.monotonic() - start).is_less_than(3)
+    assert_that(validation_failures).is_length(4)
+    assert_validation_result(
+        validation_failures[0], FailureLevel.WARNING, "Validation did not complete within 0.5 seconds."
+    )
+    assert_validation_result(validation_failures[1], FailureLevel.INFO, "Wrong value fast.")
+    assert_validation_result(
+        validation_failures[2], FailureLevel.WARNING, "Validation did not complete within 0.5 seconds."
+    )
+    assert_validation_result(validation_failures[3], FailureLevel.INFO, "Wrong async value fast.")
+    # The validator still running does not prevent the process from exiting
+    validator_threads = [thread for thread in threading.enumerate() if thread.name.startswith("pcluster-validator")]
+    assert_that(validator_threads).is_not_empty()
+    assert_that([thread.daemon for thread in validator_threads]).does_not_contain(False)
+
+
 def test_dynamic_property_validate():
     """Verify that validators of dynamic parameters are working as expected."""
 
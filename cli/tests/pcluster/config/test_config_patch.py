@@ -14,9 +14,11 @@ import shutil
 import pytest
 from assertpy import assert_that
 
+from pcluster.aws.common import AWSClientError
 from pcluster.config.cluster_config import QueueUpdateStrategy
-from pcluster.config.config_patch import Change, ConfigPatch
+from pcluster.config.config_patch import Change, ConfigIndex, ConfigPatch
 from pcluster.config.update_policy import UpdatePolicy
+from pcluster.models.compute_fleet_status_manager import ComputeFleetStatus
 from pcluster.schemas.cluster_schema import ClusterSchema
 from pcluster.utils import load_yaml_dict
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
@@ -1133,3 +1135,117 @@ def test_patch_check_cluster_resource_bucket(
         line = ["{0}".format(element) if isinstance(element, str) else element for element in line]
         assert_that(expected_message_rows).contains(line)
     assert_that(patch_allowed).is_equal_to(not expected_error_row)
+
+
+def _many_queues_config(queues_count, compute_resources_count, max_count):
+    return {
+        "Scheduling": {
+            "Scheduler": "slurm",
+            "SlurmQueues": [
+                {
+                    "Name": f"queue{queue_index}",
+                    "ComputeResources": [
+                        {"Name": f"cr{cr_index}", "InstanceType": "c5.xlarge", "MaxCount": max_count}
+                        for cr_index in range(compute_resources_count)
+                    ],
+                }
+                for queue_index in range(queues_count)
+            ],
+        }
+    }
+
+
+def test_config_index():
+    config = _many_queues_config(queues_count=3, compute_resources_count=2, max_count=10)
+    index = ConfigIndex(config)
+
+    queue_key = ("SlurmQueues", "queue2")
+    assert_that(index.get_queue(queue_key)).is_same_as(config["Scheduling"]["SlurmQueues"][2])
+    assert_that(index.get_compute_resource(queue_key, ("ComputeResources", "cr1"))).is_same_as(
+        config["Scheduling"]["SlurmQueues"][2]["ComputeResources"][1]
+    )
+    assert_that(index.get_queue(("SlurmQueues", "unknown"))).is_equal_to({})
+    assert_that(index.get_queue(None)).is_equal_to({})
+    assert_that(index.get_compute_resource(queue_key, ("ComputeResources", "unknown"))).is_equal_to({})
+    assert_that(index.get_compute_resource(None, ("ComputeResources", "cr1"))).is_equal_to({})
+    assert_that(ConfigIndex({}).queues).is_empty()
+
+
+def test_patch_with_many_queues():
+    base_config = _many_queues_config(queues_count=50, compute_resources_count=50, max_count=10)
+    target_config = _many_queues_config(queues_count=50, compute_resources_count=50, max_count=20)
+    # Remove the first queue and add a new one
+    target_config["Scheduling"]["SlurmQueues"].pop(0)
+    target_config["Scheduling"]["SlurmQueues"].append({"Name": "new-queue", "ComputeResources": []})
+
+    patch = ConfigPatch(dummy_cluster(), base_config=base_config, target_config=target_config)
+
+    max_count_changes = [change for change in patch.changes if change.key == "MaxCount"]
+    assert_that(max_count_changes).is_length(49 * 50)
+    assert_that(max_count_changes[0].path).is_equal_to(["Scheduling", "SlurmQueues[queue1]", "ComputeResources[cr0]"])
+    queue_changes = [change for change in patch.changes if change.key == "SlurmQueues"]
+    assert_that(queue_changes).is_length(2)
+    assert_that(queue_changes[0].new_value["Name"]).is_equal_to("new-queue")
+    assert_that(queue_changes[1].old_value).is_equal_to(base_config["Scheduling"]["SlurmQueues"][0])
+
+
+@pytest.mark.parametrize(
+    "max_count_policy, expected_fleet_status_calls, expected_login_nodes_status_calls",
+    [
+        (UpdatePolicy.QUEUE_UPDATE_STRATEGY, 1, 0),
+        (UpdatePolicy.LOGIN_NODES_STOP, 0, 1),
+        (UpdatePolicy.COMPUTE_AND_LOGIN_NODES_STOP, 1, 1),
+        (UpdatePolicy.SUPPORTED, 0, 0),
+    ],
+)
+def test_patch_check_gathers_cluster_state_once(
+    mocker, max_count_policy, expected_fleet_status_calls, expected_login_nodes_status_calls
+):
+    base_config = _many_queues_config(queues_count=5, compute_resources_count=5, max_count=10)
+    target_config = _many_queues_config(queues_count=5, compute_resources_count=5, max_count=20)
+    mocker.patch("pcluster.models.cluster_resources.ClusterStack.scheduler", new_callable=mocker.PropertyMock)
+    fleet_status_manager_mock = mocker.patch(
+        "pcluster.models.cluster.Cluster.compute_fleet_status_manager", new_callable=mocker.PropertyMock
+    ).return_value
+    fleet_status_manager_mock.get_status.return_value = ComputeFleetStatus.STOPPED
+    login_nodes_status_mock = mocker.patch(
+        "pcluster.models.cluster.Cluster.login_nodes_status", new_callable=mocker.PropertyMock
+    )
+    login_nodes_status_mock.return_value.get_healthy_nodes.return_value = 0
+    login_nodes_status_mock.return_value.get_unhealthy_nodes.return_value = 0
+
+    patch = ConfigPatch(dummy_cluster(), base_config=base_config, target_config=target_config)
+    patch.changes = [change._replace(update_policy=max_count_policy) for change in patch.changes]
+    patch_allowed, _ = patch.check()
+
+    assert_that(patch_allowed).is_true()
+    assert_that(patch.changes).is_length(25)
+    # The state of the cluster is retrieved once and shared by all the condition checkers
+    assert_that(fleet_status_manager_mock.get_status.call_count).is_equal_to(expected_fleet_status_calls)
+    assert_that(login_nodes_status_mock.call_count).is_equal_to(expected_login_nodes_status_calls)
+
+
+@pytest.mark.parametrize("stack_error", [False, True])
+def test_patch_gathers_running_capacity(mocker, stack_error):
+    base_config = _many_queues_config(queues_count=1, compute_resources_count=1, max_count=10)
+    target_config = _many_queues_config(queues_count=1, compute_resources_count=1, max_count=20)
+    stack_mock = mocker.patch("pcluster.models.cluster.Cluster.stack", new_callable=mocker.PropertyMock)
+    if stack_error:
+        stack_mock.side_effect = AWSClientError(function_name="describe_stack", message="error")
+    probes_mocks = {
+        probe_name: mocker.patch(f"pcluster.models.cluster.Cluster.{probe_name}")
+        for probe_name in ["get_running_capacity", "has_running_capacity", "has_running_login_nodes"]
+    }
+
+    patch = ConfigPatch(dummy_cluster(), base_config=base_config, target_config=target_config)
+    patch.changes = [change._replace(update_policy=UpdatePolicy.AWSBATCH_CE_MAX_RESIZE) for change in patch.changes]
+    patch._gather_cluster_state()
+
+    # The stack shared by the probes is loaded before retrieving the cluster state
+    stack_mock.assert_called_once()
+    if stack_error:
+        probes_mocks["get_running_capacity"].assert_not_called()
+    else:
+        probes_mocks["get_running_capacity"].assert_called_once()
+    probes_mocks["has_running_capacity"].assert_not_called()
+    probes_mocks["has_running_login_nodes"].assert_not_called()
@@ -10,8 +10,9 @@
 # limitations under the License.
 import datetime
 import json
+import threading
 from copy import deepcopy
-from unittest.mock import PropertyMock
+from unittest.mock import ANY, PropertyMock
 
 import pytest
 import yaml
@@ -463,6 +464,7 @@ class TestCluster:
             (True, True, "", {"keep_s3_objects": True}),
             (True, True, "", {"output_file": "path"}),
             (True, True, "", {"bucket_prefix": "test_prefix"}),
+            (True, True, "", {"output_file": "path", "direct_export": True}),
         ],
     )
     def test_export_logs(
@@ -479,8 +481,8 @@ class TestCluster:
         set_env("AWS_DEFAULT_REGION", "us-east-2")
         stack_exists_mock = mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=stack_exists)
         download_stack_events_mock = mocker.patch("pcluster.models.cluster.export_stack_events")
-        create_logs_archive_mock = mocker.patch("pcluster.models.cluster.create_logs_archive")
-        upload_archive_mock = mocker.patch("pcluster.models.cluster.upload_archive")
+        check_logs_bucket_mock = mocker.patch("pcluster.models.cluster.check_logs_bucket")
+        open_logs_archive_mock = mocker.patch("pcluster.models.cluster.open_logs_archive")
         presign_mock = mocker.patch("pcluster.models.cluster.create_s3_presigned_url")
         mocker.patch(
             "pcluster.models.cluster.ClusterStack.log_group_name",
@@ -493,6 +495,9 @@ class TestCluster:
             return_value=_MockExportClusterLogsFiltersParser(),
         )
         cw_logs_exporter_mock = mocker.patch("pcluster.models.cluster.CloudWatchLogsExporter", autospec=True)
+        cw_log_streams_exporter_mock = mocker.patch(
+            "pcluster.models.cluster.CloudWatchLogStreamsExporter", autospec=True
+        )
 
         kwargs.update({"bucket": "bucket_name"})
         if expected_error:
@@ -502,23 +507,50 @@ class TestCluster:
             cluster.export_logs(**kwargs)
             # check archive steps
             download_stack_events_mock.assert_called()
-            create_logs_archive_mock.assert_called()
+            open_logs_archive_mock.assert_called_with(
+                ANY, kwargs.get("output_file"), "bucket_name", kwargs.get("bucket_prefix")
+            )
 
             # check preliminary steps
             stack_exists_mock.assert_called_with(cluster.stack_name)
+            if "output_file" in kwargs and (kwargs.get("direct_export") or not logging_enabled):
+                check_logs_bucket_mock.assert_not_called()
+            else:
+                check_logs_bucket_mock.assert_called_with("bucket_name", cluster.name)
 
             if logging_enabled:
-                cw_logs_exporter_mock.assert_called()
+                used_exporter_mock, unused_exporter_mock = (
+                    (cw_log_streams_exporter_mock, cw_logs_exporter_mock)
+                    if kwargs.get("direct_export")
+                    else (cw_logs_exporter_mock, cw_log_streams_exporter_mock)
+                )
+                used_exporter_mock.assert_called()
+                unused_exporter_mock.assert_not_called()
                 logs_filter_mock.assert_called()
             else:
                 cw_logs_exporter_mock.assert_not_called()
+                cw_log_streams_exporter_mock.assert_not_called()
                 logs_filter_mock.assert_not_called()
 
             if "output_file" not in kwargs:
-                print("kwargs", kwargs)
-                upload_archive_mock.assert_called()
                 presign_mock.assert_called()
 
+    def test_export_logs_bucket_in_other_region(self, cluster, mocker, set_env):
+        mock_aws_api(mocker)
+        set_env("AWS_DEFAULT_REGION", "us-east-2")
+        mocker.patch("pcluster.aws.cfn.CfnClient.stack_exists", return_value=True)
+        mocker.patch("pcluster.aws.s3.S3Client.get_bucket_region", return_value="us-west-1")
+        mocker.patch(
+            "pcluster.models.cluster.ClusterStack.log_group_name",
+            new_callable=PropertyMock(return_value="log-group-name"),
+        )
+        open_logs_archive_mock = mocker.patch("pcluster.models.cluster.open_logs_archive")
+
+        with pytest.raises(ClusterActionError, match="bucket's region is us-west-1"):
+            cluster.export_logs(bucket="bucket_name")
+        # The archive is not created, hence no multipart upload is started
+        open_logs_archive_mock.assert_not_called()
+
     @pytest.mark.parametrize(
         "stack_exists, logging_enabled, client_error, expected_error",
         [
@@ -837,6 +869,74 @@ class TestCluster:
         mocker.patch("pcluster.models.login_nodes_status.LoginNodesStatus.get_unhealthy_nodes", return_value=unhealthy)
         assert_that(cluster.has_running_login_nodes()).is_equal_to(expected_result)
 
+    def test_has_running_login_nodes_by_pool(self, mocker, cluster):
+        login_nodes_status_mock = mocker.patch(
+            "pcluster.models.cluster.Cluster.login_nodes_status", new_callable=mocker.PropertyMock
+        )
+        login_nodes_status_mock.return_value.get_healthy_nodes.side_effect = lambda pool_name=None: {
+            None: 1,
+            "pool1": 1,
+            "pool2": 0,
+        }[pool_name]
+        login_nodes_status_mock.return_value.get_unhealthy_nodes.return_value = 0
+
+        assert_that(cluster.has_running_login_nodes()).is_true()
+        assert_that(cluster.has_running_login_nodes(pool_name="pool1")).is_true()
+        assert_that(cluster.has_running_login_nodes(pool_name="pool2")).is_false()
+        assert_that(cluster.has_running_login_nodes(pool_name="pool2")).is_false()
+        # The status of the login nodes is retrieved only once, unless an updated value is requested
+        login_nodes_status_mock.assert_called_once()
+        assert_that(cluster.has_running_login_nodes(updated_value=True, pool_name="pool1")).is_true()
+        assert_that(login_nodes_status_mock.call_count).is_equal_to(2)
+
+    def test_upload_artifacts_and_build_template(self, mocker, cluster):
+        events = []
+        template_uploaded = threading.Event()
+        for method in ["_upload_config", "_upload_instance_types_data", "_upload_change_set"]:
+            mocker.patch(
+                f"pcluster.models.cluster.Cluster.{method}", side_effect=lambda *args, m=method: events.append(m)
+            )
+
+        def _build_cluster_template(**kwargs):
+            events.append("build_cluster_template")
+            return "template", ["asset"]
+
+        def _upload_resources(**kwargs):
+            # Static resources are uploaded in background, without blocking the upload of the template
+            assert_that(template_uploaded.wait(timeout=10)).is_true()
+            events.append("upload_resources")
+
+        build_template_mock = mocker.patch(
+            "pcluster.models.cluster.CDKTemplateBuilder.build_cluster_template", side_effect=_build_cluster_template
+        )
+        mocker.patch("pcluster.models.s3_bucket.S3Bucket.upload_resources", side_effect=_upload_resources)
+        mocker.patch(
+            "pcluster.models.s3_bucket.S3Bucket.upload_cfn_template",
+            side_effect=lambda *args: (events.append("upload_cfn_template"), template_uploaded.set()),
+        )
+        cluster.config = mocker.MagicMock(dev_settings=None, scheduler_resources=None)
+
+        assets_metadata = cluster._upload_artifacts_and_build_template(changes=[], log_group_name="log-group")
+
+        assert_that(assets_metadata).is_equal_to(["asset"])
+        assert_that(cluster.template_body).is_equal_to("template")
+        assert_that(events).is_equal_to(
+            [
+                "_upload_config",
+                "_upload_instance_types_data",
+                "_upload_change_set",
+                "build_cluster_template",
+                "upload_cfn_template",
+                "upload_resources",
+            ]
+        )
+        build_template_mock.assert_called_once_with(
+            cluster_config=cluster.config,
+            bucket=cluster.bucket,
+            stack_name=cluster.stack_name,
+            log_group_name="log-group",
+        )
+
     def test_login_nodes_on_batch(self, mocker, cluster):
         mocker.patch("pcluster.models.cluster_resources.ClusterStack.scheduler", return_value="awsbatch")
         lns = cluster.login_nodes_status
@@ -9,8 +9,13 @@
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
 import datetime
+import gzip
 import os
+import tarfile
 import time
+from io import BytesIO
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 from assertpy import assert_that
@@ -18,9 +23,13 @@ from assertpy import assert_that
 from pcluster.aws.common import AWSClientError
 from pcluster.models.common import (
     CloudWatchLogsExporter,
+    CloudWatchLogStreamsExporter,
     FiltersParserError,
     LogGroupTimeFiltersParser,
+    LogsArchive,
     LogsExporterError,
+    export_stack_events,
+    open_logs_archive,
 )
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
@@ -172,7 +181,7 @@ class TestCloudWatchLogsExporter:
             "resource_id": "clustername",
             "log_group_name": "groupname",
             "bucket": "bucket_name",
-            "output_dir": "output_dir",
+            "archive": MagicMock(),
         }
         return CloudWatchLogsExporter(**kwargs)
 
@@ -195,7 +204,7 @@ class TestCloudWatchLogsExporter:
             "resource_id": "clustername",
             "log_group_name": "groupname",
             "bucket": "bucket_name",
-            "output_dir": "output_dir",
+            "archive": MagicMock(),
         }
         kwargs.update(params)
 
@@ -238,7 +247,7 @@ class TestCloudWatchLogsExporter:
             "resource_id": "clustername",
             "log_group_name": "groupname",
             "bucket": "bucket_name",
-            "output_dir": "output_dir",
+            "archive": MagicMock(),
         }
         kwargs.update(params)
         cw_logs_exporter = CloudWatchLogsExporter(**kwargs)
@@ -264,7 +273,7 @@ class TestCloudWatchLogsExporter:
             bucket_prefix = params.get("bucket_prefix", None)
 
             if bucket_prefix:
-                download_objects_mock.assert_called_with("task_id", os.path.join("output_dir", "cloudwatch-logs"))
+                download_objects_mock.assert_called_with("task_id", "cloudwatch-logs")
 
             if not params.get("keep_s3_objects", False):
                 delete_objects_mock.assert_called()
@@ -310,6 +319,51 @@ class TestCloudWatchLogsExporter:
         cw_logs_exporter._wait_for_task_completion("task_id")
         assert_that(wait_for_task_mock.call_count).is_equal_to(expected_call_count)
 
+    def test_download_s3_objects_with_prefix(self, cw_logs_exporter, mocker):
+        """Verify that exported objects are decompressed to a file per log stream of the archive."""
+        mock_aws_api(mocker)
+        prefix = f"{cw_logs_exporter.bucket_prefix}/task_id"
+        objects = {
+            f"{prefix}/ip-10-0-0-1.i-123.cfn-init/000000.gz": b"cfn-init part 1\n",
+            f"{prefix}/ip-10-0-0-1.i-123.cfn-init/000001.gz": b"cfn-init part 2\n",
+            f"{prefix}/ip-10-0-0-2.i-456.slurmd/000000.gz": b"slurmd\n",
+        }
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects",
+            # Parts of the same log stream are not necessarily listed in order
+            return_value=[SimpleNamespace(key=key) for key in reversed(objects.keys())],
+        )
+        get_object_mock = mocker.patch(
+            "pcluster.aws.s3.S3Client.get_object",
+            side_effect=lambda bucket_name, key: {"Body": BytesIO(gzip.compress(objects[key]))},
+        )
+        archive_file = BytesIO()
+        cw_logs_exporter.archive = LogsArchive("archive-name", archive_file, location="location")
+
+        cw_logs_exporter._download_s3_objects_with_prefix("task_id", "cloudwatch-logs")
+        cw_logs_exporter.archive.close()
+
+        assert_that(get_object_mock.call_count).is_equal_to(3)
+        assert_that(_read_archive(archive_file)).is_equal_to(
+            {
+                "archive-name/cloudwatch-logs/ip-10-0-0-1.i-123.cfn-init": b"cfn-init part 1\ncfn-init part 2\n",
+                "archive-name/cloudwatch-logs/ip-10-0-0-2.i-456.slurmd": b"slurmd\n",
+            }
+        )
+
+    def test_download_s3_objects_with_prefix_corrupted_object(self, cw_logs_exporter, mocker):
+        """Verify that errors in the decompression of an object are propagated."""
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.aws.s3_resource.S3Resource.get_objects",
+            return_value=[SimpleNamespace(key=f"{cw_logs_exporter.bucket_prefix}/task_id/stream/000000.gz")],
+        )
+        mocker.patch("pcluster.aws.s3.S3Client.get_object", return_value={"Body": BytesIO(b"not gzip")})
+
+        with pytest.raises(OSError):
+            cw_logs_exporter._download_s3_objects_with_prefix("task_id", "cloudwatch-logs")
+        cw_logs_exporter.archive.add_file.assert_not_called()
+
     @pytest.mark.parametrize("task_result", ["COMPLETED", "ERROR"])
     def test_export_logs_to_s3(self, cw_logs_exporter, mocker, task_result):
         """Verify that _export_logs_to_s3 behaves as expected."""
@@ -326,3 +380,188 @@ class TestCloudWatchLogsExporter:
         else:
             task_id = cw_logs_exporter._export_logs_to_s3("log_group_name", "bucket")
             wait_for_completion_mock.assert_called_with(task_id)
+
+
+class TestCloudWatchLogStreamsExporter:
+    def test_execute(self, mocker):
+        """Verify that the log streams in the time window are read and added to the archive, a file per stream."""
+        mock_aws_api(mocker)
+        start_time = datetime.datetime(2021, 6, 2, tzinfo=datetime.timezone.utc)
+        end_time = datetime.datetime(2021, 6, 8, tzinfo=datetime.timezone.utc)
+        describe_log_streams_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.describe_log_streams",
+            side_effect=[
+                {
+                    "logStreams": [
+                        {"logStreamName": "ip-10-0-0-1.i-123.cfn-init", "firstEventTimestamp": 1622592000000},
+                        # Stream with events only after the end of the time window
+                        {"logStreamName": "ip-10-0-0-1.i-123.slurmd", "firstEventTimestamp": 1623196800000},
+                    ],
+                    "nextToken": "page2",
+                },
+                {
+                    "logStreams": [
+                        {"logStreamName": "ip-10-0-0-2.i-456.chef-client", "creationTime": 1622592000000},
+                        # Stream with events only before the start of the time window
+                        {"logStreamName": "ip-10-0-0-2.i-456.supervisord", "lastIngestionTime": 1622505600000},
+                    ],
+                },
+            ],
+        )
+        events_by_token = {
+            ("ip-10-0-0-1.i-123.cfn-init", None): {
+                "events": [{"timestamp": 1622592000000, "message": "cfn-init 1"}],
+                "nextForwardToken": "f1",
+            },
+            ("ip-10-0-0-1.i-123.cfn-init", "f1"): {
+                "events": [{"timestamp": 1622592001000, "message": "cfn-init 2"}],
+                "nextForwardToken": "f2",
+            },
+            ("ip-10-0-0-1.i-123.cfn-init", "f2"): {"events": [], "nextForwardToken": "f2"},
+            ("ip-10-0-0-2.i-456.chef-client", None): {
+                "events": [{"timestamp": 1622592002500, "message": "chef-client"}],
+                "nextForwardToken": "f1",
+            },
+            ("ip-10-0-0-2.i-456.chef-client", "f1"): {"events": [], "nextForwardToken": "f1"},
+        }
+        get_log_events_mock = mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_log_events",
+            side_effect=lambda log_group_name, log_stream_name, next_token, **kwargs: events_by_token[
+                (log_stream_name, next_token)
+            ],
+        )
+        archive_file = BytesIO()
+        archive = LogsArchive("archive-name", archive_file, location="location")
+
+        CloudWatchLogStreamsExporter("log-group", archive).execute(
+            log_stream_prefix="ip-10-0-0", start_time=start_time, end_time=end_time
+        )
+        archive.close()
+
+        describe_log_streams_mock.assert_any_call("log-group", log_stream_name_prefix="ip-10-0-0", next_token="page2")
+        assert_that(get_log_events_mock.call_count).is_equal_to(5)
+        get_log_events_mock.assert_any_call(
+            "log-group",
+            "ip-10-0-0-1.i-123.cfn-init",
+            start_time=1622592000000,
+            end_time=1623110400000,
+            start_from_head=True,
+            next_token=None,
+        )
+        assert_that(_read_archive(archive_file)).is_equal_to(
+            {
+                "archive-name/cloudwatch-logs/ip-10-0-0-1.i-123.cfn-init": (
+                    b"2021-06-02T00:00:00.000Z cfn-init 1\n2021-06-02T00:00:01.000Z cfn-init 2\n"
+                ),
+                "archive-name/cloudwatch-logs/ip-10-0-0-2.i-456.chef-client": b"2021-06-02T00:00:02.500Z chef-client\n",
+            }
+        )
+
+    def test_execute_failure(self, mocker):
+        """Verify that errors in the read of a log stream are propagated."""
+        mock_aws_api(mocker)
+        mocker.patch(
+            "pcluster.aws.logs.LogsClient.describe_log_streams",
+            return_value={"logStreams": [{"logStreamName": "stream"}]},
+        )
+        mocker.patch(
+            "pcluster.aws.logs.LogsClient.get_log_events",
+            side_effect=AWSClientError(function_name="get_log_events", message="error"),
+        )
+        archive = MagicMock()
+
+        with pytest.raises(AWSClientError, match="error"):
+            CloudWatchLogStreamsExporter("log-group", archive).execute()
+        archive.add_file.assert_not_called()
+
+
+def _read_archive(archive_file):
+    archive_file.seek(0)
+    with tarfile.open(fileobj=archive_file, mode="r:gz") as tar:
+        return {member.name: tar.extractfile(member).read() for member in tar.getmembers()}
+
+
+class TestLogsArchive:
+    def test_open_logs_archive_to_file(self, mocker, tmpdir):
+        mocker.patch("pcluster.models.common.get_all_stack_events", return_value=[[{"StackName": "stack"}]])
+        output_file = os.path.join(tmpdir, "archive.tar.gz")
+
+        with open_logs_archive("archive-name", output_file=output_file) as archive:
+            archive.add_bytes("file1", b"content1")
+            archive.add_file("dir/file2", BytesIO(b"content2"), 8)
+            export_stack_events("stack", archive, "stack-events")
+
+        assert_that(archive.location).is_equal_to(output_file)
+        with open(output_file, "rb") as archive_file:
+            assert_that(_read_archive(archive_file)).is_equal_to(
+                {
+                    "archive-name/file1": b"content1",
+                    "archive-name/dir/file2": b"content2",
+                    "archive-name/stack-events": b'[\n  [\n    {\n      "StackName": "stack"\n    }\n  ]\n]',
+                }
+            )
+
+    def test_open_logs_archive_to_file_failure(self, tmpdir):
+        output_file = os.path.join(tmpdir, "archive.tar.gz")
+
+        with pytest.raises(LogsExporterError):
+            with open_logs_archive("archive-name", output_file=output_file) as archive:
+                archive.add_bytes("file1", b"content1")
+                raise LogsExporterError("error")
+
+        assert_that(os.path.exists(output_file)).is_false()
+
+    @pytest.mark.parametrize(
+        "bucket_prefix, expected_key", [(None, "archive-name.tar.gz"), ("prefix", "prefix/archive-name.tar.gz")]
+    )
+    def test_open_logs_archive_to_s3(self, mocker, bucket_prefix, expected_key):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.models.common.LOGS_ARCHIVE_UPLOAD_PART_SIZE", 10)
+        create_upload_mock = mocker.patch("pcluster.aws.s3.S3Client.create_multipart_upload", return_value="upload-id")
+        uploaded_parts = []
+        upload_part_mock = mocker.patch(
+            "pcluster.aws.s3.S3Client.upload_part",
+            side_effect=lambda bucket, key, upload_id, part_number, body: uploaded_parts.append(body)
+            or f"etag-{part_number}",
+        )
+        complete_upload_mock = mocker.patch("pcluster.aws.s3.S3Client.complete_multipart_upload")
+        abort_upload_mock = mocker.patch("pcluster.aws.s3.S3Client.abort_multipart_upload")
+
+        with open_logs_archive("archive-name", bucket="bucket", bucket_prefix=bucket_prefix) as archive:
+            archive.add_bytes("file1", b"content1")
+
+        assert_that(archive.location).is_equal_to(f"s3://bucket/{expected_key}")
+        create_upload_mock.assert_called_with("bucket", expected_key)
+        assert_that(all(len(part) == 10 for part in uploaded_parts[:-1])).is_true()
+        assert_that(len(uploaded_parts[-1])).is_less_than_or_equal_to(10)
+        complete_upload_mock.assert_called_with(
+            "bucket",
+            expected_key,
+            "upload-id",
+            [{"ETag": f"etag-{index}", "PartNumber": index} for index in range(1, upload_part_mock.call_count + 1)],
+        )
+        abort_upload_mock.assert_not_called()
+        assert_that(_read_archive(BytesIO(b"".join(uploaded_parts)))).is_equal_to({"archive-name/file1": b"content1"})
+
+    @pytest.mark.parametrize("part_uploaded", [True, False])
+    def test_open_logs_archive_to_s3_failure(self, mocker, part_uploaded):
+        mock_aws_api(mocker)
+        mocker.patch("pcluster.models.common.LOGS_ARCHIVE_UPLOAD_PART_SIZE", 10)
+        create_upload_mock = mocker.patch("pcluster.aws.s3.S3Client.create_multipart_upload", return_value="upload-id")
+        mocker.patch("pcluster.aws.s3.S3Client.upload_part", return_value="etag")
+        complete_upload_mock = mocker.patch("pcluster.aws.s3.S3Client.complete_multipart_upload")
+        abort_upload_mock = mocker.patch("pcluster.aws.s3.S3Client.abort_multipart_upload")
+
+        with pytest.raises(LogsExporterError):
+            with open_logs_archive("archive-name", bucket="bucket") as archive:
+                if part_uploaded:
+                    archive.add_bytes("file1", os.urandom(1024 * 1024))
+                raise LogsExporterError("error")
+
+        complete_upload_mock.assert_not_called()
+        if part_uploaded:
+            abort_upload_mock.assert_called_with("bucket", "archive-name.tar.gz", "upload-id")
+        else:
+            # The multipart upload is created only when the first part is uploaded
+            create_upload_mock.assert_not_called()
+            abort_upload_mock.assert_not_called()
@@ -10,6 +10,7 @@
 # limitations under the License.
 import datetime
 import json
+from unittest.mock import ANY
 from urllib.error import URLError
 
 import pytest
@@ -538,6 +539,7 @@ class TestImageBuilder:
             (True, True, "", {"output_file": "path"}),
             (True, False, "", {"bucket_prefix": "test_prefix"}),
             (True, True, "", {"bucket_prefix": "test_prefix"}),
+            (True, True, "", {"direct_export": True}),
         ],
     )
     def test_export_logs(
@@ -555,8 +557,8 @@ class TestImageBuilder:
         )
         mocker.patch("pcluster.aws.logs.LogsClient.log_group_exists", return_value=log_group_exists)
         download_stack_events_mock = mocker.patch("pcluster.models.imagebuilder.export_stack_events")
-        create_logs_archive_mock = mocker.patch("pcluster.models.imagebuilder.create_logs_archive")
-        upload_archive_mock = mocker.patch("pcluster.models.imagebuilder.upload_archive")
+        check_logs_bucket_mock = mocker.patch("pcluster.models.imagebuilder.check_logs_bucket")
+        open_logs_archive_mock = mocker.patch("pcluster.models.imagebuilder.open_logs_archive")
         presign_mock = mocker.patch("pcluster.models.imagebuilder.create_s3_presigned_url")
 
         # Following mocks are used only if CW loggins is enabled
@@ -565,6 +567,9 @@ class TestImageBuilder:
             return_value=_MockExportImageLogsFiltersParser(),
         )
         cw_logs_exporter_mock = mocker.patch("pcluster.models.imagebuilder.CloudWatchLogsExporter", autospec=True)
+        cw_log_streams_exporter_mock = mocker.patch(
+            "pcluster.models.imagebuilder.CloudWatchLogStreamsExporter", autospec=True
+        )
 
         kwargs.update({"bucket": "bucket_name"})
         if expected_error:
@@ -579,15 +584,27 @@ class TestImageBuilder:
                 download_stack_events_mock.assert_not_called()
 
             if log_group_exists:
-                cw_logs_exporter_mock.assert_called()
+                used_exporter_mock, unused_exporter_mock = (
+                    (cw_log_streams_exporter_mock, cw_logs_exporter_mock)
+                    if kwargs.get("direct_export")
+                    else (cw_logs_exporter_mock, cw_log_streams_exporter_mock)
+                )
+                used_exporter_mock.assert_called()
+                unused_exporter_mock.assert_not_called()
                 logs_filter_mock.assert_called()
             else:
                 cw_logs_exporter_mock.assert_not_called()
+                cw_log_streams_exporter_mock.assert_not_called()
                 logs_filter_mock.assert_not_called()
-            create_logs_archive_mock.assert_called()
+            open_logs_archive_mock.assert_called_with(
+                ANY, kwargs.get("output_file"), "bucket_name", kwargs.get("bucket_prefix")
+            )
+            if "output_file" in kwargs and (kwargs.get("direct_export") or not log_group_exists):
+                check_logs_bucket_mock.assert_not_called()
+            else:
+                check_logs_bucket_mock.assert_called_with("bucket_name", image_builder.image_id)
 
         if "output_file" not in kwargs:
-            upload_archive_mock.assert_called()
             presign_mock.assert_called()
 
     @pytest.mark.parametrize(
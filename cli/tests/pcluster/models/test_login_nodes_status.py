@@ -1,6 +1,7 @@
 import pytest
 from assertpy import assert_that
 
+from pcluster.aws.common import AWSClientError
 from pcluster.models.login_nodes_status import LoginNodesPoolState, LoginNodesStatus
 
 
@@ -128,6 +129,15 @@ class TestLoginNodesStatus:
         },
     ]
 
+    @pytest.fixture(autouse=True)
+    def stack_resources_not_available(self, mocker):
+        # By default the load balancers are not resolved from the stack and all the load balancers are scanned
+        mocker.patch("pcluster.aws.cfn.CfnClient.__init__", return_value=None)
+        return mocker.patch(
+            "pcluster.aws.cfn.CfnClient.list_stack_resources",
+            side_effect=AWSClientError("list_stack_resources", "Access denied"),
+        )
+
     def test_full_login_nodes_status(self, mocker):
         mocker.patch("pcluster.aws.elb.ElbClient.__init__", return_value=None)
         mocker.patch(
@@ -276,3 +286,75 @@ class TestLoginNodesStatus:
 
         assert_that(pool_1_status.get_status()).is_equal_to(expected_status)
         assert_that(pool_2_status.get_status()).is_equal_to(expected_status)
+
+    @pytest.mark.parametrize(
+        "login_nodes_stack_available, stack_load_balancer_arns, expected_scan",
+        [
+            pytest.param(True, ["dummy_load_balancer_arn_1", "dummy_load_balancer_arn_2"], False, id="found"),
+            pytest.param(False, [], True, id="nested stack not found"),
+            pytest.param(True, ["dummy_load_balancer_arn_1"], True, id="load balancer of a pool not found"),
+        ],
+    )
+    def test_load_balancers_resolved_from_stack(
+        self, mocker, login_nodes_stack_available, stack_load_balancer_arns, expected_scan
+    ):
+        login_nodes_stack_arn = "arn:aws:cloudformation:us-east-1:123:stack/dummy_cluster_name-LoginNodes/123"
+        stacks_resources = {
+            self.dummy_stack_name: [
+                {
+                    "LogicalResourceId": "QueuesNestedStackQueuesNestedStackResource12345678",
+                    "ResourceType": "AWS::CloudFormation::Stack",
+                    "PhysicalResourceId": "arn:aws:cloudformation:us-east-1:123:stack/dummy_cluster_name-Queues/123",
+                },
+            ],
+            login_nodes_stack_arn: [
+                {
+                    "LogicalResourceId": f"LoadBalancer{index}1234ABCD",
+                    "ResourceType": "AWS::ElasticLoadBalancingV2::LoadBalancer",
+                    "PhysicalResourceId": load_balancer_arn,
+                }
+                for index, load_balancer_arn in enumerate(stack_load_balancer_arns)
+            ],
+        }
+        if login_nodes_stack_available:
+            stacks_resources[self.dummy_stack_name].append(
+                {
+                    "LogicalResourceId": "LoginNodesNestedStackLoginNodesNestedStackResource12345678",
+                    "ResourceType": "AWS::CloudFormation::Stack",
+                    "PhysicalResourceId": login_nodes_stack_arn,
+                }
+            )
+        mocker.patch("pcluster.aws.cfn.CfnClient.list_stack_resources", side_effect=stacks_resources.get)
+        mocker.patch("pcluster.aws.elb.ElbClient.__init__", return_value=None)
+        all_load_balancers = [self.dummy_load_balancer_1, self.dummy_load_balancer_2, self.dummy_load_balancer_3]
+        list_load_balancers_mock = mocker.patch(
+            "pcluster.aws.elb.ElbClient.list_load_balancers", return_value=all_load_balancers
+        )
+        describe_load_balancers_mock = mocker.patch(
+            "pcluster.aws.elb.ElbClient.describe_load_balancers",
+            side_effect=lambda arns: [lb for lb in all_load_balancers if lb["LoadBalancerArn"] in arns],
+        )
+        describe_tags_mock = mocker.patch(
+            "pcluster.aws.elb.ElbClient.describe_tags",
+            side_effect=lambda arns: [tags for tags in self.dummy_tags_description if tags["ResourceArn"] in arns],
+        )
+        mocker.patch("pcluster.aws.elb.ElbClient.describe_target_groups", return_value=self.dummy_target_groups)
+        mocker.patch("pcluster.aws.elb.ElbClient.describe_target_health", return_value=self.dummy_targets_health)
+
+        login_nodes_status = LoginNodesStatus(self.dummy_stack_name)
+        login_nodes_status.retrieve_data([self.dummy_pool_name_1, self.dummy_pool_name_2])
+
+        for pool_name, dns_name in [
+            (self.dummy_pool_name_1, self.dummy_dns_name_1),
+            (self.dummy_pool_name_2, self.dummy_dns_name_2),
+        ]:
+            pool_status = login_nodes_status.get_pool_status_dict().get(pool_name)
+            assert_that(pool_status.get_status()).is_equal_to(LoginNodesPoolState.ACTIVE)
+            assert_that(pool_status.get_address()).is_equal_to(dns_name)
+        if expected_scan:
+            list_load_balancers_mock.assert_called_once()
+        else:
+            # The load balancers of all the pools are described and their tags retrieved in a single pass
+            list_load_balancers_mock.assert_not_called()
+            describe_load_balancers_mock.assert_called_once_with(stack_load_balancer_arns)
+            describe_tags_mock.assert_called_once_with(stack_load_balancer_arns)
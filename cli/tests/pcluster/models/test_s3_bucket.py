@@ -8,6 +8,7 @@
 # or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
 # OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import json
 import os
 import textwrap
@@ -224,15 +225,13 @@ def test_get_resource_url(region, bucket_name, cluster_name, resource_name, expe
                 "B": {"B1": "M"},
             },
             S3FileFormat.YAML,
-            textwrap.dedent(
-                """\
+            textwrap.dedent("""\
                 A:
                   A1: X
                   A2: Y
                 B:
                   B1: M
-                """
-            ),
+                """),
         ),
         (
             {
@@ -306,6 +305,45 @@ def test_upload_file(mocker, content, file_name, file_type, s3_file_format, expe
     )
 
 
+def test_upload_resources(mocker, tmpdir):
+    mock_aws_api(mocker)
+    mock_bucket(mocker)
+
+    resource_dir = tmpdir.mkdir("resources")
+    resource_dir.join("artifact").write("artifact content")
+    code_dir = resource_dir.mkdir("code")
+    for file_name in ["b.py", "a.py"]:
+        code_dir.join(file_name).write(f"# {file_name}")
+    bucket = dummy_cluster_bucket(bucket_name="test-bucket", artifact_directory="artifact_dir")
+    put_object_patch = mocker.patch("pcluster.aws.s3.S3Client.put_object")
+    head_object_patch = mocker.patch(
+        "pcluster.aws.s3.S3Client.head_object", side_effect=AWSClientError("head_object", "Not Found", 404)
+    )
+
+    bucket.upload_resources(str(resource_dir), "artifacts.zip")
+
+    uploaded_objects = {call.kwargs["key"]: call.kwargs["body"] for call in put_object_patch.call_args_list}
+    assert_that(uploaded_objects).contains_only(
+        "artifact_dir/custom_resources/artifact", "artifact_dir/custom_resources/artifacts.zip"
+    )
+    assert_that(uploaded_objects["artifact_dir/custom_resources/artifact"]).is_equal_to(b"artifact content")
+
+    # Uploads are skipped when the objects in the bucket have the same content, the archive being deterministic
+    put_object_patch.reset_mock()
+    head_object_patch.side_effect = lambda bucket_name, object_name: {
+        "ETag": f'"{hashlib.md5(uploaded_objects[object_name]).hexdigest()}"'  # nosec B324
+    }
+    bucket.upload_resources(str(resource_dir), "artifacts.zip")
+    put_object_patch.assert_not_called()
+
+    # Only the changed resources are uploaded
+    code_dir.join("a.py").write("# changed")
+    bucket.upload_resources(str(resource_dir), "artifacts.zip")
+    assert_that([call.kwargs["key"] for call in put_object_patch.call_args_list]).is_equal_to(
+        ["artifact_dir/custom_resources/artifacts.zip"]
+    )
+
+
 def test_get_bucket_policy_for_cloudwatch_logs(mocker):
     mock_aws_api(mocker)
     mock_bucket(mocker)
@@ -10,7 +10,10 @@
 # limitations under the License.
 # This module provides unit tests for the functions in the pcluster.utils module."""
 import asyncio
+import itertools
+import logging
 import os
+import threading
 import time
 import unittest
 from collections import namedtuple
@@ -23,7 +26,7 @@ import pcluster.aws.common
 import pcluster.utils as utils
 from pcluster.aws.aws_api import AWSApi
 from pcluster.aws.aws_resources import InstanceTypeInfo
-from pcluster.aws.common import Cache
+from pcluster.aws.common import Boto3Client, Cache, CacheScope, PersistentCache
 from pcluster.constants import Feature
 from pcluster.models.cluster import Cluster, ClusterStack
 from pcluster.utils import batch_by_property_callback, yaml_load
@@ -126,6 +129,7 @@ class TestCache:
     @pytest.fixture(autouse=True)
     def clear_cache(self):
         pcluster.aws.common.Cache.clear_all()
+        pcluster.aws.common.Cache.reset_stats()
 
     @pytest.fixture(autouse=True)
     def clear_invocations(self):
@@ -178,6 +182,167 @@ class TestCache:
 
         assert_that(self.invocations).is_length(4)
 
+    @staticmethod
+    @Cache.cached(max_entries=2, ttl=60)
+    def _bounded_method(arg1):
+        TestCache.invocations.append(arg1)
+        return arg1
+
+    def test_lru_eviction(self):
+        for arg in [1, 2, 1, 3, 1, 2]:
+            assert_that(self._bounded_method(arg)).is_equal_to(arg)
+
+        # 2 is the least recently used entry when 3 is stored, then 3 is evicted when 2 is stored again
+        assert_that(self.invocations).is_equal_to([1, 2, 3, 2])
+        assert_that(self._bounded_method.cache.stats()).is_equal_to({"hits": 2, "misses": 4, "evictions": 2, "size": 2})
+
+    def test_ttl(self, mocker):
+        time_mock = mocker.patch("pcluster.aws.common.time.time", return_value=1000)
+        self._bounded_method(1)
+        time_mock.return_value = 1059
+        self._bounded_method(1)
+        time_mock.return_value = 1061
+        self._bounded_method(1)
+
+        assert_that(self.invocations).is_equal_to([1, 1])
+
+    def test_mutexes_are_released(self):
+        for arg in range(0, 10):
+            self._cached_method_1(arg, arg)
+
+        assert_that(self._cached_method_1.cache._mutexes).is_empty()
+
+    def test_stats(self, caplog):
+        caplog.set_level(logging.INFO, logger="pcluster")
+        self._bounded_method(1)
+        self._bounded_method(1)
+
+        assert_that(Cache.get_stats()).contains_entry(
+            {"TestCache._bounded_method": {"hits": 1, "misses": 1, "evictions": 0, "size": 1}}
+        )
+        Cache.log_stats(level=logging.INFO)
+        assert_that(caplog.text).contains("TestCache._bounded_method(hits=1, misses=1, evictions=0, size=1)")
+
+    class _FakeClient(Boto3Client):
+        def __init__(self):
+            """Override Parent constructor. No real boto3 client is created."""
+            pass
+
+        @Cache.cached
+        def describe_stack(self, arg1):
+            TestCache.invocations.append(("stack", arg1))
+            return arg1
+
+        @Cache.cached(ttl=60, scope=CacheScope.PROCESS)
+        def describe_instance_type(self, arg1):
+            TestCache.invocations.append(("instance_type", arg1))
+            return arg1
+
+    def test_scopes(self, set_env):
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        client = self._FakeClient()
+        for _ in range(0, 2):
+            client.describe_stack(1)
+            client.describe_instance_type(1)
+        # Process scoped entries are shared by the clients of the same region
+        self._FakeClient().describe_instance_type(1)
+        assert_that(self.invocations).is_equal_to([("stack", 1), ("instance_type", 1)])
+
+        # Simulate a new API request
+        Cache.clear_all(scope=CacheScope.REQUEST)
+        client.describe_stack(1)
+        self._FakeClient().describe_instance_type(1)
+        assert_that(self.invocations).is_equal_to([("stack", 1), ("instance_type", 1), ("stack", 1)])
+
+        set_env("AWS_DEFAULT_REGION", "eu-west-1")
+        self._FakeClient().describe_instance_type(1)
+        Cache.clear_all()
+        set_env("AWS_DEFAULT_REGION", "us-east-1")
+        self._FakeClient().describe_instance_type(1)
+        assert_that(self.invocations[3:]).is_equal_to([("instance_type", 1), ("instance_type", 1)])
+
+
+class TestPersistentCache:
+    invocations = []
+
+    @pytest.fixture(autouse=True)
+    def persistent_cache(self, mocker, tmpdir, set_env):
+        set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "true")
+        set_env("PCLUSTER_PERSISTENT_CACHE_DIR", str(tmpdir))
+        mocker.patch(
+            "pcluster.aws.common._get_persistent_cache_scope", return_value=(FAKE_VERSION, "us-east-1", "123456789012")
+        )
+        Cache.clear_all()
+        del self.invocations[:]
+        yield
+        PersistentCache.reset()
+
+    @staticmethod
+    @Cache.cached(persistent_ttl=60)
+    def _persisted_method(arg1, arg2=None):
+        TestPersistentCache.invocations.append((arg1, arg2))
+        return {"args": [arg1, arg2]}
+
+    def test_results_survive_in_memory_cache_reset(self):
+        for _ in range(0, 2):
+            assert_that(self._persisted_method(1, arg2="a")).is_equal_to({"args": [1, "a"]})
+            assert_that(self._persisted_method(2)).is_equal_to({"args": [2, None]})
+            # Simulate a new CLI invocation
+            Cache.clear_all()
+            PersistentCache.reset()
+
+        assert_that(self.invocations).is_length(2)
+
+    def test_scope_is_part_of_the_key(self, mocker):
+        self._persisted_method(1)
+        Cache.clear_all()
+        mocker.patch(
+            "pcluster.aws.common._get_persistent_cache_scope", return_value=(FAKE_VERSION, "eu-west-1", "123456789012")
+        )
+        self._persisted_method(1)
+
+        assert_that(self.invocations).is_length(2)
+
+    def test_expired_entries(self, mocker):
+        time_mock = mocker.patch("pcluster.aws.common.time.time", return_value=1000)
+        self._persisted_method(1)
+        Cache.clear_all()
+        time_mock.return_value = 1059
+        self._persisted_method(1)
+        Cache.clear_all()
+        time_mock.return_value = 1061
+        self._persisted_method(1)
+
+        assert_that(self.invocations).is_length(2)
+
+    def test_lru_eviction(self, mocker, set_env):
+        set_env("PCLUSTER_PERSISTENT_CACHE_MAX_ENTRIES", "2")
+        mocker.patch("pcluster.aws.common.time.time", side_effect=itertools.count(1000))
+        for arg in [1, 2, 1, 3]:
+            self._persisted_method(arg)
+            Cache.clear_all()
+        # 2 is the least recently used entry and has been evicted when 3 was stored
+        self._persisted_method(1)
+        self._persisted_method(2)
+
+        assert_that(self.invocations).is_equal_to([(1, None), (2, None), (3, None), (2, None)])
+
+    def test_not_serializable_arguments_are_not_persisted(self):
+        argument = object()
+        self._persisted_method(argument)
+        Cache.clear_all()
+        self._persisted_method(argument)
+
+        assert_that(self.invocations).is_length(2)
+
+    def test_disabled(self, set_env):
+        set_env("PCLUSTER_PERSISTENT_CACHE_ENABLED", "false")
+        self._persisted_method(1)
+        Cache.clear_all()
+        self._persisted_method(1)
+
+        assert_that(self.invocations).is_length(2)
+
 
 def test_init_from_instance_type(mocker, caplog):
     mock_aws_api(mocker, mock_instance_type_info=False)
@@ -539,6 +704,78 @@ def test_batch_by_property_size(items, expected_batches, batch_size, raises):
         assert_that(batches).is_equal_to(expected_batches)
 
 
+class TestWaitUntil:
+    @pytest.fixture(autouse=True)
+    def fake_clock(self, mocker):
+        clock = {"now": 0.0}
+        sleep_mock = mocker.patch(
+            "pcluster.utils.time.sleep", side_effect=lambda seconds: clock.update(now=clock["now"] + seconds)
+        )
+        mocker.patch("pcluster.utils.time.monotonic", side_effect=lambda: clock["now"])
+        return sleep_mock
+
+    def test_backoff(self, mocker, fake_clock):
+        mocker.patch("pcluster.utils.random.random", return_value=0)
+        states = iter(["PENDING", "PENDING", "PENDING", "PENDING", "PENDING", "DONE"])
+        polled_states = []
+
+        state = utils.wait_until(
+            poll=lambda: next(states),
+            is_done=lambda state: state == "DONE",
+            initial_delay=1,
+            max_delay=5,
+            on_poll=polled_states.append,
+        )
+
+        assert_that(state).is_equal_to("DONE")
+        assert_that(polled_states).is_equal_to(["PENDING"] * 5 + ["DONE"])
+        assert_that([call.args[0] for call in fake_clock.call_args_list]).is_equal_to([1, 2, 4, 5, 5])
+
+    def test_jitter(self, mocker, fake_clock):
+        mocker.patch("pcluster.utils.random.random", return_value=1)
+        states = iter([False, False, True])
+
+        utils.wait_until(poll=lambda: next(states), is_done=bool, initial_delay=4, jitter=0.5)
+
+        assert_that([call.args[0] for call in fake_clock.call_args_list]).is_equal_to([2, 4])
+
+    def test_no_wait_when_done(self, fake_clock):
+        assert_that(utils.wait_until(poll=lambda: "DONE", is_done=lambda state: state == "DONE")).is_equal_to("DONE")
+        fake_clock.assert_not_called()
+
+    def test_timeout(self, mocker, fake_clock):
+        mocker.patch("pcluster.utils.random.random", return_value=0)
+        poll = mocker.MagicMock(return_value="PENDING")
+
+        with pytest.raises(TimeoutError, match="Timeout expired while waiting for the task"):
+            utils.wait_until(
+                poll=poll, is_done=lambda state: state == "DONE", initial_delay=4, timeout=10, description="the task"
+            )
+
+        # The last sleep is shortened to the deadline, then the state is checked one last time
+        assert_that([call.args[0] for call in fake_clock.call_args_list]).is_equal_to([4, 6])
+        assert_that(poll.call_count).is_equal_to(3)
+
+
+def test_execute_concurrently():
+    release = threading.Event()
+
+    def _fail():
+        raise ValueError("failure")
+
+    futures = utils.execute_concurrently(
+        {"fast": lambda: "result", "failing": _fail, "slow": lambda: release.wait(5)}, timeout=0.5
+    )
+    # The execution exceeding the timeout is returned before it completes, and does not prevent the process from exiting
+    assert_that(futures["slow"].done()).is_false()
+    concurrent_threads = [thread for thread in threading.enumerate() if thread.name.startswith("pcluster-concurrent")]
+    assert_that(concurrent_threads).is_not_empty()
+    assert_that([thread.daemon for thread in concurrent_threads]).does_not_contain(False)
+    release.set()
+    assert_that(futures["fast"].result()).is_equal_to("result")
+    assert_that(futures["failing"].exception()).is_instance_of(ValueError)
+
+
 class TestAsyncUtils(unittest.TestCase):
     def test_async_timeout_cache(self):
         total_calls = 0
@@ -10,6 +10,7 @@
 # limitations under the License.
 from unittest.mock import PropertyMock, call
 
+import pytest
 from assertpy import assert_that
 
 from pcluster.aws.aws_resources import ImageInfo
@@ -37,6 +38,12 @@ from pcluster.validators.common import AsyncValidator, Validator, ValidatorConte
 from tests.pcluster.aws.dummy_aws_api import mock_aws_api
 
 
+@pytest.fixture(autouse=True)
+def serial_validation(monkeypatch):
+    # Some assertions rely on the order in which validators are called
+    monkeypatch.setenv("PCLUSTER_VALIDATION_MAX_WORKERS", "1")
+
+
 def _is_validator_of_type(cls, name, validator_type):
     return (
         isinstance(cls, type)
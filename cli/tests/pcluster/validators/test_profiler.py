@@ -0,0 +1,126 @@
+# Copyright 2025 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License"). You may not use this file except in compliance
+# with the License. A copy of the License is located at
+#
+# http://aws.amazon.com/apache2.0/
+#
+# or in the "LICENSE.txt" file accompanying this file. This file is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES
+# OR CONDITIONS OF ANY KIND, express or implied. See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+
+import pytest
+from assertpy import assert_that
+
+from pcluster.aws.common import Cache, _record_aws_call
+from pcluster.config.common import Resource
+from pcluster.utils import AsyncUtils
+from pcluster.validators.common import AsyncValidator, FailureLevel, Validator, ValidatorContext
+from pcluster.validators.profiler import ValidationProfiler
+
+
+@Cache.cached
+def _describe_fake_resource(resource_id):
+    _record_aws_call()
+    return resource_id
+
+
+class _FakeClient:
+    @AsyncUtils.async_from_sync
+    def describe(self, resource_id):
+        _record_aws_call()
+        return resource_id
+
+
+class FakeDescribeValidator(Validator):
+    """Dummy validator describing a fake resource."""
+
+    def _validate(self, resource_id):
+        _describe_fake_resource(resource_id)
+        self._add_failure(f"Described {resource_id}.", FailureLevel.INFO)
+
+
+class FakeAsyncDescribeValidator(AsyncValidator):
+    """Dummy async validator describing a fake resource through a sync client."""
+
+    async def _validate_async(self, resource_id):
+        await _FakeClient().describe(resource_id)
+
+
+class FakeQueue(Resource):
+    """Fake queue resource."""
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+
+    def _register_validators(self, context: ValidatorContext = None):
+        self._register_validator(FakeDescribeValidator, resource_id="shared-resource")
+
+
+class FakeCluster(Resource):
+    """Fake cluster resource."""
+
+    def __init__(self):
+        super().__init__()
+        self.queues = [FakeQueue("queue1"), FakeQueue("queue2")]
+
+    def _register_validators(self, context: ValidatorContext = None):
+        self._register_validator(FakeAsyncDescribeValidator, resource_id="cluster-resource")
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    Cache.clear_all()
+
+
+@pytest.mark.parametrize("profile", [None, "false"])
+def test_profiling_disabled(set_env, unset_env, capsys, profile):
+    if profile:
+        set_env("PCLUSTER_VALIDATION_PROFILE", profile)
+    else:
+        unset_env("PCLUSTER_VALIDATION_PROFILE")
+
+    assert_that(ValidationProfiler.from_environment()).is_none()
+    assert_that(FakeCluster().validate()).is_length(2)
+    assert_that(capsys.readouterr().err).is_empty()
+
+
+def test_profiling_json_report(set_env, capsys):
+    set_env("PCLUSTER_VALIDATION_PROFILE", "json")
+    # Serial execution to make deterministic which validator populates the cache
+    set_env("PCLUSTER_VALIDATION_MAX_WORKERS", "1")
+
+    assert_that(FakeCluster().validate()).is_length(2)
+
+    report = json.loads(capsys.readouterr().err)
+    validators = {entry.pop("validator"): entry for entry in report["validators"]}
+    resources = {entry.pop("resource"): entry for entry in report["resources"]}
+    for entry in [*validators.values(), *resources.values()]:
+        assert_that(entry.pop("wallTime")).is_greater_than_or_equal_to(0)
+
+    assert_that(validators).is_equal_to(
+        {
+            "FakeDescribeValidator": {"executions": 2, "awsCalls": 1, "cacheHits": 1},
+            "FakeAsyncDescribeValidator": {"executions": 1, "awsCalls": 1, "cacheHits": 0},
+        }
+    )
+    assert_that(resources).is_equal_to(
+        {
+            "FakeCluster.queues[queue1]": {"executions": 1, "awsCalls": 1, "cacheHits": 0},
+            "FakeCluster.queues[queue2]": {"executions": 1, "awsCalls": 0, "cacheHits": 1},
+            "FakeCluster": {"executions": 1, "awsCalls": 1, "cacheHits": 0},
+        }
+    )
+
+
+def test_profiling_table_report(set_env, capsys):
+    set_env("PCLUSTER_VALIDATION_PROFILE", "table")
+
+    FakeCluster().validate()
+
+    report = capsys.readouterr().err
+    assert_that(report).starts_with("Validation completed in ")
+    assert_that(report).contains("Validator", "Resource", "Wall time (s)", "AWS calls", "Cache hits")
+    assert_that(report).contains("FakeDescribeValidator", "FakeAsyncDescribeValidator", "FakeCluster.queues[queue2]")
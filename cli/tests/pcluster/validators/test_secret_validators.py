@@ -141,7 +141,7 @@ def test_munge_key_secret_arn_validator(
     mocker,
 ):
     # Setting up the mock of secretsmanager
-    mocker.patch("boto3.client")
+    mocker.patch("boto3.session.Session.client")
 
     if error_from_aws_service:
         mocker.patch(